@@ -9,10 +9,6 @@ import click
 import rich.logging
 from rich import traceback
 
-from cookietemple.bump_version.bump_version import VersionBumper
-from cookietemple.common.load_yaml import load_yaml_file
-from cookietemple.config.config import ConfigCommand
-from cookietemple.create.create import choose_domain
 from cookietemple.custom_cli.click import (
     CustomArg,
     CustomHelpSubcommand,
@@ -20,14 +16,11 @@ from cookietemple.custom_cli.click import (
     print_cookietemple_version,
     print_project_version,
 )
-from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
-from cookietemple.info.info import TemplateInfo
-from cookietemple.lint.lint import lint_project
-from cookietemple.list.list import TemplateLister
-from cookietemple.sync.sync import TemplateSync
-from cookietemple.upgrade.upgrade import UpgradeCommand
+from cookietemple.util.profiler import profiler
 from cookietemple.util.rich import console
-from cookietemple.warp.warp import warp_project
+
+# Subcommands import their implementation only when they are invoked.
+# This keeps heavy dependencies like GitPython, PyGithub or cookiecutter out of the startup of every other command.
 
 WD = os.path.dirname(__file__)
 log = logging.getLogger()
@@ -47,10 +40,14 @@ def main():
 
     console.print("[bold blue]Run [green]cookietemple --help [blue]for an overview of all commands\n")
 
-    # Is the latest cookietemple version installed? Upgrade if not!
-    if not UpgradeCommand.check_cookietemple_latest():
-        console.print("[bold blue]Run [green]cookietemple upgrade [blue]to get the latest version.")
-    cookietemple_cli()
+    # Is the latest cookietemple version installed? Checked in the background, so the command is never delayed
+    from cookietemple.upgrade.upgrade import UpgradeCommand
+
+    upgrade_check = UpgradeCommand.start_startup_check()
+    try:
+        cookietemple_cli()
+    finally:
+        UpgradeCommand.finish_startup_check(upgrade_check)
 
 
 @click.group(cls=HelpErrorHandling)
@@ -64,8 +61,14 @@ def main():
 )
 @click.option("-v", "--verbose", is_flag=True, default=False, help="Enable verbose output (print debug statements).")
 @click.option("-l", "--log-file", help="Save a verbose log to a file.")
+@click.option("--profile", is_flag=True, default=False, help="Print the time the major phases of the command took.")
+@click.option(
+    "--profile-trace",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Save the timed phases of the command as a Chrome trace file (implies --profile).",
+)
 @click.pass_context
-def cookietemple_cli(ctx, verbose, log_file):
+def cookietemple_cli(ctx, verbose, log_file, profile, profile_trace):
     """
     Create state of the art projects from production ready templates.
     """
@@ -89,15 +92,32 @@ def cookietemple_cli(ctx, verbose, log_file):
         log_fh.setFormatter(logging.Formatter("[%(asctime)s] %(name)-20s [%(levelname)-7s]  %(message)s"))
         log.addHandler(log_fh)
 
+    # Record timed spans of the command's phases and report them once the command finished
+    if profile or profile_trace:
+        profiler.enable()
+        ctx.call_on_close(profiler.print_spans)
+        if profile_trace:
+            ctx.call_on_close(lambda: profiler.dump(profile_trace))
+        ctx.with_resource(profiler.span(f"cookietemple {ctx.invoked_subcommand}", "command"))
+
 
 @cookietemple_cli.command(short_help="Create a new project using one of our templates.", cls=CustomHelpSubcommand)
 @click.argument("path", type=click.Path(), default=Path.cwd(), helpmsg="Path where the project should be created at.", cls=CustomArg)  # type: ignore
 @click.option(
     "--domain",
-    type=click.Choice(["cli", "lib", "gui", "web", "pub"]),
-    help="The projects domain with currently cli, lib, gui, web and pub supported.",
+    type=str,
+    help="The projects domain with currently cli, lib, gui, web and pub and the domains of external template catalogs supported.",
+)
+@click.option(
+    "--batch",
+    metavar="MANIFEST",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Create all projects of a YAML or CSV manifest without prompting.",
+)
+@click.option(
+    "--jobs", "-j", type=click.IntRange(min=1), default=1, help="Number of processes to create the projects of a batch in."
 )
-def create(path: Path, domain: str) -> None:
+def create(path: Path, domain: str, batch: str, jobs: int) -> None:
     """
     Create a new project using one of our templates.
 
@@ -106,14 +126,36 @@ def create(path: Path, domain: str) -> None:
     Template specific prompts follow. If you do not yet have a cookietemple config file you may be asked to create one first.
     Next, you will be asked whether you want to use cookietemple's Github support create a repository, push your template and enable a few settings.
     After the project has been created it will be linted and you will be notified of any TODOs.
+    With --batch, all projects of a manifest are created at once and a summary of all projects is printed.
     """
+    if batch:
+        from cookietemple.create.batch import create_batch
+
+        create_batch(batch, Path(path), jobs)
+        return
+    from cookietemple.create.create import choose_domain
+
     choose_domain(path, domain, None)
 
 
 @cookietemple_cli.command(short_help="Lint your existing cookietemple project.", cls=CustomHelpSubcommand)
 @click.argument("project_dir", type=click.Path(), default=Path(str(Path.cwd())), helpmsg="Path to projects directory.", cls=CustomArg)  # type: ignore
 @click.option("--skip-external", is_flag=True, help="Only run cookietemple linting and not external linters.")
-def lint(project_dir, skip_external) -> None:
+@click.option(
+    "--jobs", "-j", type=click.IntRange(min=1), default=1, help="Number of processes to run independent lint checks in."
+)
+@click.option("--no-cache", is_flag=True, help="Do not reuse the findings of unchanged files from previous runs, which are cached in the user cache directory.")
+@click.option(
+    "--changed-since", metavar="REF", help="Only check the content of files, which differ from the given git ref."
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["rich", "json", "sarif"]),
+    default="rich",
+    help="Format of the results. json and sarif are printed to stdout, all other output to stderr.",
+)
+def lint(project_dir, skip_external, jobs, no_cache, changed_since, output_format) -> None:
     """
     Lint your existing cookietemple project.
 
@@ -123,11 +165,27 @@ def lint(project_dir, skip_external) -> None:
     Afterwards, template specific linting is invoked. cli-python for example may check for the existence of a setup.py file.
     Both results are collected and displayed.
     """
-    lint_project(project_dir, skip_external)
+    from cookietemple.lint.lint import lint_project
+
+    lint_project(
+        project_dir,
+        skip_external,
+        jobs=jobs,
+        use_cache=not no_cache,
+        changed_since=changed_since,
+        output_format=output_format,
+    )
 
 
 @cookietemple_cli.command(short_help="List all available cookietemple templates.", cls=CustomHelpSubcommand)
-def list() -> None:
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "plain", "json"]),
+    default="table",
+    help="Format of the templates. plain prints one tab separated line per template.",
+)
+def list(output_format) -> None:
     """
     List all available cookietemple templates.
 
@@ -135,7 +193,9 @@ def list() -> None:
     The output only consists of a short description for all templates.
     To get a detailed overview of a specific subset of templates use info.
     """
-    template_lister = TemplateLister()
+    from cookietemple.list.list import TemplateLister
+
+    template_lister = TemplateLister(output_format)
     template_lister.list_available_templates()
 
 
@@ -143,8 +203,15 @@ def list() -> None:
     short_help="Get detailed info on a cookietemple template domain or a single template.", cls=CustomHelpSubcommand
 )
 @click.argument("handle", type=str, required=False, helpmsg="Language/domain of templates of interest.", cls=CustomArg)  # type: ignore
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "plain", "json"]),
+    default="table",
+    help="Format of the templates. plain prints one tab separated line per template.",
+)
 @click.pass_context
-def info(ctx, handle: str) -> None:
+def info(ctx, handle: str, output_format) -> None:
     """
     Get detailed info on a cookietemple template domain or a single template.
 
@@ -155,7 +222,9 @@ def info(ctx, handle: str) -> None:
     if not handle:
         HelpErrorHandling.args_not_provided(ctx, "info")
     else:
-        template_info = TemplateInfo()
+        from cookietemple.info.info import TemplateInfo
+
+        template_info = TemplateInfo(output_format)
         template_info.show_info(handle.lower())
 
 
@@ -173,14 +242,37 @@ def info(ctx, handle: str) -> None:
 @click.option(
     "--check-update", "-ch", is_flag=True, help="Check whether a new template version is available for your project."
 )
-def sync(project_dir, set_token, pat, username, check_update) -> None:
+@click.option(
+    "--worktree",
+    is_flag=True,
+    help="Sync the TEMPLATE branch in a temporary git worktree, which leaves the files of your checkout untouched.",
+)
+@click.option(
+    "--fleet",
+    metavar="REPOS",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Sync all projects listed in a file with one project directory per line.",
+)
+@click.option(
+    "--jobs", "-j", type=click.IntRange(min=1), default=1, help="Number of processes to sync the projects of a fleet in."
+)
+def sync(project_dir, set_token, pat, username, check_update, worktree, fleet, jobs) -> None:
     """
     Sync your project with the latest template release.
 
     cookietemple regularly updates its templates.
     To ensure that you have the latest changes you can invoke sync, which submits a pull request to your Github repository (if existing).
     If no repository exists the TEMPLATE branch will be updated and you can merge manually.
+    With --fleet, all projects of a file are synced at once and a summary of all projects is printed.
     """
+    from cookietemple.common.load_yaml import load_yaml_file
+    from cookietemple.sync.sync import TemplateSync
+
+    if fleet:
+        from cookietemple.sync.fleet import sync_fleet
+
+        sync_fleet(fleet, jobs, gh_username=username, token=pat, worktree=worktree)
+        return
     project_dir_path = Path(project_dir).resolve()
     log.debug(f"Set project top level path to given path argument {project_dir_path}")
     # if set_token flag is set, update the sync token value and exit
@@ -211,7 +303,9 @@ def sync(project_dir, set_token, pat, username, check_update) -> None:
         sys.exit(0)
 
     log.debug("Initializing syncer object.")
-    syncer = TemplateSync(new_template_version="", project_dir=project_dir_path, gh_username=username, token=pat)
+    syncer = TemplateSync(
+        new_template_version="", project_dir=project_dir_path, gh_username=username, token=pat, worktree=worktree
+    )
     # check for template version updates
     log.debug("Checking for major/minor or patch version changes in cookietemple templates.")
     (
@@ -298,6 +392,9 @@ def bump_version(ctx, new_version, project_dir, downgrade) -> None:
     Unless the user uses downgrade mode via the -d flag, a downgrade of a version is never allowed. Note that bump-version with the new version
     equals the current version is never allowed, either with or without -d.
     """
+    from cookietemple.bump_version.bump_version import VersionBumper
+    from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+
     if not new_version:
         HelpErrorHandling.args_not_provided(ctx, "bump-version")
     else:
@@ -342,6 +439,8 @@ def warp(input_dir: str, exec: str, output: str) -> None:
     cookietemple bundles Warp (https://github.com/dgiagio/warp), which can be used to create self contained, native executables.
     Currently, cookietemple does not ship any templates, where this may be required.
     """
+    from cookietemple.warp.warp import warp_project
+
     warp_project(input_dir, exec, output)
 
 
@@ -361,6 +460,8 @@ def config(ctx, view: bool, section: str) -> None:
     - pat: set your Github personal access token for Github repository creation
     - all: calls general and pat
     """
+    from cookietemple.config.config import ConfigCommand
+
     if view:
         ConfigCommand.view_current_config()
         sys.exit(0)
@@ -389,6 +490,8 @@ def upgrade() -> None:
     Checks whether the locally installed version of cookietemple is the latest.
     If not pip will be invoked to upgrade cookietemple to the latest version.
     """
+    from cookietemple.upgrade.upgrade import UpgradeCommand
+
     UpgradeCommand.check_upgrade_cookietemple()
 
 
@@ -1,84 +1,160 @@
-from typing import Tuple
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 from cookietemple.common.suggest_similar_commands import SIMILARITY_SUGGEST_FACTOR, SIMILARITY_USE_FACTOR
 
+# the row buffers of levensthein_dist, which are reused by all calculations of a thread
+_rows = threading.local()
 
-def levensthein_dist(input_command: str, candidate: str) -> int:
+
+def levensthein_dist(input_command: str, candidate: str, max_dist: Optional[int] = None) -> int:
     """
     Implement the Levenshtein distance algorithm to determine, in case of a non-existing handle,
     if there is a similar command to suggest.
+    Only two rows of the DP table spanning the shorter string are kept and reused across calls.
+    If max_dist is given, only the band of the DP table within max_dist of its diagonal is computed
+    and the calculation stops as soon as all cells of a row exceed max_dist.
     :param input_command: The non-existing handle the user gave as input
     :param candidate: The (possible similar) alternative command
+    :param max_dist: The maximum distance of interest (optional)
 
-    :return: The similarity between the two strings measured by the levensthein distance
+    :return: The similarity between the two strings measured by the levensthein distance or max_dist + 1, if it exceeds max_dist
     """
-
+    if max_dist is not None and abs(len(input_command) - len(candidate)) > max_dist:
+        return max_dist + 1
     if not input_command or not candidate:
         return max(len(input_command), len(candidate))  # at least one string is empty
 
-    dp_table = [[0 for col in range(len(input_command) + 1)] for row in range(len(candidate) + 1)]
-
-    dp_table[0] = list(range(0, len(input_command) + 1))
-    for i in range(1, len(candidate) + 1):
-        dp_table[i][0] = i
+    # the distance is symmetric, so the rows can always span the shorter string
+    short, long = (input_command, candidate) if len(input_command) <= len(candidate) else (candidate, input_command)
+    bound = len(long) if max_dist is None else max_dist
+    exceeded = bound + 1
+    previous, current = _row_buffers(len(short) + 1)
+    for j in range(len(short) + 1):
+        previous[j] = j if j <= bound else exceeded
 
     # now choose minimum levensthein distance from the three option delete/replace/insert
-    # if chars are the same -> levensthein distance is the same as for those substring without these chars of input_command
-    # and candidate
-
-    for i in range(1, len(candidate) + 1):
-        for j in range(1, len(input_command) + 1):
-            # choose minimum edit distance from delete, replace or insert at current substring
-            if input_command[j - 1] == candidate[i - 1]:
-                dp_table[i][j] = dp_table[i - 1][j - 1]
+    # if chars are the same -> levensthein distance is the same as for those substring without these chars
+    for i in range(1, len(long) + 1):
+        start = max(1, i - bound)
+        end = min(len(short), i + bound)
+        current[start - 1] = i if start == 1 and i <= bound else exceeded
+        row_min = current[start - 1]
+        long_char = long[i - 1]
+        for j in range(start, end + 1):
+            if short[j - 1] == long_char:
+                dist = previous[j - 1]
             else:
-                dp_table[i][j] = min(min(dp_table[i][j - 1], dp_table[i - 1][j - 1]), dp_table[i - 1][j]) + 1
+                dist = min(current[j - 1], previous[j - 1], previous[j]) + 1
+            current[j] = dist if dist <= bound else exceeded
+            if dist < row_min:
+                row_min = dist
+        if end < len(short):
+            current[end + 1] = exceeded
+        if row_min > bound:
+            return exceeded
+        previous, current = current, previous
+
+    return previous[len(short)]
+
 
-    return dp_table[len(candidate)][len(input_command)]
+def _row_buffers(size: int) -> Tuple[List[int], List[int]]:
+    """
+    Get the two row buffers of the current thread, which are only reallocated if they are too small.
+
+    :param size: The required length of the rows
+    :return: The two rows
+    """
+    buffers = getattr(_rows, "buffers", None)
+    if buffers is None or len(buffers[0]) < size:
+        buffers = _rows.buffers = ([0] * size, [0] * size)
+    return buffers
 
 
-def most_similar_command(command: str, command_list: set) -> Tuple[list, str]:
+class SuggestionIndex:
+    """
+    Index of commands for finding the commands most similar to an input.
+    The commands are bucketed by their length, since the Levenshtein distance of two strings is at least the difference of their lengths.
+    Buckets are compared in the order of their length difference using the banded, early exiting levensthein_dist.
+    The distance threshold shrinks to the best distance found so far, so most candidates are rejected after a few characters.
+
+    Attributes:
+        buckets (dict): All commands by their length
+    """
+
+    def __init__(self, commands: Iterable[str]):
+        self.buckets: Dict[int, List[str]] = {}
+        for command in commands:
+            self.buckets.setdefault(len(command), []).append(command)
+
+    def closest_commands(self, command: str, max_dist: int) -> Tuple[List[str], int]:
+        """
+        Find all commands with the smallest levensthein distance to the given command, if it is at most max_dist.
+
+        :param command: The command given by the user
+        :param max_dist: The maximum levensthein distance of a similar command
+        :return: The closest commands and their distance or an empty list and max_dist + 1, if no command is close enough
+        """
+        closest: List[str] = []
+        for length in sorted(self.buckets, key=lambda length: abs(length - len(command))):
+            if abs(length - len(command)) > max_dist:
+                break
+            for candidate in self.buckets[length]:
+                dist = levensthein_dist(command, candidate, max_dist)
+                if dist > max_dist:
+                    continue
+                if closest and dist == max_dist:
+                    closest.append(candidate)
+                else:
+                    closest = [candidate]
+                    max_dist = dist
+
+        return closest, max_dist if closest else max_dist + 1
+
+
+# the indexes of immutable command sets, which are built once per process
+_suggestion_indexes: Dict[FrozenSet[str], SuggestionIndex] = {}
+
+
+def load_suggestion_index(command_list: Union[Iterable[str], SuggestionIndex]) -> SuggestionIndex:
+    """
+    Get the suggestion index of some commands. The index of a frozenset (like all available handles) is only built once.
+
+    :param command_list: The commands or their index
+    :return: The index of the commands
+    """
+    if isinstance(command_list, SuggestionIndex):
+        return command_list
+    if isinstance(command_list, frozenset):
+        index = _suggestion_indexes.get(command_list)
+        if index is None:
+            index = _suggestion_indexes[command_list] = SuggestionIndex(command_list)
+        return index
+    return SuggestionIndex(command_list)
+
+
+def most_similar_command(command: str, command_list: Union[Iterable[str], SuggestionIndex]) -> Tuple[list, str]:
     """
     Determine whether its possible to suggest a similar command.
     The similarity is determined by the levensthein distance and a factor (currently 1/3)
     sets a limit where a similar command is useful to be automatically used. If the difference diff is 1/3 < diff <= 2/3, one
     or more similar commands could be suggested, but not used automatically.
-    :param command_list: The commands that are available by the users specific action
+    :param command_list: The commands that are available by the users specific action (or their SuggestionIndex)
     :param command: The command given by the user
 
     :return: A list of similar command(s) or the empty string if there's none and a string that indicates the action to be taken
     """
-    min_use = 999999  # some random large integer -> we will never have handles that are larger than 1000 character
-    min_suggest = 999999
-    sim_command_use = []
-    sim_command_suggest = []
-
-    # for each valid handle calculate the levensthein distance and if one is found that is a new minimal distance,
-    # replace it and take this handle as the most similar command.
-    for handle in command_list:
-        dist = levensthein_dist(command, handle)
-
-        # the more restrict condition for automatic use
-        lim_use = int(len(command) * SIMILARITY_USE_FACTOR)
-
-        # the weaker condition for command suggestion
-        lim_suggest = int(len(command) * SIMILARITY_SUGGEST_FACTOR)
-
-        # check if the command is close to the inputted command so it can be automatically used
-        if lim_use >= dist:
-            if min_use > dist:  # and min >= dist:
-                min_use = dist
-                sim_command_use = [handle]
-            elif min_use == dist:
-                sim_command_use.append(handle)
-
-        # the input is not very close to any command, but maybe a similar one can be suggested?
-        elif lim_use < dist <= lim_suggest:
-            if min_suggest > dist:  # and min >= dist:
-                min_suggest = dist
-                sim_command_suggest = [handle]
-            elif min_suggest == dist:
-                sim_command_suggest.append(handle)
+    # the more restrict condition for automatic use
+    lim_use = int(len(command) * SIMILARITY_USE_FACTOR)
+
+    # the weaker condition for command suggestion
+    lim_suggest = int(len(command) * SIMILARITY_SUGGEST_FACTOR)
+
+    # the closest handles are automatically used, if they are close enough to the inputted command
+    # or suggested, if they are not very close but within the weaker limit
+    closest, dist = load_suggestion_index(command_list).closest_commands(command, lim_suggest)
+    sim_command_use = closest if dist <= lim_use else []
+    sim_command_suggest = closest if lim_use < dist <= lim_suggest else []
 
     # return the use list, as those are closer, but if its empty, return the list of suggested commands (or if that is empty too, an empty list)
     return (
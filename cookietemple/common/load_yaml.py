@@ -6,10 +6,12 @@ from ruamel.yaml import YAML
 def load_yaml_file(yaml_file_path: str) -> dict:
     """
     Loads a yaml file and returns the content as nested dictionary.
+    Uses the fastest available safe loader (the C based loader of ruamel.yaml.clib, if installed), so the content is for reading only.
+    Files, which are written back and must keep their comments and formatting, have to be loaded with a round-trip YAML() instead.
 
+    :param yaml_file_path: Path to the yaml file
     :return: nested dictionary as the content of the yaml file
     """
     path = Path(yaml_file_path)
-    yaml = YAML()
-    yaml.boolean_representation = ["False", "True"]  # type: ignore
+    yaml = YAML(typ="safe")
     return yaml.load(path)
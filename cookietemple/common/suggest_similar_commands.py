@@ -1,10 +1,6 @@
-import os
-from typing import Set
+from typing import FrozenSet, Optional, Set, Tuple
 
-from cookietemple.common.load_yaml import load_yaml_file
-from cookietemple.util.dict_util import is_nested_dictionary
-
-AVAILABLE_TEMPLATES_PATH = f"{os.path.dirname(__file__)}/../create/templates/available_templates.yml"
+from cookietemple.common.template_registry import AVAILABLE_TEMPLATES_PATH, TemplateRegistry, load_template_registry
 
 # cookietemple's main commands
 MAIN_COMMANDS = ["create", "lint", "list", "info", "bump-version", "sync", "warp", "config", "upgrade"]
@@ -12,40 +8,26 @@ MAIN_COMMANDS = ["create", "lint", "list", "info", "bump-version", "sync", "warp
 SIMILARITY_USE_FACTOR = 1 / 3
 # the fraction relative to the commands length, a given input could differ from the real command to be suggested (if >1/3 of course)
 SIMILARITY_SUGGEST_FACTOR = 2 / 3
+# all available handles of the form (<template registry they were collected from>, <handles>)
+_available_handles: Optional[Tuple[TemplateRegistry, FrozenSet[str]]] = None
 
 
-def load_available_handles() -> set:
+def load_available_handles() -> FrozenSet[str]:
     """
-    Load all available template handles.
+    Load all available template handles. They are only collected again, if available_templates.yml changed.
 
     :return: A set of all available handles
     """
-    available_templates = load_yaml_file(f"{AVAILABLE_TEMPLATES_PATH}")
-    unsplit_handles: Set[str] = set()
-    all_handles: Set[str] = set()
-    nested_dict_to_handle_set(available_templates, unsplit_handles)
-    all_handles.update(unsplit_handles)
-    split_handles(unsplit_handles, all_handles)
-
-    return all_handles
-
-
-def nested_dict_to_handle_set(available_templates, unsplitted_handles: set) -> None:
-    """
-    Extract the handles from loaded yml file.
-
-    :param available_templates: The loaded yml file as a (nested) dict
-    :param unsplitted_handles: The set to save the handles
-    """
-    if is_nested_dictionary(available_templates):
-        for templ in available_templates.values():
-            if not is_nested_dictionary(templ):
-                unsplitted_handles.add(templ["handle"])
-            else:
-                nested_dict_to_handle_set(templ, unsplitted_handles)
-    else:
-        # a single template to append was reached
-        unsplitted_handles.add(available_templates["handle"])
+    global _available_handles
+    registry = load_template_registry(AVAILABLE_TEMPLATES_PATH)
+    if _available_handles is None or _available_handles[0] is not registry:
+        unsplit_handles: Set[str] = set(registry.by_handle)
+        all_handles: Set[str] = set()
+        all_handles.update(unsplit_handles)
+        split_handles(unsplit_handles, all_handles)
+        _available_handles = (registry, frozenset(all_handles))
+
+    return _available_handles[1]
 
 
 def split_handles(unsplitted_handles, all_handles) -> None:
@@ -0,0 +1,244 @@
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+import appdirs  # type: ignore
+
+import cookietemple
+from cookietemple.common.template_registry import AVAILABLE_TEMPLATES_PATH, load_template_registry
+from cookietemple.util.dir_util import user_cache_path
+
+log = logging.getLogger(__name__)
+
+# entry point group, under which installed packages register their template catalogs
+CATALOG_ENTRY_POINT_GROUP = "cookietemple.templates"
+# environment variable with additional catalog directories separated by os.pathsep
+CATALOG_PATH_ENV_VAR = "COOKIETEMPLE_TEMPLATE_PATH"
+# key of the cookietemple config file with a list of additional catalog directories
+CATALOG_CONFIG_KEY = "template_directories"
+# the domains of cookietemple's own templates, which external catalogs cannot extend
+BUILTIN_DOMAINS = ["cli", "lib", "gui", "web", "pub"]
+
+
+class TemplateCatalog:
+    """
+    Templates of external catalogs, which are discovered from additional local directories and installed packages.
+    A catalog is a directory with an available_templates.yml file in the format of cookietemple's own file.
+    Every template may additionally set its cookiecutter directory (path, relative to the catalog and defaults to the handle)
+    and the linter class for its projects (linter, of the form package.module:Class).
+
+    All templates are stored in a persistent index of the form `{<handle>: <template>}` in the user cache directory.
+    The index is only rebuilt, if a catalog file or an installed package changed. Validating it never touches template directories,
+    so the cost does not depend on the number of templates. Template directories are only accessed, once a template is used.
+
+    Attributes:
+        index_file (str): Path to the index file.
+        directories (list): The catalog directories configured by the environment variable and the config file.
+        entry_point_directories (list): The catalog directories registered by installed packages.
+        templates (dict): All external templates by their handle.
+    """
+
+    # increased whenever the format of the index changes
+    INDEX_FORMAT = 1
+
+    def __init__(self, directories: Optional[List[str]] = None):
+        self.index_file = user_cache_path("template_catalog.json")
+        self.directories = self._configured_directories() if directories is None else directories
+        self.entry_point_directories: List[str] = []
+        self.templates: Dict[str, dict] = self._load()
+
+    def get(self, handle: str) -> Optional[dict]:
+        """
+        Get an external template by its handle.
+
+        :param handle: The template handle
+        :return: The template or None, if no external template has this handle
+        """
+        return self.templates.get(handle)
+
+    def domains(self) -> List[str]:
+        """
+        Get all domains of external templates.
+
+        :return: All domains of external templates in the order they were found
+        """
+        return list(dict.fromkeys(handle.split("-")[0] for handle in self.templates))
+
+    def templates_of(self, handle: str) -> List[dict]:
+        """
+        Get all external templates with the given handle or a handle starting with it (e.g. a domain).
+
+        :param handle: A full handle, a domain or a domain and subdomain
+        :return: The matching templates
+        """
+        return [
+            template
+            for template_handle, template in self.templates.items()
+            if template_handle == handle or template_handle.startswith(f"{handle}-")
+        ]
+
+    def _load(self) -> Dict[str, dict]:
+        """
+        Load the index, if it is up to date, and rebuild it otherwise.
+
+        :return: All external templates by their handle
+        """
+        index = self._read_index()
+        if index:
+            self.entry_point_directories = index.get("entry_point_directories", [])
+            if index.get("fingerprint") == self._fingerprint():
+                return index["templates"]
+        log.debug("Rebuilding the template catalog index.")
+        self.entry_point_directories = self._entry_point_directories()
+        templates = self._build()
+        self._write_index(
+            {
+                "fingerprint": self._fingerprint(),
+                "entry_point_directories": self.entry_point_directories,
+                "templates": templates,
+            }
+        )
+        return templates
+
+    def _build(self) -> Dict[str, dict]:
+        """
+        Collect the templates of all catalogs. Catalogs found first win, if handles collide.
+
+        :return: All external templates by their handle
+        """
+        builtin_handles = load_template_registry(AVAILABLE_TEMPLATES_PATH).by_handle
+        templates: Dict[str, dict] = {}
+        for directory in self.directories + self.entry_point_directories:
+            catalog_file = os.path.join(directory, "available_templates.yml")
+            if not os.path.isfile(catalog_file):
+                log.debug(f"Ignoring template catalog {directory} without an available_templates.yml file.")
+                continue
+            for handle, template in load_template_registry(catalog_file).by_handle.items():
+                if handle in builtin_handles or handle in templates or handle.split("-")[0] in BUILTIN_DOMAINS:
+                    log.debug(
+                        f"Ignoring template {handle} of {directory}, since its handle or domain is already taken."
+                    )
+                    continue
+                templates[handle] = {
+                    **template,
+                    "path": os.path.abspath(os.path.join(directory, template.get("path", handle))),
+                    "linter": template.get("linter"),
+                    "catalog": directory,
+                }
+        return templates
+
+    def _fingerprint(self) -> list:
+        """
+        The fingerprint changes, if a catalog file changed or packages were installed or removed (which changes their site directory).
+
+        :return: The fingerprint of all catalogs
+        """
+        fingerprint: list = [cookietemple.__version__, self.INDEX_FORMAT]
+        for directory in self.directories + self.entry_point_directories:
+            try:
+                stat = os.stat(os.path.join(directory, "available_templates.yml"))
+                fingerprint.append([directory, stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                fingerprint.append([directory, None, None])
+        for site_dir in sys.path:
+            # the working directory changes all the time (e.g. by creating projects), packages are not installed into it
+            if not site_dir or os.path.abspath(site_dir) == os.getcwd():
+                continue
+            try:
+                fingerprint.append([site_dir, os.stat(site_dir).st_mtime_ns])
+            except OSError:
+                continue
+        return fingerprint
+
+    @staticmethod
+    def _configured_directories() -> List[str]:
+        """
+        Get the catalog directories configured by the user.
+
+        :return: The catalog directories of the environment variable followed by the ones of the cookietemple config file
+        """
+        directories = [
+            directory for directory in os.environ.get(CATALOG_PATH_ENV_VAR, "").split(os.pathsep) if directory
+        ]
+        # the path of ConfigCommand.CONF_FILE_PATH, importing the config command would slow down linting
+        config_file = f'{appdirs.user_config_dir(appname="cookietemple")}/cookietemple_cfg.yml'
+        if os.path.exists(config_file):
+            from cookietemple.common.load_yaml import load_yaml_file
+
+            directories += (load_yaml_file(config_file) or {}).get(CATALOG_CONFIG_KEY) or []
+        return [os.path.abspath(os.path.expanduser(directory)) for directory in directories]
+
+    @staticmethod
+    def _entry_point_directories() -> List[str]:
+        """
+        Load the catalog directories registered by installed packages. An entry point refers to the package containing the catalog.
+
+        :return: The directories of all registered catalogs
+        """
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # Python 3.7
+            import pkg_resources
+
+            catalog_entry_points = list(pkg_resources.iter_entry_points(CATALOG_ENTRY_POINT_GROUP))
+        else:
+            all_entry_points = entry_points()
+            catalog_entry_points = (
+                list(all_entry_points.select(group=CATALOG_ENTRY_POINT_GROUP))  # type: ignore
+                if hasattr(all_entry_points, "select")
+                else list(all_entry_points.get(CATALOG_ENTRY_POINT_GROUP, []))
+            )
+        directories = []
+        for entry_point in catalog_entry_points:
+            try:
+                catalog = entry_point.load()
+                directories.append(os.path.dirname(os.path.abspath(catalog.__file__)))
+            except Exception as e:
+                log.debug(f"Unable to load template catalog entry point {entry_point.name}: {e}")
+        return directories
+
+    def _read_index(self) -> Optional[dict]:
+        """
+        Read the index file.
+
+        :return: The content of the index file or None, if it does not exist
+        """
+        try:
+            with open(self.index_file) as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _write_index(self, index: dict) -> None:
+        """
+        Write the index file.
+
+        :param index: The content of the index file
+        """
+        try:
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            tmp_file = f"{self.index_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump(index, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            log.debug(f"Unable to write template catalog index {self.index_file}: {e}")
+
+
+# the catalog loaded by this process
+_catalog: Optional[TemplateCatalog] = None
+
+
+def load_template_catalog() -> TemplateCatalog:
+    """
+    Load the catalog of all external templates. It is shared by all callers of this process.
+
+    :return: The catalog
+    """
+    global _catalog
+    if _catalog is None:
+        _catalog = TemplateCatalog()
+    return _catalog
@@ -0,0 +1,36 @@
+import json
+import sys
+from typing import Iterable
+
+# the fields of a template in the order they are printed, the description is either the short or the long description
+TEMPLATE_FIELDS = ["name", "handle", "description", "available libraries", "version"]
+
+
+def stream_templates(templates: Iterable[dict], description: str, output_format: str) -> int:
+    """
+    Write templates to stdout one by one as they are produced, without building any rich renderables.
+    plain writes one tab separated line per template (name, handle, description, available libraries and version).
+    json writes an array of template objects.
+
+    :param templates: The templates to write
+    :param description: The description to write (short description or long description)
+    :param output_format: plain or json
+    :return: The number of written templates
+    """
+    write = sys.stdout.write
+    count = 0
+    if output_format == "json":
+        write("[")
+    for template in templates:
+        values = [str(template[description if field == "description" else field]) for field in TEMPLATE_FIELDS]
+        if output_format == "json":
+            keys = [description if field == "description" else field for field in TEMPLATE_FIELDS]
+            record = {key.replace(" ", "_"): value for key, value in zip(keys, values)}
+            write(f"{',' if count else ''}\n  {json.dumps(record)}")
+        else:
+            write("\t".join(" ".join(value.split()) for value in values) + "\n")
+        count += 1
+    if output_format == "json":
+        write("\n]\n" if count else "]\n")
+    sys.stdout.flush()
+    return count
@@ -0,0 +1,159 @@
+import hashlib
+import io
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+from cookietemple.util.dict_util import is_nested_dictionary
+from cookietemple.util.dir_util import user_cache_path
+
+log = logging.getLogger(__name__)
+
+AVAILABLE_TEMPLATES_PATH = os.path.normpath(f"{os.path.dirname(__file__)}/../create/templates/available_templates.yml")
+# the parsed available_templates.yml files are cached in this directory of the user cache directory
+REGISTRY_CACHE_NAME = "templates"
+
+
+class TemplateRegistry:
+    """
+    All templates of an available_templates.yml file with indexed lookups by handle, domain and language.
+    The parsed file is cached as JSON in the user cache directory (keyed by the absolute path of the YAML file),
+    so the YAML file is only parsed again after it changed. Neither the package nor external catalogs are ever written to.
+    Use load_template_registry to get the registry, which is shared by all callers of a process.
+
+    Attributes:
+        yaml_path (str): Path to the available_templates.yml file.
+        cache_file (str): Path to the cache file.
+        templates (dict): All templates nested by domain, (subdomain) and language like in the YAML file.
+        by_handle (dict): All templates by their handle in the order of the YAML file.
+        by_domain (dict): Lists of all templates of a domain.
+        by_language (dict): Lists of all templates of a language.
+    """
+
+    # increased whenever the format of the cache file changes
+    CACHE_FORMAT = 1
+
+    def __init__(self, yaml_path: str = AVAILABLE_TEMPLATES_PATH):
+        self.yaml_path = yaml_path
+        path_hash = hashlib.sha256(os.path.realpath(yaml_path).encode("utf-8")).hexdigest()[:16]
+        self.cache_file = os.path.join(user_cache_path(REGISTRY_CACHE_NAME), f"{path_hash}-{os.path.basename(yaml_path)}.json")
+        self.stat = os.stat(yaml_path)
+        self.templates: dict = self._load()
+        self.by_handle: Dict[str, dict] = {}
+        self.by_domain: Dict[str, List[dict]] = {}
+        self.by_language: Dict[str, List[dict]] = {}
+        self._index(self.templates)
+
+    def get(self, handle: str) -> Optional[dict]:
+        """
+        Get a template by its full handle.
+
+        :param handle: The template handle (e.g. cli-python)
+        :return: The template or None, if no template has this handle
+        """
+        return self.by_handle.get(handle)
+
+    def version(self, handle: str) -> str:
+        """
+        Get the version of a template.
+
+        :param handle: The template handle
+        :return: The version of the template
+        """
+        return self.by_handle[handle]["version"]
+
+    def is_outdated(self) -> bool:
+        """
+        Check whether the YAML file changed since the registry was loaded.
+
+        :return: True if the file changed, false otherwise
+        """
+        stat = os.stat(self.yaml_path)
+        return (stat.st_mtime_ns, stat.st_size) != (self.stat.st_mtime_ns, self.stat.st_size)
+
+    def _index(self, templates: dict) -> None:
+        """
+        Index all templates of a (nested) dictionary of templates.
+
+        :param templates: The (nested) dictionary of templates
+        """
+        for template in templates.values():
+            if is_nested_dictionary(template):
+                self._index(template)
+                continue
+            parts = template["handle"].split("-")
+            self.by_handle[template["handle"]] = template
+            self.by_domain.setdefault(parts[0], []).append(template)
+            self.by_language.setdefault(parts[-1], []).append(template)
+
+    def _load(self) -> dict:
+        """
+        Load the templates from the cache file, if it matches the YAML file, and parse the YAML file otherwise.
+        The cache matches, if the modification time and size of the YAML file are unchanged or, if only those changed, its content hash is unchanged.
+
+        :return: All templates nested by domain, (subdomain) and language
+        """
+        key = {"format": self.CACHE_FORMAT, "mtime_ns": self.stat.st_mtime_ns, "size": self.stat.st_size}
+        cache = self._read_cache()
+        if cache and all(cache.get(name) == value for name, value in key.items()):
+            return cache["templates"]
+        with open(self.yaml_path, "rb") as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+        if cache and cache.get("format") == self.CACHE_FORMAT and cache.get("digest") == digest:
+            templates = cache["templates"]
+        else:
+            log.debug(f"Parsing {self.yaml_path}.")
+            from ruamel.yaml import YAML
+
+            templates = json.loads(json.dumps(YAML(typ="safe").load(io.BytesIO(content))))
+        self._write_cache({**key, "digest": digest, "templates": templates})
+        return templates
+
+    def _read_cache(self) -> Optional[dict]:
+        """
+        Read the cache file.
+
+        :return: The content of the cache file or None, if it does not exist
+        """
+        try:
+            with open(self.cache_file) as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, cache: dict) -> None:
+        """
+        Write the cache file.
+
+        :param cache: The content of the cache file
+        """
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            log.debug(f"Unable to write template registry cache {self.cache_file}: {e}")
+
+
+# the registries loaded by this process by the real path of their YAML file
+_registries: Dict[str, TemplateRegistry] = {}
+
+
+def load_template_registry(yaml_path: str = AVAILABLE_TEMPLATES_PATH) -> TemplateRegistry:
+    """
+    Load the registry of all templates of an available_templates.yml file.
+    The registry is shared by all callers of this process and only loaded again, if the YAML file changed.
+
+    :param yaml_path: Path to the available_templates.yml file
+    :return: The registry
+    """
+    real_path = os.path.realpath(yaml_path)
+    registry = _registries.get(real_path)
+    if registry is None or registry.is_outdated():
+        registry = _registries[real_path] = TemplateRegistry(yaml_path)
+    return registry
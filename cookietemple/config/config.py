@@ -82,9 +82,7 @@ class ConfigCommand:
         """
         ConfigCommand.check_ct_config_dir_exists()
         try:
-            path = Path(ConfigCommand.CONF_FILE_PATH)
-            yaml = YAML()
-            settings = yaml.load(path)
+            settings = load_yaml_file(ConfigCommand.CONF_FILE_PATH)
             if not all(attr in settings for attr in ["full_name", "github_username", "email"]):
                 print("[bold red]The cookietemple config file misses some required attributes!")
                 print("[bold blue]Lets set them before setting your Github personal access token!")
@@ -0,0 +1,199 @@
+import csv
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rich.table import Table
+
+from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.common.template_catalog import load_template_catalog
+from cookietemple.common.template_registry import load_template_registry
+from cookietemple.config.config import ConfigCommand
+from cookietemple.create.create import choose_domain
+from cookietemple.custom_cli.questionary import MissingPropertyError, disable_prompts
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+# the properties every project of a manifest must set
+REQUIRED_PROPERTIES = ["domain", "project_name"]
+# the language of the projects of a domain, which do not set one (see the language prompts of the domain creators)
+DEFAULT_LANGUAGES = {"cli": "python", "web": "python", "gui": "java", "lib": "cpp", "pub": "latex"}
+
+
+def create_batch(manifest: str, path: Path, jobs: int = 1) -> None:
+    """
+    Create all projects of a manifest without prompting and print a summary of all projects.
+    All projects are created by a pool of worker processes, which reuse the loaded templates for all of their projects.
+
+    :param manifest: Path to the YAML or CSV manifest
+    :param path: Directory, which relative paths of the manifest refer to
+    :param jobs: Number of processes to create projects in
+    """
+    projects = load_manifest(manifest)
+    log.debug(f"Loaded {len(projects)} projects from {manifest}.")
+    results: List[Optional[Tuple[bool, str, float]]] = [None] * len(projects)
+    targets: List[str] = []
+    for idx, project in enumerate(projects):
+        target, error = check_batch_project(project, str(path), targets)
+        targets.append(target)
+        if error:
+            results[idx] = (False, error, 0.0)
+
+    # load the templates before starting the workers, which inherit them (where processes are forked)
+    load_template_registry()
+    load_template_catalog()
+    start = time.perf_counter()
+    pending = [idx for idx, result in enumerate(results) if result is None]
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {idx: executor.submit(create_batch_project, projects[idx], targets[idx]) for idx in pending}
+            for idx in pending:
+                results[idx] = futures[idx].result()
+    else:
+        for idx in pending:
+            results[idx] = create_batch_project(projects[idx], targets[idx])
+    print_batch_summary(projects, targets, results, time.perf_counter() - start)  # type: ignore
+    if not all(result[0] for result in results):  # type: ignore
+        sys.exit(1)
+
+
+def load_manifest(manifest: str) -> List[dict]:
+    """
+    Load the projects of a manifest. Every project is a dictionary of the .cookietemple.yml properties of the project
+    and an optional path, where the project is created.
+    YAML manifests either contain the list of projects or map defaults to the properties shared by all projects and projects to the list.
+    CSV manifests have a header row with the names of the properties and one row per project. Empty cells are skipped.
+
+    :param manifest: Path to the YAML or CSV manifest
+    :return: The projects with the defaults of the cookietemple config file and the manifest applied
+    """
+    if manifest.endswith(".csv"):
+        with open(manifest, newline="") as f:
+            projects = [
+                {key: parse_csv_value(value) for key, value in row.items() if value} for row in csv.DictReader(f)
+            ]
+        defaults: dict = {}
+    else:
+        content = load_yaml_file(manifest)
+        if isinstance(content, dict):
+            defaults, projects = content.get("defaults") or {}, content.get("projects") or []
+        else:
+            defaults, projects = {}, content or []
+    return [{**batch_defaults(), **defaults, **project} for project in projects]
+
+
+def parse_csv_value(value: str):
+    """
+    Convert the booleans of a CSV manifest, whose values are all strings.
+
+    :param value: The value of a cell
+    :return: The boolean for true or false (ignoring case), the value otherwise
+    """
+    return {"true": True, "false": False}.get(value.lower(), value)
+
+
+def batch_defaults() -> Dict:
+    """
+    The defaults of all projects of a batch. Projects are not pushed to Github and the creator is taken from the cookietemple config file.
+
+    :return: The default properties
+    """
+    defaults = {"is_github_repo": False, "is_repo_private": False, "is_github_orga": False, "github_orga": ""}
+    if os.path.exists(ConfigCommand.CONF_FILE_PATH):
+        config = load_yaml_file(ConfigCommand.CONF_FILE_PATH)
+        for key in ("full_name", "email", "github_username"):
+            if key in config:
+                defaults[key] = config[key]
+        if "github_username" in config:
+            defaults["creator_github_username"] = config["github_username"]
+    return defaults
+
+
+def check_batch_project(project: dict, path: str, targets: List[str]) -> Tuple[str, str]:
+    """
+    Check whether a project of a batch can be created, before any project is created.
+
+    :param project: The properties of the project
+    :param path: Directory, which a relative path of the project refers to
+    :param targets: The project directories of all previous projects
+    :return: The directory the project is created at and an error message, which is empty, if the project can be created
+    """
+    directory = os.path.abspath(os.path.join(path, os.path.expanduser(str(project.pop("path", ".")))))
+    missing = [key for key in REQUIRED_PROPERTIES if not project.get(key)]
+    if missing:
+        return directory, f"Missing {', '.join(missing)}"
+    # see TemplateCreator.prompt_general_template_configuration
+    project_slug = str(project["project_name"]).lower().replace(" ", "_")
+    language = project.get("language") or DEFAULT_LANGUAGES.get(str(project["domain"]), "")
+    # Python projects are created without hyphens (see TemplateCreator.create_common_files)
+    if str(language).lower() == "python":
+        project_slug = project_slug.replace("-", "_")
+    target = os.path.join(directory, project_slug)
+    # projects, whose names only differ by hyphens, collide, if one of them is a Python project
+    if target.replace("-", "_") in (previous_target.replace("-", "_") for previous_target in targets):
+        return target, "Another project of the manifest is created at the same path"
+    if os.path.exists(target) or os.path.exists(os.path.join(directory, project_slug.replace("-", "_"))):
+        return target, "A directory named like the project already exists"
+    return target, ""
+
+
+def create_batch_project(project: dict, target: str) -> Tuple[bool, str, float]:
+    """
+    Create a project of a batch. Errors are returned instead of raised, so a single project cannot abort the batch.
+
+    :param project: The properties of the project
+    :param target: Path to the project directory
+    :return: Whether the project was created, an error message and the duration in seconds
+    """
+    disable_prompts()
+    start = time.perf_counter()
+    old_cwd = os.getcwd()
+    error = ""
+    try:
+        directory = os.path.dirname(target)
+        os.makedirs(directory, exist_ok=True)
+        os.chdir(directory)
+        choose_domain(Path(directory), None, project)
+    except (MissingPropertyError, KeyError) as e:
+        error = f"Missing {e}"
+    except SystemExit as e:
+        error = f"Aborted with exit code {e.code}"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        os.chdir(old_cwd)
+    return not error, error, time.perf_counter() - start
+
+
+def print_batch_summary(
+    projects: List[dict], targets: List[str], results: List[Tuple[bool, str, float]], duration: float
+) -> None:
+    """
+    Print the result and duration of every project of a batch.
+
+    :param projects: The properties of all projects
+    :param targets: The project directories of all projects
+    :param results: Whether every project was created, an error message and the duration
+    :param duration: The duration of the batch in seconds
+    """
+    created = sum(result[0] for result in results)
+    table = Table(title=f"[bold]Created {created} of {len(results)} projects in {duration:.1f}s", title_style="blue")
+    table.add_column("Project", style="green")
+    table.add_column("Domain")
+    table.add_column("Path")
+    table.add_column("Result")
+    table.add_column("Duration (s)", justify="right")
+    for project, target, (success, error, project_duration) in zip(projects, targets, results):
+        table.add_row(
+            str(project.get("project_name", "")),
+            str(project.get("domain", "")),
+            target,
+            "[bold green]Created" if success else f"[bold red]{error}",
+            f"{project_duration:.1f}",
+        )
+    console.print(table)
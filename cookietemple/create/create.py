@@ -1,13 +1,17 @@
 import logging
+import sys
 from pathlib import Path
 from typing import Optional, Union
 
+from cookietemple.common.template_catalog import BUILTIN_DOMAINS, load_template_catalog
 from cookietemple.create.domains.cli_creator import CliCreator
+from cookietemple.create.domains.external_creator import ExternalCreator
 from cookietemple.create.domains.gui_creator import GuiCreator
 from cookietemple.create.domains.lib_creator import LibCreator
 from cookietemple.create.domains.pub_creator import PubCreator
 from cookietemple.create.domains.web_creator import WebCreator
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
@@ -21,11 +25,12 @@ def choose_domain(path: Path, domain: Union[str, bool], dot_cookietemple: Option
     :param domain: Template domain
     :param dot_cookietemple: Dictionary created from the .cookietemple.yml file. None if no .cookietemple.yml file was used.
     """
+    catalog = load_template_catalog()
     if not domain:
         domain = cookietemple_questionary_or_dot_cookietemple(
             function="select",
             question="Choose the project's domain",
-            choices=["cli", "lib", "gui", "web", "pub"],
+            choices=BUILTIN_DOMAINS + catalog.domains(),
             default="cli",
             dot_cookietemple=dot_cookietemple,
             to_get_property="domain",
@@ -33,5 +38,15 @@ def choose_domain(path: Path, domain: Union[str, bool], dot_cookietemple: Option
 
     switcher = {"cli": CliCreator, "web": WebCreator, "gui": GuiCreator, "lib": LibCreator, "pub": PubCreator}
 
-    creator_obj: Union[CliCreator, WebCreator, GuiCreator, LibCreator, PubCreator] = switcher.get(domain.lower())()  # type: ignore
+    creator_obj: Union[CliCreator, WebCreator, GuiCreator, LibCreator, PubCreator, ExternalCreator]
+    if domain.lower() in switcher:  # type: ignore
+        creator_obj = switcher.get(domain.lower())()  # type: ignore
+    # domains of external template catalogs
+    elif domain.lower() in catalog.domains():  # type: ignore
+        creator_obj = ExternalCreator(domain.lower())  # type: ignore
+    else:
+        console.print(
+            f"[bold red]Unknown domain {domain}! Valid domains are {', '.join(BUILTIN_DOMAINS + catalog.domains())}."
+        )
+        sys.exit(1)
     creator_obj.create_template(path, dot_cookietemple)
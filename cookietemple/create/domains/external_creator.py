@@ -0,0 +1,59 @@
+from pathlib import Path
+from typing import Optional
+
+from cookietemple.common.template_catalog import load_template_catalog
+from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
+from cookietemple.create.github_support import prompt_github_repo
+from cookietemple.create.template_creator import TemplateCreator
+from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+
+
+class ExternalCreator(TemplateCreator):
+    """
+    Creates templates of external catalogs. They only use the general template configuration.
+    """
+
+    def __init__(self, domain: str):
+        self.external_struct = CookietempleTemplateStruct(domain=domain)
+        super().__init__(self.external_struct)
+        self.catalog = load_template_catalog()
+
+    def create_template(self, path: Path, dot_cookietemple: Optional[dict]):
+        """
+        Handles a domain of external templates. Prompts the user for the template and the general options.
+        """
+        handle = cookietemple_questionary_or_dot_cookietemple(
+            function="select",
+            question="Choose the template",
+            choices=[template["handle"] for template in self.catalog.templates_of(self.external_struct.domain)],
+            dot_cookietemple=dot_cookietemple,
+            to_get_property="template_handle",
+        )
+        template = self.catalog.get(handle)  # type: ignore
+        self.external_struct.language = handle.split("-")[-1]  # type: ignore
+
+        # prompt the user to fetch general template configurations
+        super().prompt_general_template_configuration(dot_cookietemple)
+
+        (
+            self.external_struct.is_github_repo,
+            self.external_struct.is_repo_private,
+            self.external_struct.is_github_orga,
+            self.external_struct.github_orga,
+        ) = prompt_github_repo(dot_cookietemple)
+
+        if self.external_struct.is_github_orga:
+            self.external_struct.github_username = self.external_struct.github_orga
+        # the template directory is only accessed now, that the template is used
+        super().create_template_from_path(template["path"])  # type: ignore
+
+        self.external_struct.template_version, self.external_struct.template_handle = template["version"], handle  # type: ignore
+
+        # perform general operations like creating a GitHub repository and general linting
+        super().process_common_operations(
+            path=Path(path).resolve(),
+            domain=self.external_struct.domain,
+            language=self.external_struct.language,
+            dot_cookietemple=dot_cookietemple,
+            skip_docs_link=True,
+        )
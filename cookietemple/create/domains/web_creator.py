@@ -176,6 +176,7 @@ class WebCreator(TemplateCreator):
                 function="select",  # type: ignore
                 question="Choose between the following predefined frontend templates",
                 choices=["SolidState", "None"],
+                default="SolidState",
                 dot_cookietemple=dot_cookietemple,
                 to_get_property="frontend",
             ).lower()
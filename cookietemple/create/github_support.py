@@ -19,11 +19,13 @@ from cookietemple.common.load_yaml import load_yaml_file
 from cookietemple.config.config import ConfigCommand
 from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+from cookietemple.util.profiler import profiler
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
 
+@profiler.profile("GitHub push", "http")
 def create_push_github_repository(
     project_path: str, creator_ctx: CookietempleTemplateStruct, tmp_repo_path: str
 ) -> None:
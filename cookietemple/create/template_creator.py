@@ -3,25 +3,25 @@ import os
 import re
 import shutil
 import sys
-import tempfile
 from dataclasses import asdict
-from distutils.dir_util import copy_tree
 from pathlib import Path
 from typing import Optional, Union
 
 import requests
-from cookiecutter.main import cookiecutter  # type: ignore
 from ruamel.yaml import YAML
 
 import cookietemple
 from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.common.template_registry import load_template_registry
 from cookietemple.config.config import ConfigCommand
 from cookietemple.create.domains.cookietemple_template_struct import CookietempleTemplateStruct
 from cookietemple.create.github_support import create_push_github_repository, is_git_repo, load_github_username
+from cookietemple.create.template_renderer import load_common_files_renderer, render_cookiecutter
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
 from cookietemple.lint.lint import lint_project
 from cookietemple.util.dir_util import delete_dir_tree
 from cookietemple.util.docs_util import fix_short_title_underline
+from cookietemple.util.profiler import profiler
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
@@ -39,7 +39,7 @@ class TemplateCreator:
         self.TEMPLATES_PATH = f"{self.WD}/templates"
         self.COMMON_FILES_PATH = f"{self.TEMPLATES_PATH}/common_files"
         self.AVAILABLE_TEMPLATES_PATH = f"{self.TEMPLATES_PATH}/available_templates.yml"
-        self.AVAILABLE_TEMPLATES = load_yaml_file(self.AVAILABLE_TEMPLATES_PATH)
+        self.AVAILABLE_TEMPLATES = load_template_registry(self.AVAILABLE_TEMPLATES_PATH).templates
         self.CWD = Path.cwd()
         self.creator_ctx = creator_ctx
 
@@ -52,10 +52,12 @@ class TemplateCreator:
         subdomain: Union[str, bool] = None,
         language: Union[str, bool] = None,
         dot_cookietemple: Optional[dict] = None,
+        skip_docs_link=False,
     ) -> None:
         """
         Create all stuff that is common for cookietemples template creation process; in detail those things are:
         create and copy common files, fix docs style, lint the project and ask whether the user wants to create a github repo.
+        Templates of external catalogs skip the link to cookietemple's documentation of the template.
         """
         # create the common files and copy them into the templates directory (skip if flag is set)
 
@@ -83,7 +85,9 @@ class TemplateCreator:
             create_push_github_repository(project_path, self.creator_ctx, tmp_project_path)
             shutil.rmtree(tmp_project_path, ignore_errors=True)
 
-        if subdomain:
+        if skip_docs_link:
+            log.debug("Not linking cookietemple's documentation for a template of an external catalog.")
+        elif subdomain:
             console.print()
             console.print(
                 "[bold blue]Please visit: https://cookietemple.readthedocs.io/en/latest/available_templates/available_templates.html"
@@ -110,6 +114,15 @@ class TemplateCreator:
 
         :param domain_path: Path to the template, which is still in cookiecutter format
         """
+        self.create_template_from_path(f"{domain_path}/{self.creator_ctx.domain}_{self.creator_ctx.language.lower()}")
+
+    @profiler.profile("cookiecutter render", "render")
+    def create_template_from_path(self, template_path: str) -> None:
+        """
+        Creates a chosen template from its cookiecutter directory.
+
+        :param template_path: Path to the cookiecutter directory of the template
+        """
         # Target directory is already occupied -> overwrite?
         occupied = os.path.isdir(f"{self.CWD}/{self.creator_ctx.project_slug}")
         if occupied:
@@ -117,8 +130,8 @@ class TemplateCreator:
 
             # Confirm proceeding with overwriting existing directory
             if cookietemple_questionary_or_dot_cookietemple("confirm", "Do you really want to continue?", default="No"):
-                cookiecutter(
-                    f"{domain_path}/{self.creator_ctx.domain}_{self.creator_ctx.language.lower()}",
+                render_cookiecutter(
+                    template_path,
                     no_input=True,
                     overwrite_if_exists=True,
                     extra_context=self.creator_ctx_to_dict(),
@@ -127,13 +140,14 @@ class TemplateCreator:
                 console.print("[bold red]Aborted! Canceled template creation!")
                 sys.exit(0)
         else:
-            cookiecutter(
-                f"{domain_path}/{self.creator_ctx.domain}_{self.creator_ctx.language.lower()}",
+            render_cookiecutter(
+                template_path,
                 no_input=True,
                 overwrite_if_exists=True,
                 extra_context=self.creator_ctx_to_dict(),
             )
 
+    @profiler.profile("cookiecutter render", "render")
     def create_template_with_subdomain(self, domain_path: str, subdomain: str) -> None:
         """
         Creates a chosen template that **does** have a subdomain.
@@ -151,7 +165,7 @@ class TemplateCreator:
                 "confirm", "Do you really want to continue?", default="Yes"
             ):
                 delete_dir_tree(Path(f"{self.CWD}/{self.creator_ctx.project_slug}"))
-                cookiecutter(
+                render_cookiecutter(
                     f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}",
                     no_input=True,
                     overwrite_if_exists=True,
@@ -162,13 +176,14 @@ class TemplateCreator:
                 console.print("[bold red]Aborted! Canceled template creation!")
                 sys.exit(0)
         else:
-            cookiecutter(
+            render_cookiecutter(
                 f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}",
                 no_input=True,
                 overwrite_if_exists=True,
                 extra_context=self.creator_ctx_to_dict(),
             )
 
+    @profiler.profile("cookiecutter render", "render")
     def create_template_with_subdomain_framework(self, domain_path: str, subdomain: str, framework: str) -> None:
         """
         Creates a chosen template that **does** have a subdomain.
@@ -186,7 +201,7 @@ class TemplateCreator:
             if cookietemple_questionary_or_dot_cookietemple(
                 "confirm", "Do you really want to continue?", default="Yes"
             ):
-                cookiecutter(
+                render_cookiecutter(
                     f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}/{framework}",
                     no_input=True,
                     overwrite_if_exists=True,
@@ -197,7 +212,7 @@ class TemplateCreator:
                 console.print("[bold red]Aborted! Canceled template creation!")
                 sys.exit(0)
         else:
-            cookiecutter(
+            render_cookiecutter(
                 f"{domain_path}/{subdomain}_{self.creator_ctx.language.lower()}/{framework}",
                 no_input=True,
                 overwrite_if_exists=True,
@@ -307,28 +322,27 @@ class TemplateCreator:
             self.creator_ctx.github_username = load_github_username()
             self.creator_ctx.creator_github_username = self.creator_ctx.github_username
 
+    @profiler.profile("create_common_files", "render")
     def create_common_files(self) -> None:
         """
-        Create a temporary directory for common files of all templates and apply cookiecutter on them.
-        They are subsequently moved into the directory of the created template.
+        Render the common files of all templates straight into the directory of the created template.
         """
         log.debug("Creating common files.")
-        dirpath = tempfile.mkdtemp()
-        copy_tree(f"{self.COMMON_FILES_PATH}", dirpath)
-        cwd_project = self.CWD
-        os.chdir(dirpath)
-        log.debug(f"Cookiecuttering common files at {dirpath}")
-        cookiecutter(
-            dirpath,
-            extra_context={
+        dest_dir = (
+            self.creator_ctx.project_slug
+            if self.creator_ctx.language != "python"
+            else self.creator_ctx.project_slug_no_hyphen
+        )
+        log.debug(f"Rendering common files into {self.CWD}/{dest_dir}")
+        load_common_files_renderer(self.COMMON_FILES_PATH).render(
+            f"{self.CWD}/{dest_dir}",
+            {
                 "full_name": self.creator_ctx.full_name,
                 "email": self.creator_ctx.email,
                 "language": self.creator_ctx.language,
                 "domain": self.creator_ctx.domain,
                 "project_name": self.creator_ctx.project_name,
-                "project_slug": self.creator_ctx.project_slug
-                if self.creator_ctx.language != "python"
-                else self.creator_ctx.project_slug_no_hyphen,
+                "project_slug": dest_dir,
                 "version": self.creator_ctx.version,
                 "license": self.creator_ctx.license,
                 "project_short_description": self.creator_ctx.project_short_description,
@@ -336,31 +350,14 @@ class TemplateCreator:
                 "creator_github_username": self.creator_ctx.creator_github_username,
                 "cookietemple_version": cookietemple.__version__,
             },
-            no_input=True,
-            overwrite_if_exists=True,
-        )
-
-        # recursively copy the common files directory content to the created project
-        log.debug("Copying common files into the created project")
-        dest_dir = (
-            self.creator_ctx.project_slug
-            if self.creator_ctx.language != "python"
-            else self.creator_ctx.project_slug_no_hyphen
         )
-        copy_tree(f"{Path.cwd()}/common_files_util", f"{cwd_project}/{dest_dir}")
-        # delete the tmp cookiecuttered common files directory
-        log.debug("Delete common files directory.")
-        delete_dir_tree(Path(f"{Path.cwd()}/common_files_util"))
-        shutil.rmtree(dirpath)
-        # change to recent cwd so lint etc can run properly
-        os.chdir(str(cwd_project))
 
     def check_name_available(self, host, dot_cookietemple) -> None:
         """
         Main function that calls the queries for the project name lookup at PyPi and readthedocs.io
         """
         # if project already exists at either PyPi or readthedocs, ask user for confirmation with the option to change the project name
-        while TemplateCreator.query_name_available(host, self.creator_ctx.project_name) and not dot_cookietemple:  # type: ignore
+        while not dot_cookietemple and TemplateCreator.query_name_available(host, self.creator_ctx.project_name):  # type: ignore
             console.print(f"[bold red]A project named {self.creator_ctx.project_name} already exists at {host}!")
             # provide the user an option to change the project's name
             if cookietemple_questionary_or_dot_cookietemple(
@@ -377,6 +374,7 @@ class TemplateCreator:
                 break
 
     @staticmethod
+    @profiler.profile("query_name_available", "http")
     def query_name_available(host: str, project_name: str) -> bool:
         """
         Make a GET request to the host to check whether a project with this name already exists.
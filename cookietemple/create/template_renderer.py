@@ -0,0 +1,270 @@
+import fnmatch
+import json
+import logging
+import os
+import shutil
+from contextlib import contextmanager
+from types import CodeType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from cookiecutter.environment import StrictEnvironment  # type: ignore
+from cookiecutter.main import cookiecutter  # type: ignore
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from jinja2.bccache import Bucket
+
+from cookietemple.util.dir_util import user_cache_path
+
+log = logging.getLogger(__name__)
+
+# compiled Jinja templates are cached across runs in this directory of the user cache directory
+BYTECODE_CACHE_NAME = "jinja"
+# the size in bytes the bytecode cache is pruned to, once templates were compiled
+BYTECODE_CACHE_MAX_SIZE = 32 * 1024 * 1024
+# the environment options changing how templates are compiled
+COMPILE_OPTIONS = [
+    "block_start_string",
+    "block_end_string",
+    "variable_start_string",
+    "variable_end_string",
+    "comment_start_string",
+    "comment_end_string",
+    "line_statement_prefix",
+    "line_comment_prefix",
+    "trim_blocks",
+    "lstrip_blocks",
+    "newline_sequence",
+    "keep_trailing_newline",
+    "optimized",
+]
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    A persistent cache of compiled Jinja templates, which are also kept in memory for the rest of the process.
+    Compiled templates are keyed by the template name, the hash of the template source and the compile options and extensions of the environment.
+    Hence, templates with the same name in different template directories do not evict each other and changed templates are compiled again.
+    Jinja additionally ignores compiled templates of other Python versions.
+    Since changed templates leave their former compiled templates behind, the least recently used ones are removed by prune.
+
+    Attributes:
+        fixed_directory (str): The directory of the cache. If not set, the directory in the user cache directory is looked up on every access.
+        codes (dict): The compiled templates of this process as (source checksum, code) by their key.
+        dumped (bool): Whether compiled templates were written to the cache since it was last pruned.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        super().__init__(directory or user_cache_path(BYTECODE_CACHE_NAME))
+        # only a passed directory is fixed, the default one is looked up on every access
+        self.fixed_directory = directory
+        self.codes: Dict[str, Tuple[str, CodeType]] = {}
+        self.dumped = False
+
+    @property  # type: ignore
+    def directory(self) -> str:
+        return self.fixed_directory or user_cache_path(BYTECODE_CACHE_NAME)
+
+    @directory.setter
+    def directory(self, directory: str) -> None:
+        self.fixed_directory = directory
+
+    def get_bucket(self, environment: Environment, name: str, filename: Optional[str], source: str) -> Bucket:
+        options = [str(getattr(environment, option)) for option in COMPILE_OPTIONS] + sorted(environment.extensions)
+        key = "|".join([name, self.get_source_checksum(source), *options])
+        return super().get_bucket(environment, key, None, source)
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        checksum, code = self.codes.get(bucket.key, (None, None))
+        if checksum == bucket.checksum:
+            bucket.code = code
+            return
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            self.codes[bucket.key] = (bucket.checksum, bucket.code)
+            # mark the compiled template as recently used
+            try:
+                os.utime(self._get_cache_filename(bucket))
+            except OSError:
+                pass
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        self.codes[bucket.key] = (bucket.checksum, bucket.code)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+            self.dumped = True
+        except OSError as e:
+            log.debug(f"Unable to write to the Jinja bytecode cache {self.directory}: {e}")
+
+    def prune(self, max_size: int = BYTECODE_CACHE_MAX_SIZE) -> None:
+        """
+        Remove the least recently used compiled templates, until the cache is not larger than the maximum size.
+
+        :param max_size: The maximum size of the cache in bytes
+        """
+        self.dumped = False
+        try:
+            entries = []
+            for filename in fnmatch.filter(os.listdir(self.directory), self.pattern % ("*",)):
+                stat = os.stat(os.path.join(self.directory, filename))
+                entries.append((stat.st_mtime, stat.st_size, filename))
+            size = sum(entry[1] for entry in entries)
+            for _mtime, file_size, filename in sorted(entries):
+                if size <= max_size:
+                    break
+                os.remove(os.path.join(self.directory, filename))
+                size -= file_size
+        except OSError as e:
+            log.debug(f"Unable to prune the Jinja bytecode cache {self.directory}: {e}")
+
+
+# the bytecode cache shared by all environments of this process
+bytecode_cache = TemplateBytecodeCache()
+
+
+class CachingEnvironment(StrictEnvironment):
+    """
+    cookiecutter's Jinja environment, which takes compiled templates from the shared bytecode cache.
+    Besides the template files, this includes the templates of path names and prompt defaults, which Jinja would always compile.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("bytecode_cache", bytecode_cache)
+        super().__init__(**kwargs)
+
+    def from_string(self, source, globals=None, template_class=None) -> Template:
+        # cookiecutter renders directory names as absolute paths in the output directory, which would only fill the cache
+        if (
+            not isinstance(source, str)
+            or self.bytecode_cache is None
+            or os.path.isabs(source)
+            or not self.has_template_syntax(source)
+        ):
+            return super().from_string(source, globals, template_class)
+        bucket = self.bytecode_cache.get_bucket(self, "<string>", None, source)
+        if bucket.code is None:
+            bucket.code = self.compile(source)
+            self.bytecode_cache.set_bucket(bucket)
+        return (template_class or self.template_class).from_code(self, bucket.code, self.make_globals(globals), None)
+
+    def has_template_syntax(self, source: str) -> bool:
+        """
+        Check whether a string may contain any template syntax of this environment.
+
+        :param source: The template source
+        :return: True if the source contains a start string or line prefix, false otherwise
+        """
+        start_strings = [self.block_start_string, self.variable_start_string, self.comment_start_string]
+        line_prefixes = [prefix for prefix in (self.line_statement_prefix, self.line_comment_prefix) if prefix]
+        return any(start_string in source for start_string in start_strings + line_prefixes)
+
+
+@contextmanager
+def caching_environment() -> Iterator[None]:
+    """
+    Make cookiecutter render all templates with the caching environment while the context is active.
+    cookiecutter provides no way to pass an environment, so the environment class is replaced in all cookiecutter modules creating environments
+    and restored afterwards. The bytecode cache is pruned, if any template was compiled.
+    """
+    import cookiecutter.generate  # type: ignore
+    import cookiecutter.prompt  # type: ignore
+    import cookiecutter.utils  # type: ignore
+
+    modules = [
+        module
+        for module in (cookiecutter.generate, cookiecutter.prompt, cookiecutter.utils)
+        if getattr(module, "StrictEnvironment", None) is StrictEnvironment
+    ]
+    for module in modules:
+        module.StrictEnvironment = CachingEnvironment
+    try:
+        yield
+    finally:
+        for module in modules:
+            module.StrictEnvironment = StrictEnvironment
+        if bytecode_cache.dumped:
+            bytecode_cache.prune()
+
+
+def render_cookiecutter(template_path: str, **kwargs) -> str:
+    """
+    Render a cookiecutter template. Compiled templates are reused across renders and runs.
+
+    :param template_path: Path to the cookiecutter template
+    :param kwargs: The arguments of cookiecutter
+    :return: Path to the rendered project
+    """
+    with caching_environment():
+        return cookiecutter(template_path, **kwargs)
+
+
+class CommonFilesRenderer:
+    """
+    Renders the common files of all templates straight from the package directory into a project directory.
+    They are rendered with cookiecutter's Jinja environment, so they render exactly like the cookiecutter template they are.
+    The renderer keeps all parsed templates for the rest of the process and their compiled code is kept by the bytecode cache.
+    Use load_common_files_renderer to get the renderer, which is shared by all callers of a process.
+
+    Attributes:
+        template_dir (str): Path to the cookiecutter directory of the common files.
+        defaults (dict): The variables of the cookiecutter.json file.
+        project_template (str): Name of the project directory template (e.g. {{cookiecutter.commonName}}).
+        files (list): Paths of all files relative to the project directory template.
+    """
+
+    def __init__(self, template_dir: str):
+        self.template_dir = template_dir
+        with open(os.path.join(template_dir, "cookiecutter.json")) as f:
+            self.defaults: dict = json.load(f)
+        self.project_template = next(entry for entry in sorted(os.listdir(template_dir)) if "{{" in entry)
+        project_template_dir = os.path.join(template_dir, self.project_template)
+        self.files: List[str] = sorted(
+            os.path.relpath(os.path.join(root, file), project_template_dir)
+            for root, _, files in os.walk(project_template_dir)
+            for file in files
+        )
+        self.env = CachingEnvironment(
+            context={"cookiecutter": self.defaults}, keep_trailing_newline=True, loader=FileSystemLoader(template_dir)
+        )
+        self.path_templates: Dict[str, Template] = {}
+
+    def render(self, project_dir: str, extra_context: dict) -> None:
+        """
+        Render all common files into a project directory. Existing files are overwritten.
+
+        :param project_dir: Path to the project directory
+        :param extra_context: The cookiecutter variables overriding the ones of the cookiecutter.json file
+        """
+        from binaryornot.check import is_binary  # type: ignore
+
+        context = {"cookiecutter": {**self.defaults, **extra_context}}
+        for file in self.files:
+            template_file = os.path.join(self.template_dir, self.project_template, file)
+            if file not in self.path_templates:
+                self.path_templates[file] = self.env.from_string(file)
+            out_file = os.path.join(project_dir, self.path_templates[file].render(**context))
+            os.makedirs(os.path.dirname(out_file), exist_ok=True)
+            if is_binary(template_file):
+                shutil.copyfile(template_file, out_file)
+            else:
+                # Jinja template names always use forward slashes
+                template = self.env.get_template(f"{self.project_template}/{file}".replace(os.path.sep, "/"))
+                with open(out_file, "w", encoding="utf-8") as f:
+                    f.write(template.render(**context))
+            shutil.copymode(template_file, out_file)
+
+
+# the renderers loaded by this process by their template directory
+_common_files_renderers: Dict[str, CommonFilesRenderer] = {}
+
+
+def load_common_files_renderer(template_dir: str) -> CommonFilesRenderer:
+    """
+    Load the renderer of the common files. It is shared by all callers of this process.
+
+    :param template_dir: Path to the cookiecutter directory of the common files
+    :return: The renderer
+    """
+    real_path = os.path.realpath(template_dir)
+    if real_path not in _common_files_renderers:
+        _common_files_renderers[real_path] = CommonFilesRenderer(template_dir)
+    return _common_files_renderers[real_path]
@@ -9,7 +9,6 @@ from rich import print
 from rich.console import Console
 
 import cookietemple
-from cookietemple.bump_version.bump_version import VersionBumper
 from cookietemple.common.levensthein_dist import most_similar_command
 from cookietemple.common.suggest_similar_commands import MAIN_COMMANDS
 
@@ -283,6 +282,9 @@ def print_project_version(ctx, param, value) -> None:
     # if context uses resilient parsing (no changes of execution flow) or no flag value is provided, do nothing
     if not value or ctx.resilient_parsing:
         return
+    # imported here, since GitPython slows down the startup of all other commands
+    from cookietemple.bump_version.bump_version import VersionBumper
+
     try:
         print(f"[bold blue]Current project version is [bold green]{VersionBumper(Path.cwd(), False).CURRENT_VERSION}!")
         ctx.exit()
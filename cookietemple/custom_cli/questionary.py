@@ -5,10 +5,31 @@ from typing import Dict, List, Optional, Union
 import questionary
 from prompt_toolkit.styles import Style  # type: ignore
 
+from cookietemple.util.profiler import profiler
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
+# whether missing properties are answered with their default instead of prompting (e.g. for batch creation)
+prompts_disabled = False
+
+
+class MissingPropertyError(Exception):
+    """
+    Raised, if prompts are disabled and a property without a usable default is missing.
+    """
+
+    pass
+
+
+def disable_prompts() -> None:
+    """
+    Answer all properties, which are not passed in the dot_cookietemple dictionary, with their default instead of prompting.
+    Properties without a usable default raise a MissingPropertyError.
+    """
+    global prompts_disabled
+    prompts_disabled = True
+
 
 cookietemple_style = Style(
     [
@@ -26,6 +47,7 @@ cookietemple_style = Style(
 )
 
 
+@profiler.profile("questionary prompt", "prompt")
 def cookietemple_questionary_or_dot_cookietemple(
     function: str,
     question: str,
@@ -57,6 +79,14 @@ def cookietemple_questionary_or_dot_cookietemple(
         )
         return default  # type: ignore
 
+    if prompts_disabled:
+        if function == "confirm":
+            return default in ("Yes", "yes")
+        if default is not None and (function != "select" or default in choices):  # type: ignore
+            log.debug(f"Prompts are disabled. Assigning default {default} to {to_get_property or question}.")
+            return default
+        raise MissingPropertyError(to_get_property or question)
+
     # There is no .cookietemple.yml file aka dot_cookietemple dict passed -> ask for the properties
     answer: Optional[str] = ""
     try:
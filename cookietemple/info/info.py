@@ -1,18 +1,20 @@
 import logging
 import os
 import sys
-from typing import List
+from typing import Dict, Iterable, Iterator, Tuple
 
-from rich import print
 from rich.box import HEAVY_HEAD
 from rich.console import Console
 from rich.style import Style
 from rich.table import Table
 
 from cookietemple.common.levensthein_dist import most_similar_command
-from cookietemple.common.load_yaml import load_yaml_file
 from cookietemple.common.suggest_similar_commands import load_available_handles
+from cookietemple.common.template_catalog import BUILTIN_DOMAINS, load_template_catalog
+from cookietemple.common.template_output import stream_templates
+from cookietemple.common.template_registry import TemplateRegistry, load_template_registry
 from cookietemple.util.dict_util import is_nested_dictionary
+from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
@@ -22,12 +24,16 @@ class TemplateInfo:
     Present info in a nice layout about specific subsets of templates
     """
 
-    def __init__(self):
+    # the long descriptions with linebreaks by template handle and version
+    wrapped_descriptions: Dict[Tuple[str, str], str] = {}
+
+    def __init__(self, output_format: str = "table"):
         self.WD = os.path.dirname(__file__)
         self.TEMPLATES_PATH = f"{self.WD}/../create/templates"
         self.available_handles = ""
         self.most_sim = []
         self.action = ""
+        self.output_format = output_format
 
     def show_info(self, handle: str) -> None:
         """
@@ -35,12 +41,19 @@ class TemplateInfo:
 
         :param handle: domain/language/template handle (examples: cli or cli-python)
         """
-        # list of all templates that should be printed according to the passed handle
-        templates_to_print: List[str] = []
-        available_templates = load_yaml_file(f"{self.TEMPLATES_PATH}/available_templates.yml")
+        registry = load_template_registry(f"{self.TEMPLATES_PATH}/available_templates.yml")
+        available_templates = registry.templates
         specifiers = handle.split("-")
         domain = specifiers[0]
-        template_info: List[str] = []
+        template_info: dict = {}
+
+        # templates of external catalogs never share a domain with cookietemple's own templates
+        if domain not in BUILTIN_DOMAINS:
+            external_templates = load_template_catalog().templates_of(handle)
+            if external_templates:
+                log.debug("Found templates of an external catalog.")
+                self.output_templates(external_templates, handle)
+                return
 
         # only domain OR language specified
         if len(specifiers) == 1:
@@ -48,7 +61,7 @@ class TemplateInfo:
             try:
                 template_info = available_templates[domain]
             except KeyError:
-                self.handle_domain_or_language_only(handle, available_templates)
+                self.handle_domain_or_language_only(handle, registry)
         # domain, subdomain, language
         elif len(specifiers) > 2:
             log.debug("A domain, subdomain and language was specified.")
@@ -67,15 +80,14 @@ class TemplateInfo:
             except KeyError:
                 self.handle_non_existing_command(handle, True)
 
-        # Add all templates under template_info to list and output them
-        self.flatten_nested_dict(template_info, templates_to_print)
-        TemplateInfo.output_table(templates_to_print, handle)
+        # Output all templates under template_info
+        self.output_templates(self.iter_templates(template_info), handle)
 
-    def handle_domain_or_language_only(self, handle: str, available_templates: dict) -> None:
+    def handle_domain_or_language_only(self, handle: str, registry: TemplateRegistry) -> None:
         """
         Try to find a similar domain or treat handle as possible language
         :param handle: The handle inputted by the user
-        :param available_templates: All available templates load from yml file as dict
+        :param registry: The registry of all available templates
         """
         # try to find a similar domain
         self.handle_non_existing_command(handle)
@@ -84,14 +96,10 @@ class TemplateInfo:
             self.print_console_output(handle)
 
         # input may be a language so try this
-        templates_flatted: List[str] = []
-        self.flatten_nested_dict(available_templates, templates_flatted)
-        # load all available languages
-        available_languages = TemplateInfo.load_available_languages(templates_flatted)
+        available_languages = set(registry.by_language)
         # if handle exists as language in cookietemple output its available templates and exit with zero status
         if handle in available_languages:
-            templates_to_print_ = [template for template in templates_flatted if handle in template[1]]
-            TemplateInfo.output_table(templates_to_print_, handle)
+            self.output_templates(registry.by_language[handle], handle)
 
         # the handle does not match any domain/language; is there a similar language?
         else:
@@ -113,16 +121,24 @@ class TemplateInfo:
                 TemplateInfo.non_existing_handle()
         sys.exit(0)
 
+    def output_templates(self, templates: Iterable[dict], handle: str) -> None:
+        """
+        Output the templates in the selected format. The plain and json formats are streamed without building a table.
+        :param templates: The templates to output
+        :param handle: The handle the user inputted
+        """
+        if self.output_format == "table":
+            TemplateInfo.output_table(templates, handle)
+        else:
+            stream_templates(templates, "long description", self.output_format)
+
     @staticmethod
-    def output_table(templates_to_print: list, handle: str) -> None:
+    def output_table(templates: Iterable[dict], handle: str) -> None:
         """
         Output a nice looking, rich rendered table.
-        :param templates_to_print: The templates tht should go into the table
+        :param templates: The templates tht should go into the table
         :param handle: The handle the user inputted
         """
-        for template in templates_to_print:
-            template[2] = TemplateInfo.set_linebreaks(template[2])
-
         log.debug("Building info table.")
         table = Table(
             title=f"[bold]Info on cookietemple´s {handle}",
@@ -137,12 +153,17 @@ class TemplateInfo:
         table.add_column("Available Libraries", justify="left")
         table.add_column("Version", justify="left")
 
-        for template in templates_to_print:
-            table.add_row(f"[bold]{template[0]}", template[1], f"{template[2]}\n", template[3], template[4])
+        for template in templates:
+            table.add_row(
+                f"[bold]{template['name']}",
+                template["handle"],
+                f"{TemplateInfo.wrapped_long_description(template)}\n",
+                template["available libraries"],
+                template["version"],
+            )
 
         log.debug("Printing info table.")
-        console = Console()
-        console.print(table)
+        Console().print(table)
 
     def handle_non_existing_command(self, handle: str, run_f: bool = False) -> None:
         """
@@ -163,8 +184,10 @@ class TemplateInfo:
         if self.most_sim:
             # found exactly one similar handle
             if len(self.most_sim) == 1 and self.action == "use":
-                print(f"[bold red]Unknown handle '{handle}'. See [green]cookietemple list [red]for all valid handles")
-                print(f"[bold blue]Will use best match [green]{self.most_sim[0]}.\n")
+                console.print(
+                    f"[bold red]Unknown handle '{handle}'. See [green]cookietemple list [red]for all valid handles"
+                )
+                console.print(f"[bold blue]Will use best match [green]{self.most_sim[0]}.\n")
                 # use best match if exactly one similar handle was found
                 self.show_info(self.most_sim[0])
             elif len(self.most_sim) == 1 and self.action == "suggest":
@@ -172,7 +195,7 @@ class TemplateInfo:
             else:
                 # found multiple similar handles
                 nl = "\n"
-                print(
+                console.print(
                     f"[bold red]Unknown handle '{handle}'. See [green]cookietemple list [red]for all valid handles."
                     + f"\nMost similar handles are: [green]{nl}{nl.join(sorted(self.most_sim))}"
                 )
@@ -189,8 +212,10 @@ class TemplateInfo:
         :param handle: Handle inputted by the user
         :param domain_handle: A list of similar commands (will contain only one element most of the time)
         """
-        print(f"[bold red]Unknown handle '{handle}'. See [green]cookietemple list [red] for all valid handles.\n")
-        print(f"[bold red] Did you mean [green]{domain_handle[0]}?\n")
+        console.print(
+            f"[bold red]Unknown handle '{handle}'. See [green]cookietemple list [red] for all valid handles.\n"
+        )
+        console.print(f"[bold red] Did you mean [green]{domain_handle[0]}?\n")
 
     @staticmethod
     def non_existing_handle() -> None:
@@ -198,44 +223,37 @@ class TemplateInfo:
         Handling key not found access error for non existing template handles.
         Displays an error message and terminates cookietemple.
         """
-        print(
+        console.print(
             "[bold red]Handle does not exist. Please enter a valid handle.\nUse [green] cookietemple list [red]to display all template handles."
         )
         sys.exit(0)
 
-    def flatten_nested_dict(self, template_info_, templates_to_print) -> None:
+    def iter_templates(self, template_info_: dict) -> Iterator[dict]:
         """
-        Flatten an arbitrarily deep nested dict and creates a list of list containing all available
-        templates for the specified doamin/subdomain and/or language.
+        Iterate over all templates of an arbitrarily deep nested dict of templates for the specified domain/subdomain and/or language.
 
         :param template_info_: The dict containing the yaml parsed info for all available templates the user wants to gather some information
-        :param templates_to_print: A list of templates string representations, that will be printed to console
+        :return: The templates
         """
         if is_nested_dictionary(template_info_):
             for templ in template_info_.values():
-                if not is_nested_dictionary(templ):
-                    templates_to_print.append(
-                        [
-                            templ["name"],
-                            templ["handle"],
-                            templ["long description"],
-                            templ["available libraries"],
-                            templ["version"],
-                        ]
-                    )
-                else:
-                    self.flatten_nested_dict(templ, templates_to_print)
+                yield from self.iter_templates(templ)
         else:
-            # a single template to append was reached
-            templates_to_print.append(
-                [
-                    template_info_["name"],
-                    template_info_["handle"],
-                    template_info_["long description"],
-                    template_info_["available libraries"],
-                    template_info_["version"],
-                ]
-            )
+            # a single template was reached
+            yield template_info_
+
+    @staticmethod
+    def wrapped_long_description(template: dict) -> str:
+        """
+        Get the long description of a template with linebreaks. The result is cached per template version.
+
+        :param template: The template
+        :return: The long description with inserted newlines
+        """
+        key = (template["handle"], template["version"])
+        if key not in TemplateInfo.wrapped_descriptions:
+            TemplateInfo.wrapped_descriptions[key] = TemplateInfo.set_linebreaks(template["long description"])
+        return TemplateInfo.wrapped_descriptions[key]
 
     @staticmethod
     def set_linebreaks(desc: str) -> str:
@@ -261,14 +279,3 @@ class TemplateInfo:
             idx += 1
 
         return desc
-
-    @staticmethod
-    def load_available_languages(ls: list) -> set:
-        """
-        Load all available languages cookietemple supports.
-        NOTE: Assumption that all handles have two or three parts
-
-        :param ls: The flattended list from the available templates dict
-        :return: All available languages as a set
-        """
-        return {ls[1].split("-")[1] if len(ls[1].split("-")) == 2 else ls[1].split("-")[2] for ls in ls}
@@ -0,0 +1,33 @@
+import re
+from typing import Iterator, List, Tuple
+
+# Leftover cookiecutter (Jinja2) syntax: expressions like {{ cookiecutter.project_name }}, {{cookiecutter.project_name|lower}}
+# or {{ '=' * cookiecutter.name|length }} and statements like {% if cookiecutter.license == 'MIT' %} or {%- for x in cookiecutter.values -%}
+COOKIECUTTER_PATTERN = re.compile(r"{{[^}]*\bcookiecutter\b|{%[^%]*\bcookiecutter\b")
+# every match contains this substring. Testing it is far cheaper than the regex and rules out almost every line before the regex runs.
+COOKIECUTTER_NEEDLE = "cookiecutter"
+
+
+def contains_cookiecutter_string(line: str) -> bool:
+    """
+    Check whether a line contains leftover cookiecutter syntax.
+
+    :param line: The line to check
+    :return: True if any cookiecutter expression or statement was found, False otherwise
+    """
+    return COOKIECUTTER_NEEDLE in line and COOKIECUTTER_PATTERN.search(line) is not None
+
+
+def find_cookiecutter_lines(lines: List[str]) -> Iterator[Tuple[int, str]]:
+    """
+    Find all lines of a file containing leftover cookiecutter syntax.
+    Files without the substring are ruled out by a single search over their whole content.
+
+    :param lines: All lines of the file
+    :return: Tuples of the form `(<line number starting at 1>, <line>)` of all lines containing cookiecutter syntax
+    """
+    if COOKIECUTTER_NEEDLE not in "".join(lines):
+        return
+    for line_number, line in enumerate(lines, start=1):
+        if contains_cookiecutter_string(line):
+            yield line_number, line
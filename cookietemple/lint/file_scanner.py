@@ -0,0 +1,299 @@
+import io
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from cookietemple.lint.gitignore import GitignoreMatcher
+from cookietemple.lint.lint_cache import Findings, LintCache
+from cookietemple.lint.lint_report import LintResult
+
+log = logging.getLogger(__name__)
+
+# A content check is called with the full path of a file, the file's name and all of its lines
+ContentCheck = Callable[[str, str, List[str]], None]
+# A scanned file: `(<lines or None if the findings are cached>, <stat result>, <content hash>, <cached findings>)`
+ScannedFile = Tuple[Optional[List[str]], os.stat_result, Optional[str], Optional[Findings]]
+
+
+class FileScanner:
+    """
+    Walks a project directory once and dispatches the content of every file to all registered content checks.
+    Files are read by a small thread pool, but the checks are always called in the order of the walk, so results stay deterministic.
+    Binary files, files larger than the maximum file size and all files and directories ignored by git are skipped.
+    If a cache is enabled, the findings of unchanged files are replayed instead of running the checks again.
+
+    Attributes:
+        path (str): Path to the project directory.
+        max_file_size (int): Size in bytes above which files are skipped.
+        gitignore (GitignoreMatcher): Matcher of all files and directories ignored by git, which are never visited.
+        checks (dict): Registered content checks of the form `{<check name>: (<function>, <ignored file/dir names>)}`
+        completed (set): Names of all checks that already ran as part of a full project scan.
+        skipped (dict): All skipped files of the form `{<file path>: <reason>}`
+        cache (LintCache): Persistent cache of the findings of every file, if enabled.
+        timings (dict): Wall-clock time in seconds every check took over all scans of the form `{<check name>: <seconds>}`
+        only (set): Normalized paths of the only files, which should be scanned. All files are scanned if not set.
+    """
+
+    # directories which are never part of a project's content
+    ALWAYS_IGNORED = {".git"}
+    # files with these extensions are known to be binary and are never read
+    # fmt: off
+    BINARY_EXTENSIONS = {
+        # images and print formats
+        ".bmp", ".eps", ".gif", ".ico", ".jpeg", ".jpg", ".pdf", ".png", ".ps", ".svgz", ".tif", ".tiff", ".webp",
+        # fonts
+        ".eot", ".otf", ".ttf", ".woff", ".woff2",
+        # archives
+        ".7z", ".bz2", ".gz", ".jar", ".tar", ".tgz", ".war", ".xz", ".zip",
+        # compiled files and libraries
+        ".a", ".bin", ".class", ".dll", ".dylib", ".exe", ".o", ".obj", ".pyc", ".pyd", ".pyo", ".so",
+        # office documents, media and databases
+        ".db", ".doc", ".docx", ".mp3", ".mp4", ".ogg", ".ppt", ".pptx", ".sqlite", ".wav", ".xls", ".xlsx",
+    }
+    # fmt: on
+    # number of bytes at the beginning of a file, which are searched for NUL bytes
+    SNIFF_SIZE = 8192
+    DEFAULT_MAX_FILE_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        path: str = ".",
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+        gitignore: Optional[GitignoreMatcher] = None,
+        workers: int = 8,
+        chunk_size: int = 64,
+    ):
+        self.path = path
+        self.max_file_size = max_file_size
+        self.gitignore = gitignore or GitignoreMatcher()
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.checks: Dict[str, Tuple[ContentCheck, Set[str]]] = {}
+        self.completed: Set[str] = set()
+        self.retained: Set[str] = set()
+        self.retained_content: Dict[str, List[str]] = {}
+        self.skipped: Dict[str, str] = {}
+        self.cache: Optional[LintCache] = None
+        self.results: Optional[Callable[[], Dict[str, list]]] = None
+        self.timings: Dict[str, float] = {}
+        self.only: Optional[Set[str]] = None
+        self.only_dirs: Set[str] = set()
+
+    def register(self, name: str, function: ContentCheck, ignore: Optional[Iterable[str]] = None) -> None:
+        """
+        Register a content check, which is called for every scanned file.
+
+        :param name: Unique name of the check (usually the name of the linting function it belongs to)
+        :param function: The check itself, called with the file's path, its name and its lines
+        :param ignore: File or directory names, which should not be passed to this check
+        """
+        self.checks[name] = (function, set(ignore) if ignore else set())
+
+    def enable_cache(self, results: Callable[[], Dict[str, list]]) -> None:
+        """
+        Enable the persistent cache of findings for all currently registered checks.
+        Checks report their findings by appending to result lists, so every list they may append to has to be passed.
+
+        :param results: Returns all result lists of the form `{<name>: <list>}`
+        """
+        self.cache = LintCache(self.path, self.checks, self.max_file_size)
+        self.results = results
+
+    def limit_to(self, paths: Iterable[str]) -> None:
+        """
+        Limit all following scans to the given files.
+
+        :param paths: Paths to the files (relative to the project directory or absolute)
+        """
+        self.only = {self._normalize(path) for path in paths}
+        # directories without any of the files are not walked at all
+        self.only_dirs = set()
+        for path in self.only:
+            path = os.path.dirname(path)
+            while path not in self.only_dirs and path != os.path.dirname(path):
+                self.only_dirs.add(path)
+                path = os.path.dirname(path)
+
+    def retain(self, paths: Iterable[str]) -> None:
+        """
+        Keep the content of the given files after the next scan, so other checks can reuse it without reading them again.
+
+        :param paths: Paths to the files (relative to the project directory or absolute)
+        """
+        self.retained |= {self._normalize(path) for path in paths}
+
+    def read_lines(self, file_path: str) -> List[str]:
+        """
+        Return the lines of a file. Files retained during a previous scan are not read again.
+
+        :param file_path: Path to the file (relative to the project directory or absolute)
+        :return: All lines of the file
+        """
+        normalized_path = self._normalize(file_path)
+        if normalized_path in self.retained_content:
+            return self.retained_content[normalized_path]
+        with io.open(normalized_path, "rt", encoding="latin1") as file:
+            return file.readlines()
+
+    def scan(self, names: Optional[List[str]] = None) -> None:
+        """
+        Walk the project directory once and call every selected content check on every file it does not ignore.
+
+        :param names: Names of the checks to run. All registered checks are run if not set.
+        """
+        names = list(self.checks) if names is None else names
+        checks = [self.checks[name] for name in names]
+        if not checks:
+            return
+        # only directories ignored by all checks can be skipped entirely
+        prune = set.intersection(*(ignore for _function, ignore in checks)) | self.ALWAYS_IGNORED
+        log.debug(f"Scanning {self.path} for content checks {names}")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # every file is paired with the names of all checks, which do not ignore it
+            files = (
+                (file_path, fname, [name for name in names if not self.checks[name][1] & parts])
+                for file_path, fname, parts in self._walk(prune)
+            )
+            # read the files chunk wise to keep the memory footprint low on large projects
+            chunk = list(islice(files, self.chunk_size))
+            while chunk:
+                for (file_path, fname, file_checks), scanned in zip(chunk, executor.map(self._read, chunk)):
+                    if scanned is not None:
+                        self._dispatch(file_path, fname, file_checks, scanned)
+                chunk = list(islice(files, self.chunk_size))
+        if self.cache:
+            log.debug(f"Reused cached findings of {self.cache.hits} files")
+            # files outside of a limited scan were not seen, but are still part of the project
+            self.cache.save(drop_unseen=self.only is None)
+
+    def _dispatch(self, file_path: str, fname: str, file_checks: List[str], scanned: ScannedFile) -> None:
+        """
+        Call all checks on a scanned file or replay their cached findings and update the cache.
+
+        :param file_path: Path to the file
+        :param fname: Name of the file
+        :param file_checks: Names of all checks, which do not ignore the file
+        :param scanned: The scanned file
+        """
+        lines, stat, digest, findings = scanned
+        results = self.results() if self.cache and self.results else None
+        if results is not None and findings is not None:
+            for name in file_checks:
+                for key, *result in findings[name]:
+                    results[key].append(LintResult(*result))
+        else:
+            findings = {}
+            for name in file_checks:
+                before = {key: len(values) for key, values in results.items()} if results is not None else {}
+                start = time.perf_counter()
+                self.checks[name][0](file_path, fname, lines)  # type: ignore
+                self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+                if results is not None:
+                    findings[name] = [
+                        [key, result[0], result[1], getattr(result, "file", None), getattr(result, "line", None)]
+                        for key, values in results.items()
+                        for result in values[before[key] :]
+                    ]
+        if self.cache:
+            self.cache.store(self.relative(file_path), stat, digest, findings, hit=lines is None)  # type: ignore
+
+    def _walk(self, prune: Set[str]) -> Iterator[Tuple[str, str, Set[str]]]:
+        """
+        Walk the project directory, skipping all pruned directories and files.
+
+        :param prune: Names of directories and files, which should not be visited at all
+        :return: Tuples of the form `(<file path>, <file name>, <all names on the path relative to the project directory>)`
+        """
+        for root, dirs, files in os.walk(self.path):
+            rel_root = os.path.relpath(root, self.path).replace(os.sep, "/")
+            rel_root = "" if rel_root == os.curdir else f"{rel_root}/"
+            dirs[:] = [
+                directory
+                for directory in dirs
+                if directory not in prune and not self._is_excluded(root, rel_root, directory, is_dir=True)
+            ]
+            rel_parts = set(rel_root.split("/")) - {""}
+            for fname in files:
+                if fname not in prune and not self._is_excluded(root, rel_root, fname, is_dir=False):
+                    yield os.path.join(root, fname), fname, rel_parts | {fname}
+
+    def _is_excluded(self, root: str, rel_root: str, name: str, is_dir: bool) -> bool:
+        """
+        Check whether a walked file or directory is ignored by git or outside of the files the scan is limited to.
+
+        :param root: The walked directory
+        :param rel_root: The walked directory relative to the project directory with forward slashes and a trailing slash
+        :param name: Name of the file or directory
+        :param is_dir: Whether it is a directory
+        :return: True if it should not be visited, False otherwise
+        """
+        if self.gitignore.is_ignored(f"{rel_root}{name}", is_dir):
+            return True
+        if self.only is not None:
+            return self._normalize(os.path.join(root, name)) not in (self.only_dirs if is_dir else self.only)
+        return False
+
+    def _read(self, entry: Tuple[str, str, List[str]]) -> Optional[ScannedFile]:
+        """
+        Read a single file and retain its content if requested. Binary files and too large files are skipped.
+        If the cache holds the findings of all checks for the unchanged file, it is not decoded or not even read at all.
+
+        :param entry: The walked file and the names of all checks, which do not ignore it
+        :return: The scanned file or None, if it was skipped or could not be read
+        """
+        file_path, fname, file_checks = entry
+        if os.path.splitext(fname)[1].lower() in self.BINARY_EXTENSIONS:
+            self.skipped[file_path] = "binary"
+            return None
+        normalized_path = self._normalize(file_path)
+        try:
+            stat = os.stat(file_path)
+            if stat.st_size > self.max_file_size:
+                self.skipped[file_path] = "too large"
+                return None
+            cached = self.cache.get(self.relative(file_path), file_checks) if self.cache else None
+            if (
+                cached
+                and cached["size"] == stat.st_size
+                and cached["mtime_ns"] == stat.st_mtime_ns
+                and normalized_path not in self.retained
+            ):
+                return None, stat, cached["digest"], cached["findings"]
+            with io.open(file_path, "rb") as binary_file:
+                content = binary_file.read()
+        except OSError as e:
+            log.debug(f"Unable to read {file_path}: {e}")
+            return None
+        # a NUL byte does not occur in any text file we care about
+        if b"\0" in content[: self.SNIFF_SIZE]:
+            self.skipped[file_path] = "binary"
+            return None
+        digest = LintCache.digest(content) if self.cache else None
+        if cached and cached["digest"] == digest and normalized_path not in self.retained:
+            return None, stat, digest, cached["findings"]
+        lines = io.TextIOWrapper(io.BytesIO(content), encoding="latin1").readlines()
+        if normalized_path in self.retained:
+            self.retained_content[normalized_path] = lines
+        return lines, stat, digest, None
+
+    def relative(self, file_path: str) -> str:
+        """
+        Get the path of a file relative to the project directory with forward slashes, e.g. to use it as a cache key.
+
+        :param file_path: Path to the file (relative to the project directory or absolute)
+        :return: The relative path
+        """
+        return os.path.relpath(self._normalize(file_path), self._normalize(os.curdir)).replace(os.sep, "/")
+
+    def _normalize(self, file_path: str) -> str:
+        """
+        Normalize a path relative to the project directory, so it can be used as a key.
+
+        :param file_path: Path relative to the project directory or absolute
+        :return: The normalized absolute path
+        """
+        return os.path.normpath(os.path.abspath(os.path.join(self.path, file_path)))
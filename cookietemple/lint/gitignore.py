@@ -0,0 +1,147 @@
+import io
+import os
+import re
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+
+class GitignoreMatcher:
+    """
+    Matches paths relative to a project directory against the patterns of its .gitignore file.
+    Implements the gitignore pattern semantics: comments, negation, directory only patterns, anchoring and the wildcards *, ?, [...] and **.
+    The last matching pattern decides, so consecutive patterns of the same kind are compiled into a single regular expression.
+    Files inside ignored directories are never re-included, which allows callers to prune ignored directories entirely.
+
+    Attributes:
+        runs (list): Compiled runs of consecutive patterns of the form `(<negated>, <file regex>, <directory regex>)`
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.runs: List[Tuple[bool, Optional[Pattern], Optional[Pattern]]] = []
+        # the current run of patterns of the form [(<regex>, <directory only>)]
+        run: List[Tuple[str, bool]] = []
+        run_negated = False
+        for line in patterns:
+            parsed = self._parse(line)
+            if parsed is None:
+                continue
+            regex, negated, dir_only = parsed
+            if run and negated != run_negated:
+                self._add_run(run_negated, run)
+                run = []
+            run.append((regex, dir_only))
+            run_negated = negated
+        if run:
+            self._add_run(run_negated, run)
+
+    @classmethod
+    def from_file(cls, gitignore_path: str) -> "GitignoreMatcher":
+        """
+        Build a matcher from a .gitignore file. A missing file ignores nothing.
+
+        :param gitignore_path: Path to the .gitignore file
+        :return: The matcher
+        """
+        if not os.path.isfile(gitignore_path):
+            return cls()
+        with io.open(gitignore_path, "rt", encoding="latin1") as file:
+            return cls(file.read().splitlines())
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path is ignored.
+
+        :param rel_path: Path relative to the project directory with forward slashes
+        :param is_dir: Whether the path is a directory
+        :return: True if the path is ignored, False otherwise
+        """
+        for negated, file_regex, dir_regex in reversed(self.runs):
+            regex = dir_regex if is_dir else file_regex
+            if regex is not None and regex.match(rel_path):
+                return not negated
+        return False
+
+    def _add_run(self, negated: bool, run: List[Tuple[str, bool]]) -> None:
+        file_patterns = [regex for regex, dir_only in run if not dir_only]
+        self.runs.append(
+            (
+                negated,
+                re.compile("|".join(file_patterns)) if file_patterns else None,
+                re.compile("|".join(regex for regex, _dir_only in run)),
+            )
+        )
+
+    @staticmethod
+    def _parse(line: str) -> Optional[Tuple[str, bool, bool]]:
+        """
+        Parse a single line of a .gitignore file.
+
+        :param line: The line
+        :return: A tuple of the form `(<regex matching the whole path>, <negated>, <directory only>)` or None for blank lines and comments
+        """
+        pattern = line.rstrip("\r\n")
+        # trailing spaces are ignored unless they are escaped
+        while pattern.endswith(" ") and not pattern.endswith("\\ "):
+            pattern = pattern[:-1]
+        if not pattern or pattern.startswith("#"):
+            return None
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not pattern:
+            return None
+        # patterns with a slash at the beginning or in the middle are relative to the .gitignore file, all others match at any level
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        prefix = "" if anchored else "(?:.*/)?"
+        return f"(?:{prefix}{GitignoreMatcher._translate(pattern)})$", negated, dir_only
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """
+        Translate the wildcards of a gitignore pattern into a regular expression.
+
+        :param pattern: The pattern without negation and leading or trailing slashes
+        :return: The regular expression
+        """
+        regex = ""
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+                if i + 2 == len(pattern):
+                    # a trailing /** matches everything inside
+                    regex += ".*"
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    # a leading **/ or a /**/ matches zero or more directories
+                    regex += "(?:.*/)?"
+                    i += 3
+                    continue
+            if char == "*":
+                regex += "[^/]*"
+                while pattern.startswith("*", i + 1):
+                    i += 1
+            elif char == "?":
+                regex += "[^/]"
+            elif char == "[":
+                end = pattern.find("]", i + 2)
+                if end == -1:
+                    regex += re.escape(char)
+                else:
+                    members = pattern[i + 1 : end]
+                    negate = members[0] in "!^"
+                    if negate:
+                        members = members[1:]
+                    members = members.replace("\\", "\\\\").replace("[", "\\[")
+                    regex += f"[^/{members}]" if negate else f"(?!/)[{members}]"
+                    i = end
+            elif char == "\\" and i + 1 < len(pattern):
+                i += 1
+                regex += re.escape(pattern[i])
+            else:
+                regex += re.escape(char)
+            i += 1
+        return regex
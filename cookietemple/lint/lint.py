@@ -1,22 +1,37 @@
+import importlib
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Optional, Set, Type, Union
 
+import git  # type: ignore
 from ruamel.yaml import YAML
 
 from cookietemple.lint.domains.cli import CliJavaLint, CliPythonLint
+from cookietemple.lint.domains.external import ExternalLint
 from cookietemple.lint.domains.gui import GuiJavaLint
 from cookietemple.lint.domains.lib import LibCppLint
 from cookietemple.lint.domains.pub import PubLatexLint
 from cookietemple.lint.domains.web import WebWebsitePythonLint
+from cookietemple.lint.lint_report import lint_report_json, lint_report_sarif
 from cookietemple.lint.template_linter import TemplateLinter
+from cookietemple.util.profiler import profiler
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
 
-def lint_project(project_dir: str, skip_external: bool, is_create: bool = False) -> Optional[TemplateLinter]:
+@profiler.profile("lint_project", "lint")
+def lint_project(
+    project_dir: str,
+    skip_external: bool,
+    is_create: bool = False,
+    jobs: int = 1,
+    use_cache: bool = True,
+    changed_since: Optional[str] = None,
+    output_format: str = "rich",
+) -> Optional[TemplateLinter]:
     """
     Verifies the integrity of a project to best coding and practices.
     Runs a set of general linting functions, which all templates share and afterwards runs template specific linting functions.
@@ -25,7 +40,15 @@ def lint_project(project_dir: str, skip_external: bool, is_create: bool = False)
     :param project_dir: The path to the .cookietemple.yml file.
     :param skip_external: Whether to skip external linters such as autopep8
     :param is_create: Whether linting is called during project creation
+    :param jobs: Number of processes to run independent linting functions in
+    :param use_cache: Whether to reuse the findings of unchanged files from previous runs (never used during project creation)
+    :param changed_since: Only check the content of files, which differ from this git ref. Structural checks always run in full.
+    :param output_format: Format of the results: rich for the terminal, json or sarif (printed to stdout) for other tools.
+                          Other tools read the results unattended, so external linters (which prompt) are skipped for them.
     """
+    report_switcher = {"json": lint_report_json, "sarif": lint_report_sarif}
+    if output_format in report_switcher:
+        skip_external = True
     # Detect which template the project is based on
     template_handle = get_template_handle(project_dir)
     log.debug(f"Detected handle {template_handle}")
@@ -40,10 +63,18 @@ def lint_project(project_dir: str, skip_external: bool, is_create: bool = False)
     }
 
     try:
-        lint_obj: Union[TemplateLinter, Any] = switcher.get(template_handle)(project_dir)  # type: ignore
+        linter_class = switcher.get(template_handle) or load_external_linter(template_handle)
+        lint_obj: Union[TemplateLinter, Any] = linter_class(project_dir)  # type: ignore
     except TypeError:
         console.print(f"[bold red]Unable to find linter for handle {template_handle}! Aborting...")
         sys.exit(1)
+    lint_obj.jobs = jobs
+    if use_cache and not is_create:
+        lint_obj.enable_cache()
+    if changed_since:
+        changed_files = get_changed_files(project_dir, changed_since)
+        console.print(f"[bold blue]Checking the content of {len(changed_files)} files changed since {changed_since}")
+        lint_obj.scanner.limit_to(changed_files)
 
     # Run the linting tests
     try:
@@ -77,7 +108,10 @@ def lint_project(project_dir: str, skip_external: bool, is_create: bool = False)
         return lint_obj
 
     # Print the results
-    lint_obj.print_results()
+    if output_format in report_switcher:
+        print(report_switcher[output_format](lint_obj))
+    else:
+        lint_obj.print_results()
 
     # Exit code
     if len(lint_obj.failed) > 0:
@@ -87,6 +121,28 @@ def lint_project(project_dir: str, skip_external: bool, is_create: bool = False)
     return None
 
 
+def load_external_linter(template_handle: str) -> Optional[Type[TemplateLinter]]:
+    """
+    Load the linter of a template of an external catalog. Its module is only imported now.
+
+    :param template_handle: The handle of the template
+    :return: The linter class, ExternalLint if the catalog does not provide one, or None if the template is unknown
+    """
+    from cookietemple.common.template_catalog import load_template_catalog
+
+    template = load_template_catalog().get(template_handle)
+    if template is None:
+        return None
+    if not template["linter"]:
+        return ExternalLint
+    module_name, _, class_name = template["linter"].partition(":")
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        console.print(f"[bold red]Unable to load linter {template['linter']} of {template_handle}: {e}")
+        sys.exit(1)
+
+
 def get_template_handle(dot_cookietemple_path: str = ".cookietemple.yml") -> str:
     """
     Reads the .cookietemple file and extracts the template handle
@@ -101,3 +157,25 @@ def get_template_handle(dot_cookietemple_path: str = ".cookietemple.yml") -> str
     dot_cookietemple_content = yaml.load(path)
 
     return dot_cookietemple_content["template_handle"]
+
+
+def get_changed_files(project_dir: str, ref: str) -> Set[str]:
+    """
+    Get all files of a project, which differ from a git ref. Staged, unstaged and untracked files are included.
+
+    :param project_dir: Path to the project directory, which has to be part of a git repository
+    :param ref: Any git ref like a branch, a tag or a commit hash
+    :return: Absolute paths of all changed files, which still exist
+    """
+    try:
+        repo = git.Repo(project_dir, search_parent_directories=True)
+        diff = repo.git.diff("--name-only", "--no-renames", "-z", ref, "--")
+    except git.exc.InvalidGitRepositoryError:
+        console.print(f"[bold red]{project_dir} is not a git repository! Unable to lint files changed since {ref}.")
+        sys.exit(1)
+    except git.exc.GitCommandError as e:
+        console.print(f"[bold red]Unable to get the files changed since {ref}:\n{e.stderr.strip()}")
+        sys.exit(1)
+    changed_files = set(filter(None, diff.split("\0"))) | set(repo.untracked_files)
+    paths = {os.path.join(repo.working_tree_dir, changed_file) for changed_file in changed_files}
+    return {path for path in paths if os.path.isfile(path)}
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional
+
+import cookietemple
+from cookietemple.util.dir_util import user_cache_path
+
+log = logging.getLogger(__name__)
+
+# the findings of all projects are cached in this directory of the user cache directory, so linting never writes to the project
+LINT_CACHE_NAME = "lint"
+
+# Findings of all content checks for a single file of the form `{<check name>: [[<result list>, <code>, <message>, <file>, <line>]]}`
+Findings = Dict[str, List[List[str]]]
+
+
+class LintCache:
+    """
+    Persistent cache of the per-file findings of content checks of a project, stored in the user cache directory and keyed by the project's absolute path.
+    A file is identified by its path relative to the project directory.
+    Its findings are reused if its size and modification time are unchanged or, if only the modification time changed, its content hash is unchanged.
+    The whole cache is discarded if the cookietemple version, the set of registered content checks or the maximum file size changed.
+
+    Attributes:
+        cache_file (str): Path to the cache file.
+        fingerprint (str): Hash of the cookietemple version, the names of all registered content checks and the maximum file size.
+        entries (dict): Cached files of the form `{<relative path>: {"size": .., "mtime_ns": .., "digest": .., "findings": ..}}`
+        hits (int): Number of files, whose findings were reused.
+    """
+
+    # increased whenever the format of the findings changes
+    CACHE_FORMAT = 3
+
+    def __init__(self, path: str, check_names: Iterable[str], max_file_size: int):
+        real_path = os.path.realpath(path)
+        path_hash = hashlib.sha256(real_path.encode("utf-8")).hexdigest()[:16]
+        self.cache_file = os.path.join(user_cache_path(LINT_CACHE_NAME), f"{path_hash}-{os.path.basename(real_path)}.json")
+        self.fingerprint = hashlib.sha256(
+            "\n".join(
+                [cookietemple.__version__, str(self.CACHE_FORMAT), str(max_file_size), *sorted(check_names)]
+            ).encode("utf-8")
+        ).hexdigest()
+        self.entries: Dict[str, dict] = self._load()
+        self.seen: Dict[str, dict] = {}
+        self.hits = 0
+
+    def get(self, rel_path: str, checks: List[str]) -> Optional[dict]:
+        """
+        Get the cache entry of a file, if the findings of all given checks are cached for it.
+        The caller has to verify the entry's size, modification time or content hash against the file.
+
+        :param rel_path: Path of the file relative to the project directory
+        :param checks: Names of all checks, which have to be cached for the file
+        :return: The cache entry or None
+        """
+        entry = self.entries.get(rel_path)
+        if entry and all(check in entry["findings"] for check in checks):
+            return entry
+        return None
+
+    def store(self, rel_path: str, stat: os.stat_result, digest: str, findings: Findings, hit: bool = False) -> None:
+        """
+        Store the findings of a file. Findings of checks, which did not run this time, are kept if the content is unchanged.
+
+        :param rel_path: Path of the file relative to the project directory
+        :param stat: Result of stat for the file
+        :param digest: Hash of the file's content
+        :param findings: Findings of all checks, which ran on the file
+        :param hit: Whether the findings were reused from the cache
+        """
+        previous = self.seen.get(rel_path) or self.entries.get(rel_path)
+        if previous and previous["digest"] == digest:
+            findings = {**previous["findings"], **findings}
+        self.seen[rel_path] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest,
+            "findings": findings,
+        }
+        if hit:
+            self.hits += 1
+
+    def save(self, drop_unseen: bool = True) -> None:
+        """
+        Write all files seen since the cache was loaded to the cache file.
+
+        :param drop_unseen: Whether to drop all files, which were not seen anymore (e.g. because they were deleted)
+        """
+        if not drop_unseen:
+            self.seen = {**self.entries, **self.seen}
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump({"fingerprint": self.fingerprint, "files": self.seen}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            log.debug(f"Unable to write lint cache {self.cache_file}: {e}")
+        self.entries, self.seen = self.seen, {}
+
+    @staticmethod
+    def digest(content: bytes) -> str:
+        """
+        Hash the content of a file.
+
+        :param content: The raw content of the file
+        :return: The hex digest of the content
+        """
+        return hashlib.sha1(content).hexdigest()
+
+    def _load(self) -> Dict[str, dict]:
+        """
+        Load the cache file, if it exists and was written by the same cookietemple version with the same content checks and maximum file size.
+
+        :return: All cached files
+        """
+        try:
+            with open(self.cache_file) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("fingerprint") != self.fingerprint:
+            log.debug(f"Discarding outdated lint cache {self.cache_file}")
+            return {}
+        return cache.get("files", {})
@@ -0,0 +1,151 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import cookietemple
+
+LINT_DOCS_URL = "https://cookietemple.readthedocs.io/en/latest/lint.html"
+# levels of the result lists of a linter in the order they are reported
+RESULT_LEVELS = {"failed": "error", "warned": "warning", "passed": "none"}
+
+
+class LintResult(tuple):
+    """
+    A linting result of the form `(<code>, <message>)`, which additionally carries the file and line it refers to.
+    It can be used everywhere a plain result tuple is expected.
+    """
+
+    def __new__(cls, code: str, message: str, file: Optional[str] = None, line: Optional[int] = None):
+        result = super().__new__(cls, (code, message))
+        result.file = file
+        result.line = line
+        return result
+
+    def __getnewargs__(self):
+        # required to pickle results returned by the workers of the linting process pool
+        return self[0], self[1], self.file, self.line
+
+
+def lint_records(linter) -> List[Dict[str, Any]]:
+    """
+    Convert all results of a linter into records. Failures are listed first, followed by warnings and passed checks.
+
+    :param linter: The linter, which already ran
+    :return: Records of the form `{"check_id": .., "level": .., "file": .., "line": .., "message": ..}`
+    """
+    return [
+        {
+            "check_id": str(result[0]),
+            "level": level,
+            "file": getattr(result, "file", None),
+            "line": getattr(result, "line", None),
+            "message": result[1],
+        }
+        for result_list, level in RESULT_LEVELS.items()
+        for result in getattr(linter, result_list)
+    ]
+
+
+def skipped_file_records(linter) -> List[Dict[str, str]]:
+    """
+    List all files, which the content checks skipped, because they are binary or larger than the maximum file size.
+
+    :param linter: The linter, which already ran
+    :return: Records of the form `{"file": .., "reason": ..}` sorted by file
+    """
+    scanner = getattr(linter, "scanner", None)
+    if scanner is None:
+        return []
+    return sorted(
+        ({"file": scanner.relative(file_path), "reason": reason} for file_path, reason in scanner.skipped.items()),
+        key=lambda record: record["file"],
+    )
+
+
+def lint_report_json(linter) -> str:
+    """
+    Create a JSON report of all results of a linter including the time every linting function took
+    and the files the content checks skipped.
+
+    :param linter: The linter, which already ran
+    :return: The report
+    """
+    skipped_files = skipped_file_records(linter)
+    report = {
+        "version": cookietemple.__version__,
+        "project": linter.path,
+        "summary": {
+            **{result_list: len(getattr(linter, result_list)) for result_list in RESULT_LEVELS},
+            "skipped": len(skipped_files),
+        },
+        "results": lint_records(linter),
+        "skipped_files": skipped_files,
+        "check_timings": linter.check_timings,
+    }
+    return json.dumps(report, indent=2)
+
+
+def lint_report_sarif(linter) -> str:
+    """
+    Create a SARIF 2.1.0 report of all results of a linter. The time every linting function took is part of the invocation's properties.
+    Every file skipped by the content checks is reported as a tool execution notification of the invocation and counted in the run's properties.
+
+    :param linter: The linter, which already ran
+    :return: The report
+    """
+    results = []
+    for record in lint_records(linter):
+        result: Dict[str, Any] = {
+            "ruleId": record["check_id"],
+            "kind": "pass" if record["level"] == "none" else "fail",
+            "level": record["level"],
+            "message": {"text": record["message"]},
+        }
+        if record["file"]:
+            location: Dict[str, Any] = {"artifactLocation": {"uri": record["file"], "uriBaseId": "PROJECTROOT"}}
+            if record["line"]:
+                location["region"] = {"startLine": record["line"]}
+            result["locations"] = [{"physicalLocation": location}]
+        results.append(result)
+    rules = [
+        {"id": check_id, "helpUri": f"{LINT_DOCS_URL}#{check_id}"}
+        for check_id in sorted({result["ruleId"] for result in results})
+    ]
+    skipped_files = skipped_file_records(linter)
+    notifications = [
+        {
+            "level": "note",
+            "message": {"text": f"Skipped by content checks ({record['reason']})."},
+            "locations": [
+                {"physicalLocation": {"artifactLocation": {"uri": record["file"], "uriBaseId": "PROJECTROOT"}}}
+            ],
+        }
+        for record in skipped_files
+    ]
+    report = {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "cookietemple",
+                        "version": cookietemple.__version__,
+                        "informationUri": LINT_DOCS_URL,
+                        "rules": rules,
+                    }
+                },
+                "originalUriBaseIds": {"PROJECTROOT": {"uri": f"{Path(linter.path).resolve().as_uri()}/"}},
+                "invocations": [
+                    {
+                        "executionSuccessful": True,
+                        "toolExecutionNotifications": notifications,
+                        "properties": {"checkTimings": linter.check_timings},
+                    }
+                ],
+                "results": results,
+                "properties": {"skippedFiles": len(skipped_files)},
+            }
+        ],
+    }
+    return json.dumps(report, indent=2)
@@ -1,19 +1,28 @@
 import configparser
-import io
 import logging
 import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 import rich.markdown
 import rich.panel
 import rich.progress
 
+from cookietemple.lint.cookiecutter_strings import find_cookiecutter_lines
+from cookietemple.lint.file_scanner import FileScanner
+from cookietemple.lint.gitignore import GitignoreMatcher
+from cookietemple.lint.lint_report import LintResult
 from cookietemple.util.dir_util import pf
 from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
+# the linter of a worker of the linting process pool
+_worker_linter: Optional["TemplateLinter"] = None
+
 
 class TemplateLinter(object):
     """Object to hold linting information and results.
@@ -23,6 +32,9 @@ class TemplateLinter(object):
         failed (list): A list of tuples of the form: `(<error no>, <reason>)`
         passed (list): A list of tuples of the form: `(<passed no>, <reason>)`
         warned (list): A list of tuples of the form: `(<warned no>, <reason>)`
+        scanner (FileScanner): Walks the project once for all registered content checks.
+        jobs (int): Number of processes to run independent linting functions in.
+        check_timings (dict): Wall-clock time in seconds every linting function took of the form `{<linting function>: <seconds>}`
     """
 
     def __init__(self, path="."):
@@ -31,6 +43,15 @@ class TemplateLinter(object):
         self.passed = []
         self.warned = []
         self.failed = []
+        self.jobs = 1
+        self.check_timings: Dict[str, float] = {}
+        self.scanner = FileScanner(
+            path,
+            max_file_size=self._load_max_file_size(),
+            gitignore=GitignoreMatcher.from_file(os.path.join(path, ".gitignore")),
+        )
+        self.scanner.register("check_cookietemple_todos", self._check_todo_lines)
+        self.scanner.register("check_no_cookiecutter_strings", self._check_cookiecutter_lines)
 
     def lint_project(
         self, calling_class, check_functions: list = None, custom_check_files: bool = False, is_subclass_calling=True
@@ -41,6 +62,8 @@ class TemplateLinter(object):
         and returns summary at completion. Raises an exception if there is a
         critical error that makes the rest of the tests pointless (eg. no
         project script). Results from this function are printed by the main script.
+        If more than one job is configured, independent linting functions run in a process pool.
+        Their results are merged in the same order a serial run would produce them.
 
         :param calling_class: The class that calls the function -> used to get the class methods, which are the linting methods
         :param check_functions: List of functions of the calling class that should be checked. If not set, the default TemplateLinter check functions are called
@@ -48,6 +71,7 @@ class TemplateLinter(object):
         :param is_subclass_calling: Indicates whether a domain specific linter calls the linting or not
         """
         # Called on its own, so not from a subclass -> run general linting
+        is_general_linting = check_functions is None
         if check_functions is None:
             # Fetch all general linting functions
             check_functions = [
@@ -57,29 +81,88 @@ class TemplateLinter(object):
             ]
             # Remove internal functions
             check_functions = list(
-                set(check_functions).difference({"lint_project", "print_results", "check_version_match"})
+                set(check_functions).difference(
+                    {"lint_project", "print_results", "check_version_match", "enable_cache"}
+                )
             )
             log.debug(f"Linting functions of general linting are:\n {check_functions}")
         # Some templates (e.g. latex based) do not adhere to the common programming based templates and therefore do not need to check for e.g. docs
         if custom_check_files:
             check_functions.remove("check_files_exist")
+        # All content checks share a single walk of the project. The general linting also runs those registered by domain linters.
+        content_checks = list(self.scanner.checks) if is_general_linting else []
+        content_checks += [
+            func for func in check_functions if func in self.scanner.checks and func not in content_checks
+        ]
+        content_checks = [func for func in content_checks if func not in self.scanner.completed]
+        # sorted, so results are reported in the same order by serial and parallel runs
+        check_functions = sorted(func for func in check_functions if func not in self.scanner.checks)
+        if "check_version_consistent" in check_functions:
+            self.scanner.retain(path for _section, path in self._load_bumpversion_files())
 
         progress = rich.progress.Progress(
             "[bold green]{task.description}",
             rich.progress.BarColumn(bar_width=None),
             "[bold yellow]{task.completed} of {task.total}[reset] [bold green]{task.fields[func_name]}",
+            console=console,
         )
         with progress:
             lint_progress = progress.add_task(
-                "Running lint checks", total=len(check_functions), func_name=check_functions
+                "Running lint checks", total=len(check_functions) + len(content_checks), func_name=check_functions
             )
+            if content_checks:
+                log.debug(f"Running content linting functions: {content_checks}")
+                self.scanner.scan(content_checks)
+                self.scanner.completed.update(content_checks)
+                self.check_timings.update({func: self.scanner.timings.get(func, 0.0) for func in content_checks})
+                progress.update(lint_progress, advance=len(content_checks), func_name=", ".join(content_checks))
+            if self.jobs > 1 and len(check_functions) > 1:
+                self._run_check_functions_in_pool(
+                    isinstance(calling_class, super), check_functions, is_subclass_calling, progress, lint_progress
+                )
+                return
             for fun_name in check_functions:
                 log.debug(f"Running linting function: {fun_name}")
                 progress.update(lint_progress, advance=1, func_name=fun_name)
+                start = time.perf_counter()
                 if fun_name == "check_files_exist":
                     getattr(calling_class, fun_name)(is_subclass_calling)
                 else:
                     getattr(calling_class, fun_name)()
+                self.check_timings[fun_name] = time.perf_counter() - start
+
+    def _run_check_functions_in_pool(
+        self, is_general: bool, check_functions: List[str], is_subclass_calling: bool, progress, lint_progress
+    ) -> None:
+        """
+        Run the linting functions in a process pool. Linting functions are independent of each other, so all of them run in parallel.
+        Every worker returns the results of its linting function, which are merged in the given order afterwards.
+
+        :param is_general: Whether the general TemplateLinter linting functions should be called instead of the domain specific ones
+        :param check_functions: Ordered names of the linting functions to run
+        :param is_subclass_calling: Indicates whether a domain specific linter calls the linting or not
+        :param progress: The progress bar to update
+        :param lint_progress: The task of the progress bar
+        """
+        results: Dict[str, Tuple[list, list, list]] = {}
+        # the workers build their own linter of the project once, so tasks only carry the name of the linting function
+        with ProcessPoolExecutor(
+            max_workers=self.jobs, initializer=init_check_worker, initargs=(self.__class__, self.path)
+        ) as executor:
+            log.debug(f"Running linting functions in parallel: {check_functions}")
+            futures = {
+                fun_name: executor.submit(run_check_function, fun_name, is_general, is_subclass_calling)
+                for fun_name in check_functions
+            }
+            for fun_name in check_functions:
+                passed, warned, failed, self.check_timings[fun_name] = futures[fun_name].result()
+                results[fun_name] = (passed, warned, failed)
+                progress.update(lint_progress, advance=1, func_name=fun_name)
+        for fun_name in check_functions:
+            passed, warned, failed = results[fun_name]
+            self.passed += passed
+            self.warned += warned
+            self.failed += failed
 
     def check_files_exist(self, is_subclass_calling=True):
         """Checks a given project directory for required files.
@@ -138,7 +221,7 @@ class TemplateLinter(object):
 
         # First - critical files. Check that this is actually a cookietemple based project
         if not os.path.isfile(pf(self, ".cookietemple.yml")):
-            print("[bold red] .cookietemple.yml not found! Is this a cookietemple project?")
+            console.print("[bold red] .cookietemple.yml not found! Is this a cookietemple project?")
             sys.exit(1)
 
         files_exist_linting(self, files_fail, files_fail_ifexists, files_warn, files_warn_ifexists, is_subclass_calling)
@@ -161,62 +244,23 @@ class TemplateLinter(object):
 
         # Implicitly also checks if empty.
         if "FROM " in content:
-            self.passed.append(("general-2", "Dockerfile check passed"))
+            self.passed.append(LintResult("general-2", "Dockerfile check passed", "Dockerfile"))
             self.dockerfile = [line.strip() for line in content.splitlines()]
             return
 
-        self.failed.append((2, "Dockerfile check failed"))
+        self.failed.append(LintResult("general-2", "Dockerfile check failed", "Dockerfile"))
 
     def check_cookietemple_todos(self) -> None:
         """
         Go through all template files looking for the string 'TODO COOKIETEMPLE:' or 'COOKIETEMPLE TODO:'
         """
-        ignore = [".git"]
-        if os.path.isfile(os.path.join(self.path, ".gitignore")):
-            with io.open(os.path.join(self.path, ".gitignore"), "rt", encoding="latin1") as file:
-                for line in file:
-                    ignore.append(os.path.basename(line.strip().rstrip("/")))
-        for root, dirs, files in os.walk(self.path):
-            # Ignore files
-            for ignore_file in ignore:
-                if ignore_file in dirs:
-                    dirs.remove(ignore_file)
-                if ignore_file in files:
-                    files.remove(ignore_file)
-            for fname in files:
-                with io.open(os.path.join(root, fname), "rt", encoding="latin1") as file:
-                    for line in file:
-                        if any(todostring in line for todostring in ["TODO COOKIETEMPLE:", "COOKIETEMPLE TODO:"]):
-                            line = (
-                                line.replace("<!--", "")
-                                .replace("-->", "")
-                                .replace("# TODO COOKIETEMPLE: ", "")
-                                .replace("// TODO COOKIETEMPLE: ", "")
-                                .replace("TODO COOKIETEMPLE: ", "")
-                                .replace("# COOKIETEMPLE TODO: ", "")
-                                .replace("// COOKIETEMPLE TODO: ", "")
-                                .replace("COOKIETEMPLE TODO: ", "")
-                                .strip()
-                            )
-                            self.warned.append(
-                                ("general-3", f"TODO string found in {self._wrap_quotes(fname)}: {line}")
-                            )
+        self.scanner.scan(["check_cookietemple_todos"])
 
     def check_no_cookiecutter_strings(self) -> None:
         """
         Verifies that no cookiecutter strings are in any of the files
         """
-        for root, _dirs, files in os.walk(self.path):
-            for fname in files:
-                with io.open(os.path.join(root, fname), "rt", encoding="latin1") as file:
-                    if file.name.endswith(".pyc"):
-                        continue
-                    for line in file:
-                        # TODO We should also add some of the more advanced cookiecutter if statements, raw statements etc
-                        regex = re.compile(r"{\s?.* cookiecutter.*\s?}")  # noqa W605
-                        if regex.search(line):
-                            line = f"{line[:50 - len(fname)]}.."
-                            self.warned.append(("general-4", f"Cookiecutter string found in '{fname}': {line}"))
+        self.scanner.scan(["check_no_cookiecutter_strings"])
 
     def check_version_consistent(self) -> None:
         """
@@ -224,18 +268,13 @@ class TemplateLinter(object):
         """
         parser = configparser.ConfigParser()
         parser.read(f"{self.path}/cookietemple.cfg")
-        sections = ["bumpversion_files_whitelisted", "bumpversion_files_blacklisted"]
 
         try:
             current_version = parser.get("bumpversion", "current_version")
-            cwd = os.getcwd()
-            os.chdir(self.path)
 
             # check if the version matches current version in each listed file (depending on whitelisted or blacklisted)
-            for section in sections:
-                for _file, path in parser.items(section):
-                    self.check_version_match(path, current_version, section)
-            os.chdir(cwd)
+            for section, path in self._load_bumpversion_files(parser):
+                self.check_version_match(path, current_version, section)
             # Pass message if there weren't any inconsistencies within the version numbers
             if not any("general-5" in tup[0] for tup in self.failed):
                 self.passed.append(("general-5", "Versions were consistent over all files"))
@@ -251,24 +290,26 @@ class TemplateLinter(object):
         :param version: The current version of the project specified in the cookietemple.cfg file
         :param section: The current section (blacklisted or whitelisted files)
         """
-        with open(path) as file:
-            for line in file:
-                # if a tag is found and (depending on wether it is a white or blacklisted file) check if the versions are matching
-                if (
-                    "<<COOKIETEMPLE_NO_BUMP>>" not in line and not section == "bumpversion_files_blacklisted"
-                ) or "<<COOKIETEMPLE_FORCE_BUMP>>" in line:
-                    line_version = re.search(r"(?<!\.)\d+(?:\.\d+){2}(?:-SNAPSHOT)?(?!\.)", line)
-                    if line_version:
-                        line_version = line_version.group(0)  # type: ignore
-                        # No match between the current version number and version in source code file
-                        if line_version != version:
-                            corrected_line = re.sub(r"(?<!\.)\d+(?:\.\d+){2}(?:-SNAPSHOT)?(?!\.)", version, line)
-                            self.failed.append(
-                                (
-                                    "general-5",
-                                    f"Version number don´t match in\n {path}: \n {line.strip()} should be {corrected_line.strip()}",
-                                )
+        # files listed in the cookietemple.cfg may already have been read while scanning the project
+        for line_number, line in enumerate(self.scanner.read_lines(path), start=1):
+            # if a tag is found and (depending on wether it is a white or blacklisted file) check if the versions are matching
+            if (
+                "<<COOKIETEMPLE_NO_BUMP>>" not in line and not section == "bumpversion_files_blacklisted"
+            ) or "<<COOKIETEMPLE_FORCE_BUMP>>" in line:
+                line_version = re.search(r"(?<!\.)\d+(?:\.\d+){2}(?:-SNAPSHOT)?(?!\.)", line)
+                if line_version:
+                    line_version = line_version.group(0)  # type: ignore
+                    # No match between the current version number and version in source code file
+                    if line_version != version:
+                        corrected_line = re.sub(r"(?<!\.)\d+(?:\.\d+){2}(?:-SNAPSHOT)?(?!\.)", version, line)
+                        self.failed.append(
+                            LintResult(
+                                "general-5",
+                                f"Version number don´t match in\n {path}: \n {line.strip()} should be {corrected_line.strip()}",
+                                self.scanner.relative(path),
+                                line_number,
                             )
+                        )
 
     def print_results(self):
         console.print()
@@ -280,6 +321,14 @@ class TemplateLinter(object):
             overflow="ellipsis",
             highlight=False,
         )
+        if self.scanner.skipped:
+            binary_files = sum(1 for reason in self.scanner.skipped.values() if reason == "binary")
+            console.print(
+                f"     [bold blue][[-]] {len(self.scanner.skipped):>4} files skipped by content checks "
+                f"({binary_files} binary, {len(self.scanner.skipped) - binary_files} larger than {self.scanner.max_file_size // 1024} KB)",
+                overflow="ellipsis",
+                highlight=False,
+            )
 
         # Helper function to format test links nicely
         def format_result(test_results):
@@ -308,6 +357,105 @@ class TemplateLinter(object):
             console.rule("[bold red][[\u2717]] Test Failures", style="red")
             console.print(rich.panel.Panel(format_result(self.failed), style="red"), overflow="ellipsis")
 
+    def _check_todo_lines(self, file_path: str, fname: str, lines: List[str]) -> None:
+        """
+        Content check for TODO strings of a single file. Called by the scanner.
+
+        :param file_path: Path to the file
+        :param fname: Name of the file
+        :param lines: All lines of the file
+        """
+        for line_number, line in enumerate(lines, start=1):
+            if any(todostring in line for todostring in ["TODO COOKIETEMPLE:", "COOKIETEMPLE TODO:"]):
+                line = (
+                    line.replace("<!--", "")
+                    .replace("-->", "")
+                    .replace("# TODO COOKIETEMPLE: ", "")
+                    .replace("// TODO COOKIETEMPLE: ", "")
+                    .replace("TODO COOKIETEMPLE: ", "")
+                    .replace("# COOKIETEMPLE TODO: ", "")
+                    .replace("// COOKIETEMPLE TODO: ", "")
+                    .replace("COOKIETEMPLE TODO: ", "")
+                    .strip()
+                )
+                self.warned.append(
+                    LintResult(
+                        "general-3",
+                        f"TODO string found in {self._wrap_quotes(fname)}: {line}",
+                        self.scanner.relative(file_path),
+                        line_number,
+                    )
+                )
+
+    def _check_cookiecutter_lines(self, file_path: str, fname: str, lines: List[str]) -> None:
+        """
+        Content check for remaining cookiecutter strings of a single file. Called by the scanner.
+
+        :param file_path: Path to the file
+        :param fname: Name of the file
+        :param lines: All lines of the file
+        """
+        for line_number, line in find_cookiecutter_lines(lines):
+            line = f"{line[:50 - len(fname)]}.."
+            self.warned.append(
+                LintResult(
+                    "general-4",
+                    f"Cookiecutter string found in '{fname}': {line}",
+                    self.scanner.relative(file_path),
+                    line_number,
+                )
+            )
+
+    def enable_cache(self) -> None:
+        """
+        Enable the persistent cache of content check findings in the user cache directory.
+        Has to be called after all content checks have been registered.
+        """
+        self.scanner.enable_cache(self._result_lists)
+
+    def _result_lists(self) -> Dict[str, list]:
+        """
+        Get all result lists, which content checks append their findings to. Called by the scanner.
+
+        :return: The result lists of the form `{<name>: <list>}`
+        """
+        return {"passed": self.passed, "warned": self.warned, "failed": self.failed}
+
+    def _load_max_file_size(self) -> int:
+        """
+        Load the size above which files are skipped by all content checks from the optional lint section of the project's cookietemple.cfg file.
+
+        :return: The maximum file size in bytes
+        """
+        parser = configparser.ConfigParser()
+        parser.read(f"{self.path}/cookietemple.cfg")
+        try:
+            return parser.getint("lint", "max_file_size_kb", fallback=FileScanner.DEFAULT_MAX_FILE_SIZE // 1024) * 1024
+        except ValueError:
+            console.print(
+                "[bold yellow]Invalid max_file_size_kb in the lint section of your cookietemple.cfg! "
+                f"Using the default of {FileScanner.DEFAULT_MAX_FILE_SIZE // 1024} KB."
+            )
+            return FileScanner.DEFAULT_MAX_FILE_SIZE
+
+    def _load_bumpversion_files(self, parser: configparser.ConfigParser = None) -> List[Tuple[str, str]]:
+        """
+        Load all files listed in the bumpversion sections of the project's cookietemple.cfg file.
+
+        :param parser: An already parsed cookietemple.cfg file. If not set, the project's cookietemple.cfg file is read.
+        :return: Tuples of the form `(<section>, <file path>)`
+        """
+        if parser is None:
+            parser = configparser.ConfigParser()
+            parser.read(f"{self.path}/cookietemple.cfg")
+        sections = ["bumpversion_files_whitelisted", "bumpversion_files_blacklisted"]
+        return [
+            (section, path)
+            for section in sections
+            if parser.has_section(section)
+            for _file, path in parser.items(section)
+        ]
+
     def _wrap_quotes(self, files):
         if not isinstance(files, list):
             files = [files]
@@ -322,6 +470,37 @@ class TemplateLinter(object):
         return ansi_escape.sub(replace_with, string)
 
 
+def init_check_worker(linter_class, path: str) -> None:
+    """
+    Create the linter of a worker of the linting process pool. It is reused by all linting functions the worker runs.
+
+    :param linter_class: The class of the linter
+    :param path: Path to the project directory
+    """
+    global _worker_linter
+    _worker_linter = linter_class(path)
+
+
+def run_check_function(fun_name: str, is_general: bool, is_subclass_calling: bool):
+    """
+    Run a single linting function on a fresh result set. Used by the workers of the linting process pool.
+
+    :param fun_name: Name of the linting function
+    :param is_general: Whether the general TemplateLinter linting function should be called instead of the domain specific one
+    :param is_subclass_calling: Indicates whether a domain specific linter calls the linting or not
+    :return: The passed, warned and failed results of the linting function and the time it took
+    """
+    linter = _worker_linter
+    linter.passed, linter.warned, linter.failed = [], [], []
+    start = time.perf_counter()
+    calling_class = super(linter.__class__, linter) if is_general else linter
+    if fun_name == "check_files_exist":
+        getattr(calling_class, fun_name)(is_subclass_calling)
+    else:
+        getattr(calling_class, fun_name)()
+    return linter.passed, linter.warned, linter.failed, time.perf_counter() - start
+
+
 def files_exist_linting(
     self,
     files_fail: list,
@@ -347,7 +526,7 @@ def files_exist_linting(
     for files in files_fail:
         if not any([os.path.isfile(pf(self, f)) for f in files]):
             all_exists = False
-            self.failed.append(("{handle}-1", f"File not found: {self._wrap_quotes(files)}"))
+            self.failed.append(LintResult(f"{handle}-1", f"File not found: {self._wrap_quotes(files)}", files[0]))
     # flag that indiactes whether all required files exist or not
     if all_exists:
         # called linting from a specific template linter
@@ -363,19 +542,19 @@ def files_exist_linting(
             # pass cause if a file was found it will be summarised in one "all required files found" statement
             pass
         else:
-            self.warned.append((f"{handle}-1", f"File not found: {self._wrap_quotes(files)}"))
+            self.warned.append(LintResult(f"{handle}-1", f"File not found: {self._wrap_quotes(files)}", files[0]))
 
     # Files that cause an error if they exist
     for file in files_fail_ifexists:
         if os.path.isfile(pf(self, file)):
-            self.failed.append((f"{handle}-1", f"File must be removed: {self._wrap_quotes(file)}"))
+            self.failed.append(LintResult(f"{handle}-1", f"File must be removed: {self._wrap_quotes(file)}", file))
         else:
             self.passed.append((f"{handle}-1", f"File not found check: {self._wrap_quotes(file)}"))
 
     # Files that cause a warning if they exist
     for file in files_warn_ifexists:
         if os.path.isfile(pf(self, file)):
-            self.warned.append((f"{handle}-1", f"File should be removed: {self._wrap_quotes(file)}"))
+            self.warned.append(LintResult(f"{handle}-1", f"File should be removed: {self._wrap_quotes(file)}", file))
         else:
             self.passed.append((f"{handle}-1", f"File not found check: {self._wrap_quotes(file)}"))
 
@@ -396,7 +575,11 @@ class GetLintingFunctionsMeta(type):
             for func in dir(TemplateLinter)
             if (callable(getattr(TemplateLinter, func)) and not func.startswith("__"))
         ]
-        cls_only_funcs = list(set(specific_linter_function_names) - set(general_linter_function_names))
+        cls_only_funcs = [
+            func
+            for func in set(specific_linter_function_names) - set(general_linter_function_names)
+            if not func.startswith("_")
+        ]
         cls_only_funcs.remove(
             "lint"
         )  # remove 'lint', since we only want the newly defined methods and not the method itself
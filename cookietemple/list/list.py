@@ -1,5 +1,6 @@
 import logging
 import os
+from itertools import chain
 
 from rich import print
 from rich.box import HEAVY_HEAD
@@ -7,8 +8,9 @@ from rich.console import Console
 from rich.style import Style
 from rich.table import Table
 
-from cookietemple.common.load_yaml import load_yaml_file
-from cookietemple.util.dict_util import is_nested_dictionary
+from cookietemple.common.template_catalog import load_template_catalog
+from cookietemple.common.template_output import stream_templates
+from cookietemple.common.template_registry import load_template_registry
 
 log = logging.getLogger(__name__)
 
@@ -18,48 +20,40 @@ class TemplateLister:
     A class responsible for listing all available cookietemple templates in a nice layout
     """
 
-    def __init__(self):
+    def __init__(self, output_format: str = "table"):
         self.WD = os.path.dirname(__file__)
         self.TEMPLATES_PATH = f"{self.WD}/../create/templates"
+        self.output_format = output_format
 
     def list_available_templates(self) -> None:
         """
         Displays all available templates to stdout in nicely formatted yaml format.
         Omits long descriptions.
+        Templates of external catalogs are listed after cookietemple's own templates.
+        The plain and json formats are streamed straight from the template registry.
         """
         log.debug(f"Reading available_templates.yml at {self.TEMPLATES_PATH}/available_templates.yml")
-        available_templates = load_yaml_file(f"{self.TEMPLATES_PATH}/available_templates.yml")
+        registry = load_template_registry(f"{self.TEMPLATES_PATH}/available_templates.yml")
+        templates = chain(registry.by_handle.values(), load_template_catalog().templates.values())
+        if self.output_format != "table":
+            stream_templates(templates, "short description", self.output_format)
+            return
         print("[bold blue]Run [green]cookietemple info [blue]for long descriptions of your template of interest")
         print()
 
         # What we want to have are lists like
         # [['name', 'handle', 'short description', 'available libraries', 'version'], ['name', 'handle', 'short description', 'available libraries', 'version']]
         log.debug("Building list table.")
-        templates_to_tabulate = []
-        for language in available_templates.values():
-            for val in language.values():
-                # has a subdomain -> traverse dictionary a level deeper
-                if is_nested_dictionary(val):
-                    for val_2 in val.values():
-                        templates_to_tabulate.append(
-                            [
-                                val_2["name"],
-                                val_2["handle"],
-                                val_2["short description"],
-                                val_2["available libraries"],
-                                val_2["version"],
-                            ]
-                        )
-                else:
-                    templates_to_tabulate.append(
-                        [
-                            val["name"],
-                            val["handle"],
-                            val["short description"],
-                            val["available libraries"],
-                            val["version"],
-                        ]
-                    )
+        templates_to_tabulate = [
+            [
+                template["name"],
+                template["handle"],
+                template["short description"],
+                template["available libraries"],
+                template["version"],
+            ]
+            for template in templates
+        ]
 
         table = Table(
             title="[bold]All available cookietemple templates",
@@ -0,0 +1,105 @@
+import re
+from typing import Iterable, List, Pattern, Set, Tuple
+
+# characters, which make a glob more than a plain path
+GLOB_CHARACTERS = set("*?[")
+
+
+def translate_glob(glob: str) -> str:
+    """
+    Translate a glob into a regular expression. The translation follows fnmatch, so * and ? also match a /.
+    Additionally, **/ matches zero or more directories and a trailing /** everything inside a directory.
+
+    :param glob: The glob
+    :return: The regular expression matching the same paths (without anchors)
+    """
+    i, n = 0, len(glob)
+    result: List[str] = []
+    while i < n:
+        if glob.startswith("**/", i) and (i == 0 or glob[i - 1] == "/"):
+            result.append("(?:.*/)?")
+            i += 3
+            continue
+        if glob.startswith("/**", i) and i + 3 == n:
+            result.append("(?:/.*)?")
+            i += 3
+            continue
+        c = glob[i]
+        i += 1
+        if c == "*":
+            # consecutive stars match the same paths as a single one
+            while i < n and glob[i] == "*" and not glob.startswith("**/", i):
+                i += 1
+            result.append(".*")
+        elif c == "?":
+            result.append(".")
+        elif c == "[":
+            j = i
+            if j < n and glob[j] == "!":
+                j += 1
+            if j < n and glob[j] == "]":
+                j += 1
+            while j < n and glob[j] != "]":
+                j += 1
+            if j >= n:
+                result.append("\\[")
+            else:
+                characters = glob[i:j].replace("\\", "\\\\")
+                i = j + 1
+                if characters[0] == "!":
+                    characters = f"^{characters[1:]}"
+                elif characters[0] in ("^", "["):
+                    characters = f"\\{characters}"
+                result.append(f"[{characters}]")
+        else:
+            result.append(re.escape(c))
+    return "".join(result)
+
+
+class BlacklistMatcher:
+    """
+    Classifies paths by the blacklisted globs of the sync_files_blacklisted section of a cookietemple.cfg file.
+    All globs are compiled once: plain paths are looked up in a set, globs like *.ext are checked as suffixes
+    and all other globs are combined into a single regular expression. Hence, every path is classified in one pass.
+
+    Attributes:
+        globs (list): The blacklisted globs.
+        paths (set): The globs without any glob characters.
+        suffixes (tuple): The suffixes of globs of the form *<suffix>.
+        regex (Pattern): The combined regular expression of all other globs or None, if there are none.
+    """
+
+    def __init__(self, globs: Iterable[str]):
+        self.globs = list(globs)
+        self.paths: Set[str] = set()
+        suffixes: List[str] = []
+        expressions: List[str] = []
+        for glob in self.globs:
+            if not GLOB_CHARACTERS & set(glob):
+                self.paths.add(glob)
+            elif glob.startswith("*") and not GLOB_CHARACTERS & set(glob[1:]):
+                suffixes.append(glob[1:])
+            else:
+                expressions.append(f"(?:{translate_glob(glob)})")
+        self.suffixes: Tuple[str, ...] = tuple(suffixes)
+        self.regex: Pattern = re.compile(f"(?s:{'|'.join(expressions)})") if expressions else None  # type: ignore
+
+    def matches(self, path: str) -> bool:
+        """
+        Check whether a path is blacklisted.
+
+        :param path: The path relative to the project directory (using forward slashes)
+        :return: True if any blacklisted glob matches the path, false otherwise
+        """
+        if path in self.paths or (self.suffixes and path.endswith(self.suffixes)):
+            return True
+        return self.regex is not None and self.regex.fullmatch(path) is not None
+
+    def filter(self, paths: Iterable[str]) -> Set[str]:
+        """
+        Get all blacklisted paths.
+
+        :param paths: The paths relative to the project directory (using forward slashes)
+        :return: The blacklisted paths
+        """
+        return {path for path in paths if self.matches(path)}
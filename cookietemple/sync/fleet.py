@@ -0,0 +1,212 @@
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from github import Github
+from packaging import version
+from rich.table import Table
+
+from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.common.template_catalog import load_template_catalog
+from cookietemple.common.template_registry import load_template_registry
+from cookietemple.create.github_support import decrypt_pat, load_github_username
+from cookietemple.custom_cli.questionary import disable_prompts
+from cookietemple.sync.sync import TemplateSync
+from cookietemple.util.rich import console
+
+log = logging.getLogger(__name__)
+
+# the GitHub sessions of this process by their token
+_github_sessions: Dict[str, Github] = {}
+
+
+def load_github_session(token: str) -> Github:
+    """
+    Load the GitHub session of a token. It is shared by all syncs of this process (and the processes forked from it).
+
+    :param token: The personal access token
+    :return: The GitHub session
+    """
+    if token not in _github_sessions:
+        _github_sessions[token] = Github(token)
+    return _github_sessions[token]
+
+
+def sync_fleet(
+    fleet_file: str, jobs: int = 1, gh_username: Optional[str] = None, token: Optional[str] = None, worktree=False
+) -> None:
+    """
+    Sync all projects of a fleet file and print a summary of all projects.
+    The token is decrypted once and all projects share one GitHub session and the loaded and compiled templates.
+    Every project renders its own template project, since its values end up in file contents and names. Only projects with identical
+    .cookietemple.yml files share a rendered template project.
+    With more than one job, the projects are synced by a pool of worker processes.
+
+    :param fleet_file: Path to the file listing the project directories
+    :param jobs: Number of processes to sync projects in
+    :param gh_username: The Github username (defaults to the configured one)
+    :param token: The personal access token (defaults to the configured one)
+    :param worktree: Whether to sync the TEMPLATE branches in temporary git worktrees
+    """
+    project_dirs = load_fleet(fleet_file)
+    log.debug(f"Loaded {len(project_dirs)} projects from {fleet_file}.")
+    gh_username = gh_username if gh_username else load_github_username()
+    token = token if token else decrypt_pat()
+    # a fleet is synced unattended, so missing properties fail the project instead of prompting
+    disable_prompts()
+    # load the session and templates before starting the workers, which inherit them (where processes are forked)
+    load_github_session(token)
+    load_template_registry()
+    load_template_catalog()
+    render_cache_dir = tempfile.mkdtemp(prefix="cookietemple_fleet_")
+    start = time.perf_counter()
+    try:
+        if jobs > 1 and len(project_dirs) > 1:
+            warm_template_cache(project_dirs, gh_username, token, render_cache_dir)
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(sync_fleet_project, project_dir, gh_username, token, worktree, render_cache_dir)
+                    for project_dir in project_dirs
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                sync_fleet_project(project_dir, gh_username, token, worktree, render_cache_dir)
+                for project_dir in project_dirs
+            ]
+    finally:
+        shutil.rmtree(render_cache_dir, ignore_errors=True)
+    print_fleet_summary(project_dirs, results, time.perf_counter() - start)
+    if not all(result[0] for result in results):
+        sys.exit(1)
+
+
+def load_fleet(fleet_file: str) -> List[str]:
+    """
+    Load the project directories of a fleet file. Every line is the path to a local clone of a project.
+    Empty lines and lines starting with # are skipped.
+
+    :param fleet_file: Path to the fleet file
+    :return: The absolute paths of all project directories (without duplicates)
+    """
+    with open(fleet_file) as f:
+        lines = [line.strip() for line in f]
+    project_dirs = [os.path.abspath(os.path.expanduser(line)) for line in lines if line and not line.startswith("#")]
+    return list(dict.fromkeys(project_dirs))
+
+
+def warm_template_cache(project_dirs: List[str], gh_username: str, token: str, render_cache_dir: str) -> None:
+    """
+    Create the template project of the first outdated project of every template before starting the workers.
+    The workers inherit the compiled templates, so every template version is only compiled once.
+    The created template project is only reused by projects with the same .cookietemple.yml file as the first project.
+
+    :param project_dirs: The project directories
+    :param gh_username: The Github username
+    :param token: The personal access token
+    :param render_cache_dir: Directory of the rendered template projects
+    """
+    warmed_handles = set()
+    for project_dir in project_dirs:
+        try:
+            project_version, handle = TemplateSync.sync_load_project_template_version_and_handle(Path(project_dir))
+            if handle in warmed_handles:
+                continue
+            # the version is normalized like TemplateSync.has_template_version_changed does
+            template_version = str(version.parse(TemplateSync.sync_load_template_version(handle)))
+            if version.parse(project_version) >= version.parse(template_version):
+                continue
+            log.debug(f"Creating the template project of {project_dir} to warm up template {handle}.")
+            syncer = TemplateSync(
+                project_dir,
+                template_version,
+                gh_username=gh_username,
+                token=token,
+                github=load_github_session(token),
+                render_cache_dir=render_cache_dir,
+            )
+            syncer.dot_cookietemple = load_yaml_file(os.path.join(project_dir, ".cookietemple.yml"))
+            syncer.load_cached_template_project()
+            warmed_handles.add(handle)
+        except (Exception, SystemExit) as e:
+            # the sync of the project reports the error
+            log.debug(f"Could not warm up the template cache with {project_dir}: {e}")
+
+
+def sync_fleet_project(
+    project_dir: str, gh_username: str, token: str, worktree: bool, render_cache_dir: str
+) -> Tuple[bool, str, float]:
+    """
+    Sync a project of a fleet. Errors are returned instead of raised, so a single project cannot abort the fleet.
+    If the sync fails, TemplateSync.sync restores the project to its original branch.
+
+    :param project_dir: Path to the project directory
+    :param gh_username: The Github username
+    :param token: The personal access token
+    :param worktree: Whether to sync the TEMPLATE branch in a temporary git worktree
+    :param render_cache_dir: Directory of the rendered template projects
+    :return: Whether the project was synced (or needs no sync), a message and the duration in seconds
+    """
+    disable_prompts()
+    start = time.perf_counter()
+    old_cwd = os.getcwd()
+    try:
+        (
+            major_change,
+            minor_change,
+            patch_change,
+            _proj_template_version,
+            ct_template_version,
+        ) = TemplateSync.has_template_version_changed(Path(project_dir))
+        if not any(change for change in (major_change, minor_change, patch_change)):
+            return True, "Up to date", time.perf_counter() - start
+        syncer = TemplateSync(
+            project_dir,
+            ct_template_version,
+            gh_username=gh_username,
+            token=token,
+            major_update=major_change,
+            minor_update=minor_change,
+            patch_update=patch_change,
+            worktree=worktree,
+            github=load_github_session(token),
+            render_cache_dir=render_cache_dir,
+        )
+        if not syncer.should_run_sync():
+            return True, "Sync disabled or below the sync level", time.perf_counter() - start
+        syncer.sync()
+        success, message = True, f"Synced to {ct_template_version}" if syncer.made_changes else "No changes"
+    except SystemExit as e:
+        # the sync only stops successfully, if a sync PR is still open
+        success, message = not e.code, (
+            "Open sync PR still unmerged" if not e.code else f"Aborted with exit code {e.code}"
+        )
+    except Exception as e:
+        success, message = False, f"{type(e).__name__}: {e}"
+    finally:
+        os.chdir(old_cwd)
+    return success, message, time.perf_counter() - start
+
+
+def print_fleet_summary(project_dirs: List[str], results: List[Tuple[bool, str, float]], duration: float) -> None:
+    """
+    Print the result and duration of the sync of every project of a fleet.
+
+    :param project_dirs: The project directories
+    :param results: Whether every project was synced, a message and the duration
+    :param duration: The duration of the fleet sync in seconds
+    """
+    failed = sum(not result[0] for result in results)
+    table = Table(title=f"[bold]Synced {len(results)} projects in {duration:.1f}s ({failed} failed)", title_style="blue")
+    table.add_column("Project", style="green")
+    table.add_column("Result")
+    table.add_column("Duration (s)", justify="right")
+    for project_dir, (success, message, project_duration) in zip(project_dirs, results):
+        table.add_row(project_dir, message if success else f"[bold red]{message}", f"{project_duration:.1f}")
+    console.print(table)
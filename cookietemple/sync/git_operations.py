@@ -0,0 +1,113 @@
+import logging
+import subprocess
+import time
+from typing import Iterator, List, Sequence
+
+from cookietemple.util.profiler import profiler
+
+log = logging.getLogger(__name__)
+
+
+class GitOperationError(Exception):
+    """
+    Raised, if a git command exits with a non zero exit code.
+    """
+
+    pass
+
+
+class GitOperations:
+    """
+    Runs git commands in a repository. Every command is awaited and its exit code is checked.
+    Commands on many paths are batched into as few invocations as the command line length allows.
+
+    Attributes:
+        repo_dir (str): Path to the working tree of the repository.
+        time_spent (float): Seconds spent running git commands.
+        invocations (int): Number of git processes run.
+    """
+
+    # the maximum length of the paths of a single invocation, which keeps the command line below the limits of all platforms
+    MAX_PATHS_LENGTH = 24000
+
+    def __init__(self, repo_dir: str):
+        self.repo_dir = repo_dir
+        self.time_spent = 0.0
+        self.invocations = 0
+
+    def run(self, *args: str) -> str:
+        """
+        Run a git command and wait for it to finish.
+
+        :param args: The arguments of git
+        :return: The standard output of the command
+        """
+        log.debug(f"Running git {' '.join(args)}")
+        start = time.perf_counter()
+        with profiler.span(f"git {args[0]}", "git"):
+            process = subprocess.run(["git", *args], cwd=self.repo_dir, capture_output=True, universal_newlines=True)
+        self.time_spent += time.perf_counter() - start
+        self.invocations += 1
+        if process.returncode != 0:
+            raise GitOperationError(
+                f"git {args[0]} failed with exit code {process.returncode}:\n{process.stderr.strip()}"
+            )
+        return process.stdout
+
+    def run_on_paths(self, args: Sequence[str], paths: Sequence[str]) -> None:
+        """
+        Run a git command on paths. The paths are passed in as few invocations as possible.
+
+        :param args: The arguments of git preceding the paths
+        :param paths: The paths to run the command on
+        """
+        for batch in self.batch_paths(paths):
+            self.run(*args, "--", *batch)
+
+    def batch_paths(self, paths: Sequence[str]) -> Iterator[List[str]]:
+        """
+        Split paths into batches, which fit on a single command line.
+
+        :param paths: The paths to split
+        :return: The batches of paths
+        """
+        batch: List[str] = []
+        length = 0
+        for path in paths:
+            if batch and length + len(path) + 1 > self.MAX_PATHS_LENGTH:
+                yield batch
+                batch, length = [], 0
+            batch.append(path)
+            length += len(path) + 1
+        if batch:
+            yield batch
+
+    def reset(self, paths: Sequence[str]) -> None:
+        """
+        Unstage the changes of paths.
+
+        :param paths: The paths to unstage
+        """
+        self.run_on_paths(["reset", "--quiet", "HEAD"], paths)
+
+    def checkout(self, paths: Sequence[str]) -> None:
+        """
+        Discard the changes of tracked paths in the working tree.
+
+        :param paths: The paths to restore from the index
+        """
+        self.run_on_paths(["checkout"], paths)
+
+    def commit(self, message: str) -> None:
+        """
+        Commit all staged changes.
+
+        :param message: The commit message
+        """
+        self.run("commit", "--quiet", "-m", message)
+
+    def stash(self) -> None:
+        """
+        Stash all remaining changes of the working tree.
+        """
+        self.run("stash")
@@ -2,16 +2,15 @@
 """
 Synchronise a project TEMPLATE branch with the template.
 """
-import fnmatch
+import hashlib
+import json
 import logging
 import os
 import shutil
 import sys
 import tempfile
 from configparser import ConfigParser, NoSectionError
-from distutils.dir_util import copy_tree
 from pathlib import Path
-from subprocess import PIPE, Popen
 from typing import Tuple
 
 import git  # type: ignore
@@ -20,11 +19,17 @@ from packaging import version
 from rich import print
 
 from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.common.template_catalog import load_template_catalog
+from cookietemple.common.template_registry import AVAILABLE_TEMPLATES_PATH
 from cookietemple.common.version import load_ct_template_version, load_project_template_version_and_handle
 from cookietemple.config.config import ConfigCommand
 from cookietemple.create.create import choose_domain
 from cookietemple.create.github_support import create_sync_secret, decrypt_pat, load_github_username
 from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+from cookietemple.sync.blacklist_matcher import BlacklistMatcher
+from cookietemple.sync.git_operations import GitOperations
+from cookietemple.sync.template_delta import TemplateDelta
+from cookietemple.util.profiler import profiler
 
 log = logging.getLogger(__name__)
 
@@ -44,6 +49,11 @@ class TemplateSync:
     minor_update (bool): Whether a minor update was found for the template or not
     major_update (bool): Whether a major update was found for the template or not
     repo_owner (str): Owner of the repo (either orga name or personal github username)
+    worktree (bool): Whether the TEMPLATE branch is checked out in a separate git worktree instead of the project directory
+    template_dir (str): Path to the checkout of the TEMPLATE branch (the project directory or the worktree)
+    template_repo (git.Repo): The repository of the TEMPLATE branch checkout
+    github (Github): The GitHub session, which may be shared by the syncs of many projects
+    render_cache_dir (str): Directory of rendered template projects, which are only reused by projects with an identical .cookietemple.yml
     """
 
     def __init__(
@@ -56,6 +66,9 @@ class TemplateSync:
         major_update=False,
         minor_update=False,
         patch_update=False,
+        worktree=False,
+        github=None,
+        render_cache_dir=None,
     ):
         self.project_dir = os.path.abspath(project_dir)
         self.from_branch = from_branch
@@ -70,8 +83,12 @@ class TemplateSync:
         self.dot_cookietemple = {}
         self.repo_owner = self.gh_username
         self.new_template_version = new_template_version
-        self.github = Github(self.token)
+        self.github = github if github else Github(self.token)
         self.blacklisted_globs = []
+        self.worktree = worktree
+        self.template_dir = self.project_dir
+        self.template_repo = None
+        self.render_cache_dir = render_cache_dir
 
     def sync(self):
         """
@@ -80,22 +97,25 @@ class TemplateSync:
         self.inspect_sync_dir()
         # get blacklisted files on current working branch
         self.blacklisted_globs = self.get_blacklisted_sync_globs()
-        self.checkout_template_branch()
-        self.delete_template_branch_files()
-        self.make_template_project()
-        self.commit_template_changes()
-
-        # Push and make a pull request
-        if self.made_changes:
-            try:
-                self.push_template_branch()
-                self.make_pull_request()
-            except Exception as e:
-                self.reset_target_dir()
-                print(f"[bold red]{e}")
-                sys.exit(1)
-
-        self.reset_target_dir()
+        if self.worktree:
+            self.add_template_worktree()
+        else:
+            self.checkout_template_branch()
+        # the original branch is restored (or the TEMPLATE worktree removed), even if any of the following steps fails
+        try:
+            self.make_template_project()
+            self.commit_template_changes()
+
+            # Push and make a pull request
+            if self.made_changes:
+                try:
+                    self.push_template_branch()
+                    self.make_pull_request()
+                except Exception as e:
+                    print(f"[bold red]{e}")
+                    sys.exit(1)
+        finally:
+            self.reset_target_dir()
 
         if not self.made_changes:
             print("[bold blue]No changes made to TEMPLATE - sync complete")
@@ -115,6 +135,7 @@ class TemplateSync:
         # Check that the project_dir is a git repo
         try:
             self.repo = git.Repo(self.project_dir)
+            self.template_repo = self.repo
         except git.exc.InvalidGitRepositoryError:
             print(f"[bold red]{self.project_dir} does not appear to be a git repository.")
             sys.exit(1)
@@ -134,6 +155,7 @@ class TemplateSync:
             print("[bold blue]Open cookietemple sync PR still unmerged! No sync will happen until this PR is merged!")
             sys.exit(0)
 
+    @profiler.profile("checkout", "git")
     def checkout_template_branch(self):
         """
         Try to check out the origin/TEMPLATE in a new TEMPLATE branch.
@@ -154,80 +176,146 @@ class TemplateSync:
                 print('[bold red]Could not check out branch "origin/TEMPLATE" or "TEMPLATE"')
                 sys.exit(1)
 
-    def delete_template_branch_files(self):
+    @profiler.profile("add worktree", "git")
+    def add_template_worktree(self):
         """
-        Delete all files in the TEMPLATE branch
+        Check out the TEMPLATE branch (or origin/TEMPLATE in a new TEMPLATE branch) in a temporary git worktree.
+        All work on the TEMPLATE branch happens there, so the files of the project's checkout are never touched.
         """
-        # Delete everything
-        print("[bold blue]Deleting all files in TEMPLATE branch")
-        for the_file in os.listdir(self.project_dir):
-            if the_file == ".git":
-                log.debug("Found .git directory. Skipping deleting it.")
-                continue
-            file_path = os.path.join(self.project_dir, the_file)
-            try:
-                if os.path.isfile(file_path):
-                    log.debug(f"Deleting file {file_path}")
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    log.debug(f"Deleting directory {file_path}")
-                    shutil.rmtree(file_path)
-            except Exception as e:
-                print(f"[bold red]{e}")
-                sys.exit(1)
+        self.from_branch = self.original_branch
+        self.template_dir = tempfile.mkdtemp(prefix="cookietemple_sync_")
+        log.debug(f"Adding TEMPLATE worktree at {self.template_dir}.")
+        try:
+            if "TEMPLATE" in self.repo.heads:
+                self.repo.git.worktree("add", self.template_dir, "TEMPLATE")
+            else:
+                self.repo.git.worktree("add", "-b", "TEMPLATE", self.template_dir, "origin/TEMPLATE")
+        except git.exc.GitCommandError as e:
+            print(f'[bold red]Could not check out branch "origin/TEMPLATE" or "TEMPLATE" in a worktree:\n{e}')
+            shutil.rmtree(self.template_dir, ignore_errors=True)
+            sys.exit(1)
+        self.template_repo = git.Repo(self.template_dir)
 
+    @profiler.profile("dry create", "render")
     def make_template_project(self):
         """
-        Delete all files and make a fresh template.
+        Make a fresh template in a temporary directory and only write its difference to the TEMPLATE branch into the project.
         """
         print("[bold blue]Creating a new template project.")
+        if self.render_cache_dir:
+            self.apply_template_delta(self.load_cached_template_project())
+            return
         # dry create run from dot_cookietemple in tmp directory
         with tempfile.TemporaryDirectory() as tmpdirname:
-            old_cwd = str(Path.cwd())
-            log.debug(f"Saving current working directory {old_cwd}.")
-            os.chdir(tmpdirname)
-            log.debug(f"Changed directory to {tmpdirname}.")
+            self.apply_template_delta(self.render_template_project(tmpdirname))
+
+    def render_template_project(self, directory: str) -> str:
+        """
+        Create the template project from the .cookietemple.yml file of the project.
+
+        :param directory: Directory to create the template project in
+        :return: Path to the created template project
+        """
+        old_cwd = str(Path.cwd())
+        log.debug(f"Saving current working directory {old_cwd}.")
+        os.chdir(directory)
+        log.debug(f"Changed directory to {directory}.")
+        try:
             log.debug(f"Calling choose_domain with {self.dot_cookietemple}.")
             choose_domain(path=Path.cwd(), domain=None, dot_cookietemple=self.dot_cookietemple)
-            # copy into the cleaned TEMPLATE branch's project directory
-            log.debug(f"Copying created template into {self.project_dir}.")
-            copy_tree(os.path.join(tmpdirname, self.dot_cookietemple["project_slug_no_hyphen"]), str(self.project_dir))
+        finally:
             log.debug(f"Changing directory back to {old_cwd}.")
             os.chdir(old_cwd)
+        return os.path.join(directory, self.dot_cookietemple["project_slug_no_hyphen"])
+
+    def load_cached_template_project(self) -> str:
+        """
+        Get the template project from the render cache. It is only created, if no project with the same .cookietemple.yml
+        was synced to the same template version before. The cache is keyed by the whole .cookietemple.yml file, because
+        the values of a project (e.g. its name) are rendered into file contents and names. Hence, projects only share
+        a template project, if their .cookietemple.yml files are identical.
 
+        :return: Path to the created template project
+        """
+        key = hashlib.sha1(
+            json.dumps([self.new_template_version, self.dot_cookietemple], sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        cached_dir = os.path.join(self.render_cache_dir, key)
+        if os.path.isdir(cached_dir):
+            log.debug(f"Reusing template project {cached_dir}.")
+        else:
+            render_dir = tempfile.mkdtemp(prefix=f"{key}.", dir=self.render_cache_dir)
+            self.render_template_project(render_dir)
+            try:
+                os.rename(render_dir, cached_dir)
+            except OSError:
+                # another sync created the same template project in the meantime
+                shutil.rmtree(render_dir, ignore_errors=True)
+        return os.path.join(cached_dir, self.dot_cookietemple["project_slug_no_hyphen"])
+
+    @profiler.profile("apply template delta", "git")
+    def apply_template_delta(self, rendered_dir: str):
+        """
+        Write only the files of the created template, which differ from the TEMPLATE branch, into the checkout of the TEMPLATE branch.
+
+        :param rendered_dir: Path to the created template
+        """
+        delta = TemplateDelta(rendered_dir, self.template_repo.head.commit.tree)
+        print(
+            f"[bold blue]Template adds {len(delta.added)}, changes {len(delta.changed)} and removes {len(delta.removed)} files."
+        )
+        delta.apply(self.template_dir)
+
+    def is_committed_file(self, path: str) -> bool:
+        """
+        Check whether a file is part of the last commit of the TEMPLATE branch.
+
+        :param path: Path of the file relative to the repository
+        :return: True if the last commit contains the file, false otherwise
+        """
+        try:
+            self.template_repo.head.commit.tree[path]
+            return True
+        except KeyError:
+            return False
+
+    @profiler.profile("commit", "git")
     def commit_template_changes(self):
         """
         If we have any changes with the new template files, make a git commit
         """
         # Check that we have something to commit
-        if not self.repo.is_dirty(untracked_files=True):
+        if not self.template_repo.is_dirty(untracked_files=True):
             print("[bold blue]Template contains no changes - no new commit created")
             return False
         # Commit changes
+        git_ops = GitOperations(self.template_dir)
         try:
             # git add only non-blacklisted files
             print("[bold blue]Staging template.")
             # add all files to stage
-            self.repo.git.add(A=True)
+            self.template_repo.git.add(A=True)
             # get all changed/modified files during the sync (including blacklisted ones)
-            changed_files = [item.a_path for item in self.repo.index.diff("HEAD")]
-            blacklisted_changed_files = set()
-            for pattern in self.blacklisted_globs:
-                # keep track of all staged files matching a glob from the cookietemple.cfg file
-                # those files will be excluded from syncing but will still be available in every new created projects
-                blacklisted_changed_files |= {file for file in fnmatch.filter(changed_files, pattern)}
+            changed_files = [item.a_path for item in self.template_repo.index.diff("HEAD")]
+            # keep track of all staged files matching a glob from the cookietemple.cfg file
+            # those files will be excluded from syncing but will still be available in every new created projects
+            blacklisted_changed_files = BlacklistMatcher(self.blacklisted_globs).filter(changed_files)
             nl = "\n"
             log.debug(
                 f"Blacklisted (unsynced) files are:{nl}{nl.join(file for file in blacklisted_changed_files)}"
                 if blacklisted_changed_files
                 else "No blacklisted files for syncing found."
             )
-            # each blacklisted file must be first unstaged and then get its changes discarded, so it will not be marked as modified by git
-            for blacklisted_file in blacklisted_changed_files:
-                log.debug(f"Unstaging {blacklisted_file}")
-                Popen(["git", "reset", blacklisted_file], stdout=PIPE, stderr=PIPE, universal_newlines=True)
-                log.debug(f"Discarding changes in working directory of file {blacklisted_file}")
-                Popen(["git", "checkout", "--", blacklisted_file], stdout=PIPE, stderr=PIPE, universal_newlines=True)
+            # all blacklisted files must be first unstaged and then get their changes discarded, so they will not be marked as modified by git
+            if blacklisted_changed_files:
+                log.debug("Unstaging blacklisted files.")
+                git_ops.reset(sorted(blacklisted_changed_files))
+                # files added by the template are untracked now and removed below
+                tracked_blacklisted_files = sorted(
+                    file for file in blacklisted_changed_files if self.is_committed_file(file)
+                )
+                log.debug("Discarding changes of blacklisted files in working directory.")
+                git_ops.checkout(tracked_blacklisted_files)
 
             files_to_commit = [file for file in changed_files if file not in blacklisted_changed_files]
             log.debug(
@@ -237,26 +325,24 @@ class TemplateSync:
             )
             if files_to_commit:
                 print("[bold blue]Committing changes of non blacklisted files.")
-                Popen(
-                    ["git", "commit", "-m", "cookietemple sync", *files_to_commit],
-                    stdout=PIPE,
-                    stderr=PIPE,
-                    universal_newlines=True,
-                )
+                # only the non blacklisted files are still staged
+                git_ops.commit("cookietemple sync")
                 print("[bold blue]Stashing and saving TEMPLATE branch changes!")
-                Popen(["git", "stash"], stdout=PIPE, stderr=PIPE, universal_newlines=True)
+                git_ops.stash()
                 self.made_changes = True
                 print("[bold blue]Committed changes to TEMPLATE branch")
 
             # if a file was added to the template, but is blacklisted, it remains untracked; so it should be removed
-            for untracked_file in self.repo.untracked_files:
+            for untracked_file in self.template_repo.untracked_files:
                 log.debug(f"Removing untracked file {untracked_file}")
-                Path(untracked_file).unlink()
+                Path(self.template_dir, untracked_file).unlink()
         except Exception as e:
             print(f"[bold red]Could not commit changes to TEMPLATE:\n{e}")
             sys.exit(1)
+        print(f"[bold blue]Spent {git_ops.time_spent:.2f}s in {git_ops.invocations} git commands.")
         return True
 
+    @profiler.profile("push", "git")
     def push_template_branch(self):
         """
         If there are any changes to the template, push the TEMPLATE branch to the default remote
@@ -265,17 +351,17 @@ class TemplateSync:
         print(f"[bold blue]Pushing TEMPLATE branch to remote: {os.path.basename(self.project_dir)}")
         try:
             log.debug("Getting origin as remote.")
-            origin = self.repo.remote("origin")
+            origin = self.template_repo.remote("origin")
             log.debug("Setting TEMPLATE branch as upstream tracking branch.")
-            self.repo.head.ref.set_tracking_branch(origin.refs.TEMPLATE)
+            self.template_repo.head.ref.set_tracking_branch(origin.refs.TEMPLATE)
             log.debug("Pushing to upstream branch TEMPLATE.")
-            self.repo.git.push(force=True)
+            self.template_repo.git.push(force=True)
             print(f"[bold blue]Checking out to new branch cookietemple_sync_v{self.new_template_version}")
             log.debug(f"git checkout -b cookietemple_sync_v{self.new_template_version}")
-            self.repo.git.checkout("-b", f"cookietemple_sync_v{self.new_template_version}")
+            self.template_repo.git.checkout("-b", f"cookietemple_sync_v{self.new_template_version}")
             log.debug(f"git push origin cookietemple_sync_v{self.new_template_version}")
             print(f"[bold blue]Pushing to remote branch cookietemple_sync_v{self.new_template_version}")
-            self.repo.remotes.origin.push(
+            self.template_repo.remotes.origin.push(
                 refspec=f"cookietemple_sync_v{self.new_template_version}:cookietemple_sync_v{self.new_template_version}"
             )
         except git.exc.GitCommandError as e:
@@ -441,15 +527,35 @@ class TemplateSync:
 
     def reset_target_dir(self):
         """
-        Reset the target project directory. Check out the original branch.
+        Reset the target project directory. Check out the original branch or remove the TEMPLATE worktree.
+        Changes, which a failed sync left on the TEMPLATE branch, are discarded.
         """
+        if self.worktree:
+            self.remove_template_worktree()
+            return
         print(f"[bold blue]Checking out original branch: {self.original_branch}")
         try:
+            # the project had no uncommitted changes before the sync, so all of them were made by the sync
+            if self.repo.is_dirty(untracked_files=True):
+                self.repo.git.reset("--hard")
+                self.repo.git.clean("-fd")
             self.repo.git.checkout(self.original_branch)
         except git.exc.GitCommandError as e:
             print(f"[bold red]Could not reset to original branch {self.from_branch}:\n{e}")
             sys.exit(1)
 
+    def remove_template_worktree(self):
+        """
+        Remove the temporary TEMPLATE worktree. The branches committed to in the worktree are kept.
+        """
+        log.debug(f"Removing TEMPLATE worktree at {self.template_dir}.")
+        try:
+            self.repo.git.worktree("remove", "--force", self.template_dir)
+        except git.exc.GitCommandError as e:
+            log.debug(f"Could not remove TEMPLATE worktree:\n{e}")
+            shutil.rmtree(self.template_dir, ignore_errors=True)
+            self.repo.git.worktree("prune")
+
     @staticmethod
     def update_sync_token(project_name: str, gh_username: str = "") -> None:
         """
@@ -529,12 +635,14 @@ class TemplateSync:
         :param handle: The template handle
         :return: The actual version number of the template in cookietemple
         """
-        top_path = f"{os.path.dirname(__file__)}/.."
-        available_templates_path = f"{str(top_path)}/create/templates/available_templates.yml"
+        external_template = load_template_catalog().get(handle)
+        if external_template:
+            log.debug(f"Using the template catalog {external_template['catalog']} to load current template version.")
+            return external_template["version"]
         log.debug(
-            f"Using available templates file from {available_templates_path} to load current cookietemple template version."
+            f"Using available templates file from {AVAILABLE_TEMPLATES_PATH} to load current cookietemple template version."
         )
-        return load_ct_template_version(handle, available_templates_path)
+        return load_ct_template_version(handle, AVAILABLE_TEMPLATES_PATH)
 
     @staticmethod
     def sync_load_project_template_version_and_handle(project_dir: Path) -> Tuple[str, str]:
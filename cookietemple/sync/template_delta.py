@@ -0,0 +1,114 @@
+import hashlib
+import logging
+import os
+import shutil
+import stat
+from typing import Dict, List, Tuple
+
+import git  # type: ignore
+
+log = logging.getLogger(__name__)
+
+# the git modes of regular files, executable files and symbolic links
+FILE_MODE = 0o100644
+EXECUTABLE_MODE = 0o100755
+SYMLINK_MODE = 0o120000
+
+
+def git_blob_entry(path: str) -> Tuple[str, int]:
+    """
+    Compute the git object id and mode, which a file would have, if it was added to git (without any filters like autocrlf).
+
+    :param path: Path to the file
+    :return: The object id and the git mode of the file
+    """
+    if os.path.islink(path):
+        content, mode = os.readlink(path).encode("utf-8"), SYMLINK_MODE
+    else:
+        with open(path, "rb") as f:
+            content = f.read()
+        mode = EXECUTABLE_MODE if os.stat(path).st_mode & stat.S_IXUSR else FILE_MODE
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest(), mode
+
+
+class TemplateDelta:
+    """
+    The file level difference between a freshly rendered template and the tree of the TEMPLATE branch.
+    Applying it to a checkout of the TEMPLATE branch only writes the added and changed files and removes the removed ones,
+    so all other files of the project are left untouched (including their modification times and git's index information).
+
+    Attributes:
+        rendered_dir (str): Path to the rendered template.
+        added (list): Paths of files, which are only part of the rendered template.
+        changed (list): Paths of files, whose content or mode differs.
+        removed (list): Paths of files, which are only part of the TEMPLATE branch.
+    """
+
+    def __init__(self, rendered_dir: str, tree: git.Tree):
+        self.rendered_dir = rendered_dir
+        self.added: List[str] = []
+        self.changed: List[str] = []
+        self.removed: List[str] = []
+        tree_entries: Dict[str, Tuple[str, int]] = {
+            item.path: (item.hexsha, item.mode) for item in tree.traverse() if item.type == "blob"
+        }
+        rendered_files = set()
+        for root, dirs, files in os.walk(rendered_dir):
+            dirs[:] = [directory for directory in dirs if directory != ".git"]
+            # symbolic links to directories are files for git
+            for file in files + [directory for directory in dirs if os.path.islink(os.path.join(root, directory))]:
+                path = os.path.relpath(os.path.join(root, file), rendered_dir).replace(os.path.sep, "/")
+                rendered_files.add(path)
+                if path not in tree_entries:
+                    self.added.append(path)
+                elif git_blob_entry(os.path.join(root, file)) != tree_entries[path]:
+                    self.changed.append(path)
+        self.removed = sorted(path for path in tree_entries if path not in rendered_files)
+        self.added.sort()
+        self.changed.sort()
+
+    def is_empty(self) -> bool:
+        """
+        :return: Whether the rendered template equals the tree of the TEMPLATE branch
+        """
+        return not (self.added or self.changed or self.removed)
+
+    def apply(self, project_dir: str) -> None:
+        """
+        Apply the difference to a checkout of the TEMPLATE branch.
+
+        :param project_dir: Path to the checkout
+        """
+        for path in self.removed:
+            project_file = os.path.join(project_dir, path)
+            log.debug(f"Removing {project_file}")
+            if os.path.lexists(project_file):
+                os.unlink(project_file)
+            self.remove_empty_dirs(project_dir, os.path.dirname(project_file))
+        for path in self.added + self.changed:
+            rendered_file = os.path.join(self.rendered_dir, path)
+            project_file = os.path.join(project_dir, path)
+            log.debug(f"Writing {project_file}")
+            # a directory of the TEMPLATE branch may have become a file
+            if os.path.isdir(project_file) and not os.path.islink(project_file):
+                shutil.rmtree(project_file)
+            elif os.path.lexists(project_file):
+                os.unlink(project_file)
+            os.makedirs(os.path.dirname(project_file), exist_ok=True)
+            shutil.copy2(rendered_file, project_file, follow_symlinks=False)
+
+    @staticmethod
+    def remove_empty_dirs(project_dir: str, directory: str) -> None:
+        """
+        Remove a directory and its parent directories inside the project, as long as they are empty.
+
+        :param project_dir: Path to the project
+        :param directory: Path to the innermost directory
+        """
+        while (
+            os.path.abspath(directory) != os.path.abspath(project_dir)
+            and os.path.isdir(directory)
+            and not os.listdir(directory)
+        ):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
@@ -1,15 +1,20 @@
 import json
 import logging
+import os
 import sys
-import urllib
+import threading
+import time
+import urllib.request
 from subprocess import PIPE, Popen, check_call
+from typing import Optional
 from urllib.error import HTTPError, URLError
 
-from pkg_resources import parse_version
+import appdirs  # type: ignore
+from packaging.version import parse as parse_version
 from rich import print
 
 import cookietemple
-from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+from cookietemple.util.rich import console
 
 log = logging.getLogger(__name__)
 
@@ -19,12 +24,23 @@ class UpgradeCommand:
     Responsible for checking for newer versions cookietemple and upgrading it if required.
     """
 
+    # the latest version found on PyPI and the time of the last check are cached next to the config file
+    LATEST_VERSION_CACHE_PATH = f'{appdirs.user_config_dir(appname="cookietemple")}/.latest_version.json'
+    # seconds until PyPI is asked again
+    LATEST_VERSION_CACHE_TTL = 24 * 60 * 60
+    # set this environment variable to any value to disable the check on startup
+    DISABLE_CHECK_ENV_VAR = "COOKIETEMPLE_NO_UPGRADE_CHECK"
+    # seconds a finished command waits for a running background check (the timeout of the request to PyPI)
+    STARTUP_CHECK_JOIN_TIMEOUT = 1.0
+
     @staticmethod
     def check_upgrade_cookietemple() -> None:
         """
         Checks whether the locally installed version of cookietemple is the latest.
         If not it prompts whether to upgrade and runs the upgrade command if desired.
         """
+        from cookietemple.custom_cli.questionary import cookietemple_questionary_or_dot_cookietemple
+
         if not UpgradeCommand.check_cookietemple_latest():
             if cookietemple_questionary_or_dot_cookietemple(
                 function="confirm", question="Do you want to upgrade?", default="y"
@@ -38,11 +54,50 @@ class UpgradeCommand:
 
         :return: True if locally version is the latest or PyPI is inaccessible, false otherwise
         """
+        latest_pypi_version = cls.fetch_latest_version()
+        if latest_pypi_version is None:
+            console.print(
+                "[bold red]Unable to contact PyPI to check for the latest cookietemple version. Do you have an internet connection?"
+            )
+            # Returning true by default, since this is not a serious issue
+            return True
+        return cls.compare_with_latest_version(latest_pypi_version)
+
+    @classmethod
+    def compare_with_latest_version(cls, latest_pypi_version: str) -> bool:
+        """
+        Compare the locally installed version of cookietemple with the latest one on PyPI and tell the user if they differ.
+
+        :param latest_pypi_version: The latest version available on PyPI
+        :return: True if the local version is the latest, false otherwise
+        """
         latest_local_version = cookietemple.__version__
         sliced_local_version = (
             latest_local_version[:-9] if latest_local_version.endswith("-SNAPSHOT") else latest_local_version
         )
         log.debug(f"Latest local cookietemple version is: {latest_local_version}.")
+        if parse_version(sliced_local_version) > parse_version(latest_pypi_version):
+            console.print(
+                f"[bold yellow]Installed version {latest_local_version} of cookietemple is newer than the latest release {latest_pypi_version}!"
+                f" You are running a nightly version and features may break!"
+            )
+        elif parse_version(sliced_local_version) == parse_version(latest_pypi_version):
+            return True
+        else:
+            console.print(
+                f"[bold red]Installed version {latest_local_version} of cookietemple is outdated. Newest version is {latest_pypi_version}!"
+            )
+            return False
+
+        return False
+
+    @classmethod
+    def fetch_latest_version(cls) -> Optional[str]:
+        """
+        Ask PyPI for the latest version of cookietemple.
+
+        :return: The latest version or None, if PyPI is inaccessible
+        """
         log.debug("Checking whether a new cookietemple version exists on PyPI.")
         try:
             # Retrieve info on latest version
@@ -53,28 +108,105 @@ class UpgradeCommand:
             with urllib.request.urlopen(req, timeout=1) as response:  # nosec
                 contents = response.read()
                 data = json.loads(contents)
-                latest_pypi_version = data["info"]["version"]
-        except (HTTPError, TimeoutError, URLError):
-            print(
-                "[bold red]Unable to contact PyPI to check for the latest cookietemple version. Do you have an internet connection?"
-            )
-            # Returning true by default, since this is not a serious issue
+                return data["info"]["version"]
+        except (HTTPError, TimeoutError, URLError, OSError, ValueError, KeyError) as e:
+            log.debug(f"Unable to fetch the latest cookietemple version from PyPI: {e}")
+            return None
+
+    @classmethod
+    def is_startup_check_enabled(cls) -> bool:
+        """
+        Check whether the upgrade check on startup was disabled by the environment variable or the cookietemple config file.
+
+        :return: True if the check should run, false otherwise
+        """
+        if os.environ.get(cls.DISABLE_CHECK_ENV_VAR):
+            return False
+        # the path of ConfigCommand.CONF_FILE_PATH, importing the config command would slow down every startup
+        config_file = f'{appdirs.user_config_dir(appname="cookietemple")}/cookietemple_cfg.yml'
+        if not os.path.exists(config_file):
             return True
+        from cookietemple.common.load_yaml import load_yaml_file
 
-        if parse_version(sliced_local_version) > parse_version(latest_pypi_version):
-            print(
-                f"[bold yellow]Installed version {latest_local_version} of cookietemple is newer than the latest release {latest_pypi_version}!"
-                f" You are running a nightly version and features may break!"
-            )
-        elif parse_version(sliced_local_version) == parse_version(latest_pypi_version):
+        try:
+            return load_yaml_file(config_file).get("check_for_upgrades", True) is not False
+        except (OSError, AttributeError):
             return True
-        else:
-            print(
-                f"[bold red]Installed version {latest_local_version} of cookietemple is outdated. Newest version is {latest_pypi_version}!"
-            )
-            return False
 
-        return False
+    @classmethod
+    def start_startup_check(cls) -> Optional[threading.Thread]:
+        """
+        Check for a newer version of cookietemple without ever delaying the invoked command.
+        A result cached within the last day is reported right away. Otherwise PyPI is asked in a background thread,
+        whose result is cached for the next invocations.
+
+        :return: The background thread or None, if no request to PyPI was required
+        """
+        if not cls.is_startup_check_enabled():
+            return None
+        cache = cls.load_latest_version_cache()
+        if cache and time.time() - cache.get("checked_at", 0) < cls.LATEST_VERSION_CACHE_TTL:
+            if cache.get("latest_version") and not cls.compare_with_latest_version(cache["latest_version"]):
+                console.print("[bold blue]Run [green]cookietemple upgrade [blue]to get the latest version.")
+            return None
+        thread = threading.Thread(
+            target=cls.refresh_latest_version_cache, name="cookietemple-upgrade-check", daemon=True
+        )
+        thread.start()
+        return thread
+
+    @classmethod
+    def finish_startup_check(cls, thread: Optional[threading.Thread]) -> None:
+        """
+        Report the result of the background check. A running check is waited for at most STARTUP_CHECK_JOIN_TIMEOUT seconds,
+        so short commands do not exit before the result could be cached.
+
+        :param thread: The background thread started by start_startup_check
+        """
+        if thread is None:
+            return
+        thread.join(cls.STARTUP_CHECK_JOIN_TIMEOUT)
+        if thread.is_alive():
+            return
+        cache = cls.load_latest_version_cache()
+        if cache and cache.get("latest_version") and not cls.compare_with_latest_version(cache["latest_version"]):
+            console.print("[bold blue]Run [green]cookietemple upgrade [blue]to get the latest version.")
+
+    @classmethod
+    def refresh_latest_version_cache(cls) -> None:
+        """
+        Ask PyPI for the latest version and cache it. The cache is only written once the request returned,
+        so failed requests are not repeated before the cache expires, but interrupted ones are.
+        """
+        cls.save_latest_version_cache(cls.fetch_latest_version())
+
+    @classmethod
+    def load_latest_version_cache(cls) -> Optional[dict]:
+        """
+        Load the cached result of the last check.
+
+        :return: A dictionary with the keys checked_at and latest_version or None, if nothing was cached
+        """
+        try:
+            with open(cls.LATEST_VERSION_CACHE_PATH) as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def save_latest_version_cache(cls, latest_version: Optional[str]) -> None:
+        """
+        Cache the result of a check.
+
+        :param latest_version: The latest version on PyPI or None, if PyPI could not be reached
+        """
+        try:
+            os.makedirs(os.path.dirname(cls.LATEST_VERSION_CACHE_PATH), exist_ok=True)
+            with open(cls.LATEST_VERSION_CACHE_PATH, "w") as f:
+                json.dump({"checked_at": time.time(), "latest_version": latest_version}, f)
+        except OSError as e:
+            log.debug(f"Unable to cache the latest cookietemple version: {e}")
 
     @classmethod
     def upgrade_cookietemple(cls) -> None:
@@ -1,6 +1,8 @@
 import os
 from pathlib import Path
 
+import appdirs  # type: ignore
+
 
 def delete_dir_tree(directory: Path) -> None:
     """
@@ -28,3 +30,14 @@ def pf(calling_class, file_path: str) -> str:
     :return: joined path
     """
     return os.path.join(calling_class.path, file_path)
+
+
+def user_cache_path(name: str) -> str:
+    """
+    Get the path of a cache in cookietemple's user cache directory.
+    The user cache directory is looked up on every call instead of on import, so it can be changed at runtime (e.g. by tests).
+
+    :param name: Name of the cache file or directory
+    :return: The path of the cache
+    """
+    return os.path.join(appdirs.user_cache_dir(appname="cookietemple"), name)
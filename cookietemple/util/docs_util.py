@@ -1,6 +1,9 @@
 from rich import print
 
+from cookietemple.util.profiler import profiler
 
+
+@profiler.profile("fix_short_title_underline", "io")
 def fix_short_title_underline(path_to_rst_file: str) -> None:
     """
     Fixes too short underlines of titles of *.rst files
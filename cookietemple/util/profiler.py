@@ -0,0 +1,122 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from rich.table import Table
+
+from cookietemple.util.rich import console
+
+
+class Profiler:
+    """
+    Records timed spans of the major phases of a cookietemple command.
+    Spans are only recorded after the profiler was enabled (see the global --profile option), so instrumented code costs a single check otherwise.
+    The spans can be printed as a table or dumped as a Chrome trace (open it at chrome://tracing or https://ui.perfetto.dev).
+
+    Attributes:
+        enabled (bool): Whether spans are recorded.
+        events (list): All recorded spans as Chrome trace events (times in microseconds).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._depth = threading.local()
+
+    def enable(self) -> None:
+        """
+        Start recording spans. All span times are relative to this point.
+        """
+        self.enabled = True
+        self.events = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, category: str = "cookietemple", **args: Any) -> Iterator[None]:
+        """
+        Record the time the enclosed block takes.
+
+        :param name: Name of the phase
+        :param category: Category of the phase (e.g. prompt, http, render, git)
+        :param args: Additional information shown with the span
+        """
+        if not self.enabled:
+            yield
+            return
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._depth.value = depth
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self._origin) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {"depth": depth, **{key: str(value) for key, value in args.items()}},
+                }
+            )
+
+    def profile(self, name: Optional[str] = None, category: str = "cookietemple") -> Callable:
+        """
+        Decorator recording every call of a function as a span.
+
+        :param name: Name of the phase. Defaults to the name of the function.
+        :param category: Category of the phase
+        """
+
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self.span(name or function.__name__, category):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def print_spans(self) -> None:
+        """
+        Print all recorded spans ordered by their start time. Nested spans are indented.
+        """
+        table = Table(title="cookietemple profile", title_style="bold blue")
+        table.add_column("Phase")
+        table.add_column("Category", style="blue")
+        table.add_column("Start (ms)", justify="right")
+        table.add_column("Duration (ms)", justify="right", style="bold green")
+        for event in sorted(self.events, key=lambda event: (event["ts"], -event["dur"])):
+            table.add_row(
+                f"{'  ' * event['args']['depth']}{event['name']}",
+                event["cat"],
+                f"{event['ts'] / 1e3:.1f}",
+                f"{event['dur'] / 1e3:.1f}",
+            )
+        console.print(table)
+
+    def dump(self, trace_file: str) -> None:
+        """
+        Write all recorded spans to a Chrome trace file.
+
+        :param trace_file: Path to the JSON trace file
+        """
+        with open(trace_file, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        console.print(f"[bold blue]Wrote profile trace to {trace_file}")
+
+
+# the profiler shared by all commands
+profiler = Profiler()
@@ -53,6 +53,9 @@ lint: ## check style with flake8
 test: ## run tests quickly with the default Python
 	pytest -s tests
 
+bench: ## run the benchmarks and print their timings
+	pytest -s tests\benchmarks
+
 test-all: ## run tests on every Python version with tox
 	tox
 
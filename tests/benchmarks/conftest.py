@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture
+def report(capsys):
+    """
+    Print the timings of a benchmark, even though pytest captures the output.
+    """
+
+    def print_report(message: str) -> None:
+        with capsys.disabled():
+            print(f"\n{message}")
+
+    return print_report
@@ -0,0 +1,90 @@
+import fnmatch
+import random
+import time
+
+import pytest
+
+from cookietemple.sync.blacklist_matcher import BlacklistMatcher
+
+# the blacklisted globs of cookietemple's own templates plus some typical user globs
+GLOBS = [
+    "CHANGELOG.rst",
+    "poetry.lock",
+    "pyproject.toml",
+    "requirements.txt",
+    "requirements_dev.txt",
+    "build.gradle",
+    "pom.xml",
+    "tests/**/*",
+    "docs/**/*.png",
+    "*.cfg",
+    "*.lock",
+    "src/*/resources/*.json",
+    "data/[0-9]*.csv",
+]
+DIRECTORIES = ["src", "tests", "docs", "data", "scripts", "src/main", "src/test", "docs/images", "tests/unit"]
+EXTENSIONS = ["py", "rst", "json", "csv", "png", "cfg", "lock", "java", "txt", "toml"]
+
+
+def make_paths(count: int) -> list:
+    """
+    Generate synthetic project paths of up to four directories.
+
+    :param count: Number of paths
+    :return: The paths
+    """
+    random.seed(42)
+    paths = []
+    for idx in range(count):
+        directories = [random.choice(DIRECTORIES) for _ in range(random.randint(0, 4))]
+        paths.append("/".join(directories + [f"{random.randint(0, 9)}file_{idx}.{random.choice(EXTENSIONS)}"]))
+    return paths + ["CHANGELOG.rst", "poetry.lock", "tests/test_cli.py", "tests/unit/test_sync.py"]
+
+
+def fnmatch_blacklisted(paths: list) -> set:
+    """
+    Classify paths like the sync did before, by one fnmatch.filter per glob.
+
+    :param paths: The paths
+    :return: The blacklisted paths
+    """
+    blacklisted = set()
+    for pattern in GLOBS:
+        blacklisted |= set(fnmatch.filter(paths, pattern))
+    return blacklisted
+
+
+def test_blacklist_matcher_matches_fnmatch() -> None:
+    """
+    Test that the blacklist matcher matches the same paths as fnmatch, except that **/ also matches zero directories.
+    """
+    paths = make_paths(50000)
+    # **/ additionally matches zero directories, which is the same as fnmatch matching the glob without it
+    zero_directories = {
+        path for pattern in GLOBS if "**/" in pattern for path in fnmatch.filter(paths, pattern.replace("**/", ""))
+    }
+    blacklisted = BlacklistMatcher(GLOBS).filter(paths)
+    assert blacklisted == fnmatch_blacklisted(paths) | zero_directories
+    assert "tests/test_cli.py" in blacklisted
+
+
+@pytest.mark.benchmark
+def test_blacklist_matcher_speedup(report) -> None:
+    """
+    Benchmark classifying 50k changed paths with the compiled blacklist matcher compared to one fnmatch.filter per glob.
+    """
+    paths = make_paths(50000)
+
+    start = time.perf_counter()
+    fnmatch_blacklisted(paths)
+    former_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    BlacklistMatcher(GLOBS).filter(paths)
+    matcher_time = time.perf_counter() - start
+
+    report(
+        f"Classifying {len(paths)} paths by {len(GLOBS)} globs: fnmatch.filter {former_time * 1000:.1f} ms, "
+        f"blacklist matcher {matcher_time * 1000:.1f} ms"
+    )
+    assert matcher_time < former_time
@@ -0,0 +1,74 @@
+import io
+import os
+import re
+import time
+
+import pytest
+
+from cookietemple.lint.cookiecutter_strings import find_cookiecutter_lines
+
+WEBSITE_PYTHON_PATH = (
+    f"{os.path.dirname(__file__)}/../../cookietemple/create/templates/web/website_python"  # type: ignore
+)
+
+
+def load_template_files() -> list:
+    """
+    Load the lines of all files of the shipped web/website_python template, including its vendored frontend templates.
+    """
+    files_lines = []
+    for root, _dirs, files in os.walk(WEBSITE_PYTHON_PATH):
+        for fname in files:
+            with io.open(os.path.join(root, fname), "rt", encoding="latin1") as file:
+                files_lines.append(file.readlines())
+    return files_lines
+
+
+def count_former_matches(files_lines: list) -> int:
+    """
+    Count the lines matched by the former per line regex search.
+
+    :param files_lines: The lines of all files
+    :return: The number of matching lines
+    """
+    former_matches = 0
+    for lines in files_lines:
+        for line in lines:
+            regex = re.compile(r"{\s?.* cookiecutter.*\s?}")  # noqa W605
+            if regex.search(line):
+                former_matches += 1
+    return former_matches
+
+
+def test_cookiecutter_string_detection_finds_former_matches() -> None:
+    """
+    Test that the precompiled detector finds every line of the unrendered template, which the former regex search found.
+    """
+    files_lines = load_template_files()
+    assert sum(1 for lines in files_lines for _line in find_cookiecutter_lines(lines)) >= count_former_matches(
+        files_lines
+    )
+
+
+@pytest.mark.benchmark
+def test_cookiecutter_string_scan_cost_per_mb(report) -> None:
+    """
+    Benchmark the cookiecutter string detection against the former per line regex search.
+    Prints the scan cost per MB of template content.
+    """
+    files_lines = load_template_files()
+    size_mb = sum(len(line) for lines in files_lines for line in lines) / 1024 / 1024
+
+    start = time.perf_counter()
+    former_matches = count_former_matches(files_lines)
+    former_cost = (time.perf_counter() - start) / size_mb
+
+    start = time.perf_counter()
+    matches = sum(1 for lines in files_lines for _line in find_cookiecutter_lines(lines))
+    cost = (time.perf_counter() - start) / size_mb
+
+    report(
+        f"web/website_python ({size_mb:.2f} MB): former regex {former_cost * 1000:.2f} ms/MB ({former_matches} matches), "
+        f"precompiled detector {cost * 1000:.2f} ms/MB ({matches} matches)"
+    )
+    assert cost < former_cost
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+# modules, which only the subcommands using them may import
+HEAVY_MODULES = ["git", "github", "cookiecutter", "questionary", "requests", "nacl", "cryptography"]
+# generous upper bound of the cumulative import time of cookietemple's entry point in microseconds
+MAX_STARTUP_IMPORT_TIME = 1_000_000
+
+
+def load_import_times(statement: str) -> dict:
+    """
+    Import cookietemple's entry point in a fresh interpreter with -X importtime.
+
+    :param statement: The Python statement to run
+    :return: The cumulative import time in microseconds of every imported module
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_time, cumulative_time, module = line[len("import time:") :].split("|")
+        import_times[module.strip()] = int(cumulative_time)
+    return import_times
+
+
+def test_cli_startup_does_not_import_subcommands() -> None:
+    """
+    Guard against subcommand implementations being imported eagerly again.
+    """
+    import_times = load_import_times("import cookietemple.__main__")
+    assert not [module for module in HEAVY_MODULES if module in import_times]
+
+
+@pytest.mark.benchmark
+def test_cli_startup_import_time(report) -> None:
+    """
+    Benchmark the startup of cookietemple's CLI. Prints the cumulative import time of the entry point.
+    """
+    import_times = load_import_times("import cookietemple.__main__")
+
+    report(f"cookietemple.__main__ imports in {import_times['cookietemple.__main__'] / 1000:.1f} ms")
+    assert import_times["cookietemple.__main__"] < MAX_STARTUP_IMPORT_TIME
@@ -0,0 +1,89 @@
+import random
+import string
+import time
+
+import pytest
+
+from cookietemple.common.levensthein_dist import levensthein_dist, load_suggestion_index, most_similar_command
+from cookietemple.common.suggest_similar_commands import SIMILARITY_SUGGEST_FACTOR
+
+DOMAINS = ["cli", "web", "gui", "lib", "pub", "data", "ml", "infra"]
+LANGUAGES = ["python", "java", "cpp", "rust", "go", "latex", "kotlin", "typescript"]
+
+
+def make_handles(count: int) -> frozenset:
+    """
+    Generate in-house like template handles of the form <domain>-<subdomain>-<language>.
+
+    :param count: Number of handles
+    :return: The handles
+    """
+    random.seed(42)
+    handles = set()
+    while len(handles) < count:
+        subdomain = "".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 12)))
+        handles.add(f"{random.choice(DOMAINS)}-{subdomain}-{random.choice(LANGUAGES)}")
+    return frozenset(handles)
+
+
+def former_suggestions(typos: list, handles: frozenset) -> list:
+    """
+    Find the closest handles of typos by computing the full levensthein distances to all handles.
+
+    :param typos: The mistyped handles
+    :param handles: All handles
+    :return: The set of closest handles within the suggestion limit for every typo
+    """
+    former = []
+    for typo in typos:
+        lim_suggest = int(len(typo) * SIMILARITY_SUGGEST_FACTOR)
+        distances = {handle: levensthein_dist(typo, handle) for handle in handles}
+        min_dist = min(distances.values())
+        former.append({handle for handle, dist in distances.items() if dist == min_dist <= lim_suggest})
+    return former
+
+
+def make_typos(handles: frozenset) -> list:
+    """
+    Generate typos of handles by dropping a character and some unrelated typos.
+
+    :param handles: All handles
+    :return: The typos
+    """
+    return [handle[:3] + handle[4:] for handle in sorted(handles)[:20]] + ["cli-pyton", "wbe", "xyz"]
+
+
+def test_suggestion_index_matches_full_distances() -> None:
+    """
+    Test that the suggestion index suggests the same handles as the full levensthein distances of all handles.
+    """
+    handles = make_handles(300)
+    typos = make_typos(handles)
+    load_suggestion_index(handles)
+    for typo, closest in zip(typos, former_suggestions(typos, handles)):
+        assert set(most_similar_command(typo, handles)[0]) == closest
+
+
+@pytest.mark.benchmark
+def test_suggestion_index_speedup(report) -> None:
+    """
+    Benchmark suggestions for typos against 300 handles with the suggestion index compared to full levensthein distances of all handles.
+    """
+    handles = make_handles(300)
+    typos = make_typos(handles)
+
+    start = time.perf_counter()
+    former_suggestions(typos, handles)
+    former_time = time.perf_counter() - start
+
+    load_suggestion_index(handles)
+    start = time.perf_counter()
+    for typo in typos:
+        most_similar_command(typo, handles)
+    index_time = time.perf_counter() - start
+
+    report(
+        f"{len(typos)} suggestions against {len(handles)} handles: full levensthein distances {former_time * 1000:.1f} ms, "
+        f"suggestion index {index_time * 1000:.1f} ms"
+    )
+    assert index_time < former_time
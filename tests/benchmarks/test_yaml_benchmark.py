@@ -0,0 +1,46 @@
+import time
+from pathlib import Path
+
+import pytest
+from ruamel.yaml import YAML
+
+from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.common.template_registry import AVAILABLE_TEMPLATES_PATH
+
+ROUNDS = 7
+REPEATS = 10
+
+
+def time_load(load) -> float:
+    """
+    Measure loading available_templates.yml.
+
+    :param load: Function loading the file
+    :return: The time of a single load in milliseconds
+    """
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        load()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def test_safe_yaml_loading_matches_round_trip() -> None:
+    """
+    Test that the safe loader of load_yaml_file loads the same content as the round-trip loader.
+    """
+    assert load_yaml_file(AVAILABLE_TEMPLATES_PATH) == YAML().load(Path(AVAILABLE_TEMPLATES_PATH))
+
+
+@pytest.mark.benchmark
+def test_safe_yaml_loading_is_faster_than_round_trip(report) -> None:
+    """
+    Benchmark the read-only safe loader of load_yaml_file against the round-trip loader.
+    Both loaders are measured alternately and the best round of each is printed.
+    """
+    round_trip_times, safe_times = [], []
+    for _ in range(ROUNDS):
+        round_trip_times.append(time_load(lambda: YAML().load(Path(AVAILABLE_TEMPLATES_PATH))))
+        safe_times.append(time_load(lambda: load_yaml_file(AVAILABLE_TEMPLATES_PATH)))
+
+    report(f"round-trip YAML load: {min(round_trip_times):.2f} ms, safe YAML load: {min(safe_times):.2f} ms")
+    assert min(safe_times) < min(round_trip_times)
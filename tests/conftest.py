@@ -0,0 +1,12 @@
+import appdirs  # type: ignore
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def user_cache_dir(tmp_path_factory, monkeypatch):
+    """
+    Point cookietemple's user cache directory to a temporary directory, so no test reads or writes the real caches.
+    """
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(appdirs, "user_cache_dir", lambda *args, **kwargs: str(cache_dir))
+    return cache_dir
@@ -0,0 +1,79 @@
+import os
+
+import cookietemple.custom_cli.questionary
+from cookietemple.create.batch import check_batch_project, create_batch_project, load_manifest
+
+MANIFEST = """defaults:
+    domain: cli
+    language: python
+    full_name: Homer Simpson
+    email: homer.simpson@springfield.com
+    github_username: homer
+    creator_github_username: homer
+projects:
+    - project_name: exploding-springfield
+      command_line_interface: Click
+    - project_name: flying-moe
+      path: bars
+      license: BSD
+"""
+
+
+def test_load_manifest(tmp_path) -> None:
+    """
+    Test that YAML and CSV manifests are merged with their defaults and CSV booleans are converted.
+    """
+    (tmp_path / "manifest.yml").write_text(MANIFEST)
+    (tmp_path / "manifest.csv").write_text("domain,project_name,is_github_repo,license\ncli,flying-moe,False,\n")
+
+    projects = load_manifest(str(tmp_path / "manifest.yml"))
+    assert [project["project_name"] for project in projects] == ["exploding-springfield", "flying-moe"]
+    assert all(project["language"] == "python" and not project["is_github_repo"] for project in projects)
+    assert projects[1]["license"] == "BSD" and projects[1]["path"] == "bars"
+    csv_project = load_manifest(str(tmp_path / "manifest.csv"))[0]
+    assert csv_project["is_github_repo"] is False
+    assert "license" not in csv_project
+
+
+def test_create_batch_projects(tmp_path, monkeypatch) -> None:
+    """
+    Test that batch projects are created without prompting and that conflicting projects are rejected.
+    """
+    # creating a batch project disables prompts for the rest of the process
+    monkeypatch.setattr(cookietemple.custom_cli.questionary, "prompts_disabled", False)
+    (tmp_path / "manifest.yml").write_text(MANIFEST)
+    projects = load_manifest(str(tmp_path / "manifest.yml"))
+    targets = []
+    for project in projects:
+        target, error = check_batch_project(project, str(tmp_path), targets)
+        assert not error
+        targets.append(target)
+    # Python projects are created without hyphens
+    assert targets == [str(tmp_path / "exploding_springfield"), str(tmp_path / "bars" / "flying_moe")]
+    assert check_batch_project({"domain": "cli", "project_name": "Exploding Springfield"}, str(tmp_path), targets)[1]
+    assert check_batch_project({"domain": "cli"}, str(tmp_path), targets)[1] == "Missing project_name"
+
+    cwd = os.getcwd()
+    created, error, _ = create_batch_project(projects[1], targets[1])
+    assert created, error
+    assert os.getcwd() == cwd
+    assert (tmp_path / "bars" / "flying_moe" / ".cookietemple.yml").exists()
+    assert os.path.isdir(targets[1])
+    assert check_batch_project({"domain": "cli", "project_name": "flying-moe"}, str(tmp_path / "bars"), [])[1]
+
+
+def test_create_batch_web_project_without_frontend(tmp_path, monkeypatch) -> None:
+    """
+    Test that a web project without frontend properties gets the frontend the interactive flow defaults to.
+    """
+    monkeypatch.setattr(cookietemple.custom_cli.questionary, "prompts_disabled", False)
+    (tmp_path / "manifest.yml").write_text(MANIFEST.replace("domain: cli", "domain: web"))
+    project = load_manifest(str(tmp_path / "manifest.yml"))[1]
+    target, error = check_batch_project(project, str(tmp_path), [])
+    assert not error
+
+    created, error, _ = create_batch_project(project, target)
+    assert created, error
+    assert target == str(tmp_path / "bars" / "flying_moe")
+    assert (tmp_path / "bars" / "flying_moe" / "flying_moe" / "static" / "assets").is_dir()
+    assert "frontend: solidstate" in (tmp_path / "bars" / "flying_moe" / ".cookietemple.yml").read_text()
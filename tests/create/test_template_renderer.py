@@ -0,0 +1,104 @@
+import filecmp
+import os
+
+from cookiecutter import utils  # type: ignore
+from cookiecutter.environment import StrictEnvironment  # type: ignore
+from cookiecutter.main import cookiecutter  # type: ignore
+from jinja2 import Environment
+
+from cookietemple.create.template_renderer import (
+    CachingEnvironment,
+    TemplateBytecodeCache,
+    load_common_files_renderer,
+    render_cookiecutter,
+)
+
+TEMPLATES_PATH = f"{os.path.dirname(__file__)}/../../cookietemple/create/templates"
+COMMON_FILES_PATH = f"{TEMPLATES_PATH}/common_files"
+CONTEXT = {
+    "full_name": "Homer Simpson",
+    "email": "homer.simpson@springfield.com",
+    "language": "python",
+    "domain": "cli",
+    "project_name": "Exploding Springfield",
+    "project_slug": "exploding_springfield",
+    "version": "0.1.0",
+    "license": "MIT",
+    "project_short_description": "Command-line interface to explode Springfield.",
+    "github_username": "homer",
+    "creator_github_username": "homer",
+    "cookietemple_version": "1.3.3",
+}
+
+
+def assert_same_tree(comparison: filecmp.dircmp) -> None:
+    assert not comparison.left_only and not comparison.right_only
+    assert not comparison.diff_files and not comparison.funny_files
+    for sub_comparison in comparison.subdirs.values():
+        assert_same_tree(sub_comparison)
+
+
+def test_common_files_render_like_cookiecutter(tmp_path) -> None:
+    """
+    Test that the common files are rendered into the project exactly like cookiecutter renders them.
+    """
+    cookiecutter(
+        COMMON_FILES_PATH,
+        output_dir=str(tmp_path / "cookiecutter"),
+        no_input=True,
+        extra_context={**CONTEXT, "commonName": "exploding_springfield"},
+    )
+    renderer = load_common_files_renderer(COMMON_FILES_PATH)
+    renderer.render(str(tmp_path / "exploding_springfield"), CONTEXT)
+    # a second render into the same project reuses the parsed templates and overwrites all files
+    renderer.render(str(tmp_path / "exploding_springfield"), CONTEXT)
+
+    assert load_common_files_renderer(COMMON_FILES_PATH) is renderer
+    assert_same_tree(
+        filecmp.dircmp(
+            str(tmp_path / "cookiecutter" / "exploding_springfield"), str(tmp_path / "exploding_springfield")
+        )
+    )
+
+
+def test_render_cookiecutter_reuses_compiled_templates(tmp_path, mocker) -> None:
+    """
+    Test that templates render like with cookiecutter and that repeated renders compile no template or path name template.
+    """
+    template_path = f"{TEMPLATES_PATH}/cli/cli_python"
+    cookiecutter(template_path, output_dir=str(tmp_path / "cookiecutter"), no_input=True)
+    render_cookiecutter(template_path, output_dir=str(tmp_path / "first"), no_input=True)
+
+    compile = mocker.spy(CachingEnvironment, "compile")
+    render_cookiecutter(template_path, output_dir=str(tmp_path / "second"), no_input=True)
+    # no template file is compiled again
+    assert all(len(call.args) == 2 for call in compile.call_args_list)
+    # only plain names and directory names, which cookiecutter renders as absolute paths of the project, are compiled again
+    assert all(os.path.isabs(call.args[1]) for call in compile.call_args_list if "{{" in call.args[1])
+
+    assert_same_tree(filecmp.dircmp(str(tmp_path / "cookiecutter"), str(tmp_path / "first")))
+    assert_same_tree(filecmp.dircmp(str(tmp_path / "first"), str(tmp_path / "second")))
+    # cookiecutter's environment is only replaced while rendering
+    assert utils.StrictEnvironment is StrictEnvironment
+
+
+def test_bytecode_cache_prunes_least_recently_used_templates(tmp_path) -> None:
+    """
+    Test that pruning the bytecode cache keeps the most recently used compiled templates.
+    """
+    cache = TemplateBytecodeCache(str(tmp_path))
+    env = Environment(bytecode_cache=cache)
+    for idx, name in enumerate(["moe", "barney", "lenny"]):
+        bucket = cache.get_bucket(env, "<string>", None, f"{{{{ {name} }}}}")
+        bucket.code = env.compile(f"{{{{ {name} }}}}")
+        cache.set_bucket(bucket)
+        # the compiled templates were last used in the order moe, barney, lenny
+        os.utime(cache._get_cache_filename(bucket), (idx, idx))
+    sizes = sorted(os.path.getsize(tmp_path / filename) for filename in os.listdir(tmp_path))
+    assert cache.dumped and len(sizes) == 3
+
+    cache.prune(max_size=sizes[-1] + sizes[-2])
+    assert not cache.dumped
+    assert len(os.listdir(tmp_path)) == 2
+    moe = cache.get_bucket(env, "<string>", None, "{{ moe }}")
+    assert not os.path.exists(cache._get_cache_filename(moe))
@@ -1,4 +1,12 @@
-from cookietemple.common.levensthein_dist import levensthein_dist
+import random
+
+from cookietemple.common.levensthein_dist import (
+    SuggestionIndex,
+    levensthein_dist,
+    load_suggestion_index,
+    most_similar_command,
+)
+from cookietemple.common.suggest_similar_commands import load_available_handles
 
 
 def test_levensthein_dist() -> None:
@@ -17,3 +25,60 @@ def test_levensthein_dist() -> None:
         and levensthein_dist("wep", "web") == 1
         and levensthein_dist("mycommand", "mycommand") == 0
     )
+
+
+def test_suggestion_index_matches_full_levensthein_dist() -> None:
+    """
+    Test that the distance with a cutoff and the suggestion index find exactly the commands a full levensthein distance finds.
+    """
+    commands = ["cli-python", "cli-java", "web-website-python", "gui-java", "pub-thesis-latex", "lib-cpp", "cli", "web"]
+    for command in ["cli-pyhton", "wbe", "gui-jaav", "pub-thesis-latx", "c", "", "cli-python"]:
+        for max_dist in range(0, 6):
+            expected = {candidate for candidate in commands if levensthein_dist(command, candidate) <= max_dist}
+            for candidate in commands:
+                dist = levensthein_dist(command, candidate)
+                assert levensthein_dist(command, candidate, max_dist) == min(dist, max_dist + 1)
+            closest, dist = SuggestionIndex(commands).closest_commands(command, max_dist)
+            if expected:
+                assert dist == min(levensthein_dist(command, candidate) for candidate in expected)
+                assert set(closest) == {
+                    candidate for candidate in expected if levensthein_dist(command, candidate) == dist
+                }
+            else:
+                assert (closest, dist) == ([], max_dist + 1)
+
+    handles = load_available_handles()
+    assert load_available_handles() is handles
+    assert load_suggestion_index(handles) is load_suggestion_index(handles)
+    assert most_similar_command("cli-pyhton", handles) == (["cli-python"], "use")
+
+
+def full_table_levensthein_dist(input_command: str, candidate: str) -> int:
+    """
+    The Levenshtein distance computed with a full DP table as reference.
+    """
+    dp_table = [
+        [max(row, col) if not row or not col else 0 for col in range(len(input_command) + 1)]
+        for row in range(len(candidate) + 1)
+    ]
+    for i in range(1, len(candidate) + 1):
+        for j in range(1, len(input_command) + 1):
+            if input_command[j - 1] == candidate[i - 1]:
+                dp_table[i][j] = dp_table[i - 1][j - 1]
+            else:
+                dp_table[i][j] = min(dp_table[i][j - 1], dp_table[i - 1][j - 1], dp_table[i - 1][j]) + 1
+    return dp_table[len(candidate)][len(input_command)]
+
+
+def test_two_row_levensthein_dist_matches_full_table() -> None:
+    """
+    Test that the two row levensthein distance with reused row buffers gives the same results as a full DP table, with and without a cutoff.
+    """
+    random.seed(0)
+    for _ in range(2000):
+        first = "".join(random.choice("ab-c") for _ in range(random.randint(0, 12)))
+        second = "".join(random.choice("ab-c") for _ in range(random.randint(0, 12)))
+        dist = full_table_levensthein_dist(first, second)
+        max_dist = random.randint(0, 8)
+        assert levensthein_dist(first, second) == levensthein_dist(second, first) == dist
+        assert levensthein_dist(first, second, max_dist) == min(dist, max_dist + 1)
@@ -0,0 +1,61 @@
+import os
+
+from cookietemple.common.template_catalog import TemplateCatalog
+
+CATALOG = """acme:
+    python:
+        name: ACME Python service
+        handle: acme-python
+        version: 1.0.0
+        available libraries: none
+        short description: A Python service.
+        long description: A Python service following the ACME guidelines.
+        linter: acme_templates.lint:AcmePythonLint
+    go:
+        name: ACME Go service
+        handle: acme-go
+        version: 0.2.0
+        available libraries: none
+        short description: A Go service.
+        long description: A Go service following the ACME guidelines.
+        path: services/go
+cli:
+    rust:
+        name: Rust CLI
+        handle: cli-rust
+        version: 0.1.0
+        available libraries: none
+        short description: A builtin domain.
+        long description: External templates cannot extend builtin domains.
+"""
+
+
+def test_template_catalog_indexes_external_templates(tmp_path, mocker, user_cache_dir) -> None:
+    """
+    Test that external templates are indexed and that catalog files are only parsed again after they changed.
+    """
+    catalog_dir = tmp_path / "catalog"
+    catalog_dir.mkdir()
+    (catalog_dir / "available_templates.yml").write_text(CATALOG)
+    mocker.patch.object(TemplateCatalog, "_entry_point_directories", return_value=[])
+
+    catalog = TemplateCatalog([str(catalog_dir)])
+    assert list(catalog.templates) == ["acme-python", "acme-go"]
+    assert catalog.domains() == ["acme"]
+    assert catalog.get("acme-python")["path"] == str(catalog_dir / "acme-python")
+    assert catalog.get("acme-python")["linter"] == "acme_templates.lint:AcmePythonLint"
+    assert catalog.get("acme-go")["path"] == str(catalog_dir / "services" / "go")
+    assert catalog.get("acme-go")["linter"] is None
+    assert catalog.get("cli-rust") is None
+    assert [template["handle"] for template in catalog.templates_of("acme")] == ["acme-python", "acme-go"]
+    assert catalog.templates_of("acm") == []
+    assert catalog.index_file == str(user_cache_dir / "template_catalog.json") and os.path.exists(catalog.index_file)
+
+    # an up to date index is used without parsing any catalog
+    load_template_registry = mocker.patch("cookietemple.common.template_catalog.load_template_registry")
+    assert TemplateCatalog([str(catalog_dir)]).templates == catalog.templates
+    load_template_registry.assert_not_called()
+    mocker.stop(load_template_registry)
+
+    (catalog_dir / "available_templates.yml").write_text(CATALOG.replace("version: 0.2.0", "version: 0.10.0"))
+    assert TemplateCatalog([str(catalog_dir)]).get("acme-go")["version"] == "0.10.0"
@@ -0,0 +1,36 @@
+import os
+import shutil
+
+from cookietemple.common.template_registry import AVAILABLE_TEMPLATES_PATH, TemplateRegistry, load_template_registry
+
+
+def test_template_registry_indexes_and_caches_templates(tmp_path, mocker, user_cache_dir) -> None:
+    """
+    Test that all templates are indexed and that the YAML file is only parsed again after its content changed.
+    """
+    yaml_path = str(tmp_path / "available_templates.yml")
+    shutil.copy(AVAILABLE_TEMPLATES_PATH, yaml_path)
+
+    registry = load_template_registry(yaml_path)
+    assert registry.version("cli-python") == registry.templates["cli"]["python"]["version"]
+    assert registry.get("web-website-python")["handle"] == "web-website-python"
+    assert registry.get("cli") is None
+    assert {template["handle"] for template in registry.by_domain["cli"]} == {"cli-java", "cli-python"}
+    assert "cli-python" in {template["handle"] for template in registry.by_language["python"]}
+    assert load_template_registry(yaml_path) is registry
+    # the cache is never written next to the YAML file
+    assert os.path.exists(registry.cache_file) and os.path.dirname(registry.cache_file) == str(
+        user_cache_dir / "templates"
+    )
+    assert os.listdir(tmp_path) == ["available_templates.yml"]
+
+    # an unchanged content is loaded from the cache even if the modification time changed
+    os.utime(yaml_path, ns=(0, 0))
+    yaml = mocker.patch("ruamel.yaml.YAML")
+    assert TemplateRegistry(yaml_path).by_handle == registry.by_handle
+    yaml.assert_not_called()
+    mocker.stopall()
+
+    with open(yaml_path, "a") as f:
+        f.write("new:\n    go:\n        name: New\n        handle: new-go\n        version: 0.1.0\n")
+    assert load_template_registry(yaml_path).version("new-go") == "0.1.0"
@@ -0,0 +1,29 @@
+import json
+
+from cookietemple.util.profiler import Profiler
+
+
+def test_profiler_records_nested_spans_as_chrome_trace(tmp_path) -> None:
+    """
+    Test that spans are only recorded once the profiler is enabled and dumped as complete Chrome trace events.
+    """
+    profiler = Profiler()
+
+    @profiler.profile("render", "render")
+    def render() -> str:
+        return "rendered"
+
+    render()
+    assert profiler.events == []
+
+    profiler.enable()
+    with profiler.span("create", "command"):
+        assert render() == "rendered"
+    profiler.dump(str(tmp_path / "trace.json"))
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert [(event["name"], event["cat"], event["ph"], event["args"]["depth"]) for event in events] == [
+        ("render", "render", "X", 1),
+        ("create", "command", "X", 0),
+    ]
+    assert events[1]["ts"] <= events[0]["ts"] and events[0]["dur"] <= events[1]["dur"]
@@ -1,3 +1,4 @@
+import json
 from typing import Dict
 
 import pytest
@@ -334,3 +335,26 @@ def test_most_similar_command_pub_with_subdomain_and_language(
     for com in get_commands_with_similar_command_pub_with_subdomain_and_language:
         test_tuple = most_similar_command(com.lower(), get_all_valid_handles_as_set)
         assert all(handle in {"pub-thesis", "pub-thesis-latex"} for handle in test_tuple[0])
+
+
+def test_info_json_format(capfd) -> None:
+    """
+    Ensure that the json format contains the long descriptions of exactly the requested templates.
+    """
+    TemplateInfo("json").show_info("cli")
+    out, _err = capfd.readouterr()
+    templates = json.loads(out)
+    assert {template["handle"] for template in templates} == {"cli-python", "cli-java"}
+    assert all(template["long_description"] for template in templates)
+
+
+@pytest.mark.parametrize("handle", ["clu", "cli-pyton"])
+def test_info_json_format_of_similar_handle(handle, capfd) -> None:
+    """
+    Ensure that the message about the best matching handle goes to stderr, so the json output stays valid.
+    """
+    with pytest.raises(SystemExit):
+        TemplateInfo("json").show_info(handle)
+    out, _err = capfd.readouterr()
+    templates = json.loads(out)
+    assert templates and {template["handle"] for template in templates} <= {"cli-python", "cli-java"}
@@ -1,10 +1,19 @@
+import json
 import os
+import pickle
 
+import git
 import pytest
 
+import cookietemple.custom_cli.questionary
+from cookietemple.create.batch import create_batch_project
+from cookietemple.lint.cookiecutter_strings import contains_cookiecutter_string
 from cookietemple.lint.domains.cli import CliPythonLint
 from cookietemple.lint.domains.pub import PubLatexLint
 from cookietemple.lint.domains.web import WebWebsitePythonLint
+from cookietemple.lint.gitignore import GitignoreMatcher
+from cookietemple.lint.lint import get_changed_files, lint_project
+from cookietemple.lint.lint_report import LintResult, lint_report_json, lint_report_sarif
 from cookietemple.lint.template_linter import TemplateLinter
 
 
@@ -57,3 +66,249 @@ def test_lint_bad_example(capfd, get_template_linter) -> None:
         test_linter.print_results()
 
         assert len(test_linter.warned) == 1 and len(test_linter.failed) == 1
+
+
+def test_lint_single_scan_dispatches_to_registered_checks(mocker) -> None:
+    """
+    Test that all content checks, including ones registered by domain linters, share a single walk of the project.
+    """
+    test_linter = CliPythonLint(str(os.path.abspath(os.path.dirname(__file__))) + "/lint_test_files")
+    scanned_files = []
+    test_linter.scanner.register("check_custom_content", lambda file_path, fname, lines: scanned_files.append(fname))
+    walk = mocker.spy(test_linter.scanner, "_walk")
+
+    test_linter.scanner.scan()
+
+    assert walk.call_count == 1
+    assert sorted(scanned_files) == ["lint_bad_test_file", "lint_good_test_file"]
+    assert len(test_linter.warned) == 1
+
+
+def test_lint_parallel_matches_serial() -> None:
+    """
+    Test that running the linting functions in a process pool yields the same, equally ordered results as a serial run.
+    """
+    project_dir = str(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+    results = []
+    for jobs in (1, 2):
+        test_linter = CliPythonLint(project_dir)
+        test_linter.jobs = jobs
+        # the workers build their own linter, so the linter itself is never sent to them
+        test_linter.scanner.unpicklable = lambda: None
+        test_linter.lint_project(super(CliPythonLint, test_linter), is_subclass_calling=False)
+        test_linter.lint_project(test_linter, test_linter.methods)
+        results.append((test_linter.passed, test_linter.warned, test_linter.failed))
+
+    assert results[0] == results[1]
+
+
+def test_general_linting_runs_only_check_functions() -> None:
+    """
+    Test that the general linting runs exactly the general linting functions and no helper like enable_cache.
+    """
+    project_dir = str(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+    test_linter = CliPythonLint(project_dir)
+    test_linter.lint_project(super(CliPythonLint, test_linter), is_subclass_calling=False)
+
+    assert sorted(test_linter.check_timings) == [
+        "check_cookietemple_todos",
+        "check_docker",
+        "check_files_exist",
+        "check_no_cookiecutter_strings",
+        "check_version_consistent",
+        "lint_cookietemple_config",
+    ]
+
+
+def test_cookiecutter_string_detection() -> None:
+    """
+    Test that leftover cookiecutter expressions and statements are detected, but plain Jinja2 (including raw blocks) is not.
+    """
+    assert contains_cookiecutter_string("{{ cookiecutter.project_name }}")
+    assert contains_cookiecutter_string("{{cookiecutter.project_slug|lower}}")
+    assert contains_cookiecutter_string("{% if cookiecutter.license == 'MIT' %}")
+    assert contains_cookiecutter_string("{% raw %}{{ cookiecutter.project_name }}{% endraw %}")
+    assert not contains_cookiecutter_string("token: {% raw %}${{ secrets.TOKEN }}{% endraw %}")
+    assert not contains_cookiecutter_string("{{ ima.nocookiecutter }}")
+    assert not contains_cookiecutter_string("{% if current_user.is_authenticated %}")
+
+
+def test_lint_skips_binary_and_large_files(tmp_path) -> None:
+    """
+    Test that binary files (by extension or NUL bytes) and files above the configured maximum size are skipped and counted.
+    """
+    (tmp_path / "cookietemple.cfg").write_text("[lint]\nmax_file_size_kb = 1\n")
+    (tmp_path / "figure.eps").write_text("{{ cookiecutter.project_name }}\n")
+    (tmp_path / "data.bin.txt").write_bytes(b"\0{{ cookiecutter.project_name }}\n")
+    (tmp_path / "large.txt").write_text("{{ cookiecutter.project_name }}\n" * 100)
+    (tmp_path / "small.txt").write_text("{{ cookiecutter.project_name }}\n")
+    test_linter = CliPythonLint(str(tmp_path))
+
+    test_linter.check_no_cookiecutter_strings()
+
+    assert len(test_linter.warned) == 1 and "small.txt" in test_linter.warned[0][1]
+    assert sorted(test_linter.scanner.skipped.values()) == ["binary", "binary", "too large"]
+    # machine readable reports list the skipped files as well
+    json_report = json.loads(lint_report_json(test_linter))
+    assert json_report["summary"]["skipped"] == 3
+    assert json_report["skipped_files"] == [
+        {"file": "data.bin.txt", "reason": "binary"},
+        {"file": "figure.eps", "reason": "binary"},
+        {"file": "large.txt", "reason": "too large"},
+    ]
+    sarif_run = json.loads(lint_report_sarif(test_linter))["runs"][0]
+    assert sarif_run["properties"]["skippedFiles"] == 3
+    notifications = sarif_run["invocations"][0]["toolExecutionNotifications"]
+    assert [
+        notification["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for notification in notifications
+    ] == ["data.bin.txt", "figure.eps", "large.txt"]
+
+
+def test_lint_cache_reuses_findings_of_unchanged_files(tmp_path, mocker, user_cache_dir) -> None:
+    """
+    Test that cached findings of unchanged files are replayed, changed files are checked again and
+    the cache is discarded after a cookietemple update or a change of the maximum file size.
+    """
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "unchanged.txt").write_text("{{ cookiecutter.project_name }}\n")
+    (project_dir / "changed.txt").write_text("{{ cookiecutter.project_name }}\n")
+
+    def lint_with_cache():
+        test_linter = CliPythonLint(str(project_dir))
+        test_linter.enable_cache()
+        test_linter.check_no_cookiecutter_strings()
+        return test_linter
+
+    first_linter = lint_with_cache()
+    # the cache is never written to the project
+    assert os.path.dirname(first_linter.scanner.cache.cache_file) == str(user_cache_dir / "lint")
+    assert os.path.isfile(first_linter.scanner.cache.cache_file)
+    assert sorted(os.listdir(project_dir)) == ["changed.txt", "unchanged.txt"]
+    (project_dir / "changed.txt").write_text("{{ cookiecutter.project_slug }}\n{{ cookiecutter.project_name }}\n")
+    second_linter = lint_with_cache()
+
+    assert second_linter.scanner.cache.hits == 1
+    assert len(first_linter.warned) == 2 and len(second_linter.warned) == 3
+    assert set(first_linter.warned) < set(second_linter.warned)
+
+    (project_dir / "cookietemple.cfg").write_text("[lint]\nmax_file_size_kb = 1\n")
+    assert lint_with_cache().scanner.cache.hits == 0
+    # the text files and cookietemple.cfg
+    assert lint_with_cache().scanner.cache.hits == 3
+    mocker.patch("cookietemple.__version__", "0.0.0")
+    assert lint_with_cache().scanner.cache.hits == 0
+
+
+def test_lint_changed_since_only_checks_changed_files(tmp_path) -> None:
+    """
+    Test that only files changed or added since a git ref are passed to the content checks.
+    """
+    for fname in ["committed.txt", "modified.txt"]:
+        (tmp_path / fname).write_text("{{ cookiecutter.project_name }}\n")
+    repo = git.Repo.init(tmp_path)
+    repo.index.add(["committed.txt", "modified.txt"])
+    repo.index.commit("Initial commit", author=git.Actor("test", "test@example.com"))
+    (tmp_path / "modified.txt").write_text("{{ cookiecutter.project_slug }}\n")
+    (tmp_path / "untracked").mkdir()
+    (tmp_path / "untracked" / "new.txt").write_text("{{ cookiecutter.project_slug }}\n")
+    test_linter = CliPythonLint(str(tmp_path))
+
+    test_linter.scanner.limit_to(get_changed_files(str(tmp_path), "HEAD"))
+    test_linter.check_no_cookiecutter_strings()
+
+    assert sorted(message.split("'")[1] for _code, message in test_linter.warned) == ["modified.txt", "new.txt"]
+
+
+def test_gitignore_matcher() -> None:
+    """
+    Test anchoring, negation, directory only patterns and wildcards of the gitignore matcher.
+    """
+    matcher = GitignoreMatcher(["# comment", "*.o", "!keep.o", "/root_only.txt", "logs/", "a/**/z.txt", "[!abc]y.md"])
+
+    assert matcher.is_ignored("x.o") and matcher.is_ignored("sub/x.o")
+    assert not matcher.is_ignored("keep.o") and not matcher.is_ignored("sub/keep.o")
+    assert matcher.is_ignored("root_only.txt") and not matcher.is_ignored("sub/root_only.txt")
+    assert matcher.is_ignored("sub/logs", is_dir=True) and not matcher.is_ignored("sub/logs")
+    assert matcher.is_ignored("a/z.txt") and matcher.is_ignored("a/b/c/z.txt") and not matcher.is_ignored("b/a/z.txt")
+    assert matcher.is_ignored("dy.md") and not matcher.is_ignored("ay.md")
+
+
+def test_lint_prunes_gitignored_files(tmp_path) -> None:
+    """
+    Test that files and directories ignored by the project's .gitignore are not passed to any content check.
+    """
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n!keep.log\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.txt").write_text("{{ cookiecutter.project_name }}\n")
+    (tmp_path / "debug.log").write_text("{{ cookiecutter.project_name }}\n")
+    (tmp_path / "keep.log").write_text("{{ cookiecutter.project_name }}\n")
+    test_linter = CliPythonLint(str(tmp_path))
+
+    test_linter.check_no_cookiecutter_strings()
+
+    assert len(test_linter.warned) == 1 and "keep.log" in test_linter.warned[0][1]
+
+
+def test_lint_reports_carry_file_line_and_timings(tmp_path) -> None:
+    """
+    Test that the JSON and SARIF reports contain the check ID, file, line and message of every result and the timing of every check.
+    """
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "README.rst").write_text("Title\n{{ cookiecutter.project_name }}\n")
+    test_linter = CliPythonLint(str(tmp_path))
+    test_linter.lint_project(test_linter, ["check_no_cookiecutter_strings"])
+
+    json_report = json.loads(lint_report_json(test_linter))
+    sarif_report = json.loads(lint_report_sarif(test_linter))
+
+    record = json_report["results"][0]
+    assert (record["check_id"], record["level"], record["file"], record["line"]) == (
+        "general-4",
+        "warning",
+        "sub/README.rst",
+        2,
+    )
+    assert list(json_report["check_timings"]) == ["check_no_cookiecutter_strings"]
+    sarif_result = sarif_report["runs"][0]["results"][0]
+    assert sarif_result["ruleId"] == "general-4"
+    assert sarif_result["locations"][0]["physicalLocation"]["region"]["startLine"] == 2
+    # results are returned by the workers of the linting process pool
+    result = pickle.loads(pickle.dumps(test_linter.warned[0]))
+    assert result == test_linter.warned[0] and (result.file, result.line) == ("sub/README.rst", 2)
+    assert LintResult("general-1", "File not found") == ("general-1", "File not found")
+
+
+@pytest.mark.parametrize("output_format", ["json", "sarif"])
+def test_lint_machine_formats_print_only_the_report(tmp_path, mocker, monkeypatch, capsys, output_format) -> None:
+    """
+    Test that a JSON or SARIF report is the only output on stdout and that the domain linter does not prompt for autopep8.
+    """
+    monkeypatch.setattr(cookietemple.custom_cli.questionary, "prompts_disabled", False)
+    project = {
+        "domain": "cli",
+        "language": "python",
+        "project_name": "exploding-springfield",
+        "full_name": "Homer Simpson",
+        "email": "homer.simpson@springfield.com",
+        "github_username": "homer",
+        "creator_github_username": "homer",
+        "is_github_repo": False,
+        "is_repo_private": False,
+        "is_github_orga": False,
+        "github_orga": "",
+    }
+    created, error, _ = create_batch_project(project, str(tmp_path / "exploding-springfield"))
+    assert created, error
+    capsys.readouterr()
+    prompt = mocker.patch(
+        "cookietemple.lint.domains.cli.cookietemple_questionary_or_dot_cookietemple", return_value=False
+    )
+
+    lint_project(
+        str(tmp_path / "exploding_springfield"), skip_external=False, use_cache=False, output_format=output_format
+    )
+
+    report = json.loads(capsys.readouterr().out)
+    assert "summary" in report if output_format == "json" else report["runs"][0]["tool"]
+    assert not prompt.called
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from cookietemple.list.list import TemplateLister
@@ -40,3 +42,20 @@ def test_header(capfd):
     header = set(out.split("\n")[4].split())
 
     assert "Name" in header and "Handle" in header
+
+
+def test_plain_and_json_formats(capfd) -> None:
+    """
+    Verifies that the plain and json formats contain one entry per template and nothing else.
+    """
+    TemplateLister("plain").list_available_templates()
+    out, _err = capfd.readouterr()
+    rows = [line.split("\t") for line in out.splitlines()]
+    assert all(len(row) == 5 for row in rows)
+    assert "cli-python" in [row[1] for row in rows]
+
+    TemplateLister("json").list_available_templates()
+    out, _err = capfd.readouterr()
+    templates = json.loads(out)
+    assert [template["handle"] for template in templates] == [row[1] for row in rows]
+    assert set(templates[0]) == {"name", "handle", "short_description", "available_libraries", "version"}
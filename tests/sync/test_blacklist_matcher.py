@@ -0,0 +1,30 @@
+from cookietemple.sync.blacklist_matcher import BlacklistMatcher
+
+
+def test_blacklist_matcher_supports_directory_globs() -> None:
+    """
+    Test that **/ matches any number of directories (including none) and a trailing /** everything inside a directory.
+    """
+    matcher = BlacklistMatcher(["tests/**/*", "**/CHANGELOG.rst", "docs/**", "*.lock", "setup.cfg", "data/[!_]*.csv"])
+    for path in [
+        "tests/test_cli.py",
+        "tests/unit/sync/test_sync.py",
+        "CHANGELOG.rst",
+        "subproject/CHANGELOG.rst",
+        "docs/index.rst",
+        "docs/images/logo.png",
+        "poetry.lock",
+        "subproject/poetry.lock",
+        "setup.cfg",
+        "data/springfield.csv",
+    ]:
+        assert matcher.matches(path), path
+    for path in [
+        "testsuite/test_cli.py",
+        "CHANGELOG.rst.bak",
+        "documentation/index.rst",
+        "subproject/setup.cfg",
+        "data/_private.csv",
+        "README.rst",
+    ]:
+        assert not matcher.matches(path), path
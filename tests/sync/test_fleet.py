@@ -0,0 +1,145 @@
+import os
+
+import git  # type: ignore
+import pytest
+
+import cookietemple.custom_cli.questionary
+from cookietemple.common.load_yaml import load_yaml_file
+from cookietemple.create.batch import create_batch_project
+from cookietemple.sync.fleet import load_fleet, sync_fleet_project
+from cookietemple.sync.sync import TemplateSync
+
+DOT_COOKIETEMPLE = """template_handle: cli-python
+template_version: {version}
+project_slug: {name}
+is_github_orga: False
+"""
+COOKIETEMPLE_CFG = """[sync]
+sync_enabled = False
+
+[sync_level]
+ct_sync_level = patch
+"""
+
+
+def make_fleet_project(directory, name: str, template_version: str) -> str:
+    """
+    Create a minimal cookietemple project repository on its master branch.
+
+    :param directory: Directory to create the project in
+    :param name: Name of the project
+    :param template_version: The template version of the last sync
+    :return: Path to the project
+    """
+    project_dir = directory / name
+    project_dir.mkdir()
+    (project_dir / ".cookietemple.yml").write_text(DOT_COOKIETEMPLE.format(version=template_version, name=name))
+    (project_dir / "cookietemple.cfg").write_text(COOKIETEMPLE_CFG)
+    repo = git.Repo.init(project_dir)
+    repo.index.add([".cookietemple.yml", "cookietemple.cfg"])
+    author = git.Actor("Homer Simpson", "homer.simpson@springfield.com")
+    repo.index.commit("Initial commit", author=author, committer=author)
+    if repo.active_branch.name != "master":
+        repo.git.branch("-m", "master")
+    return str(project_dir)
+
+
+def test_load_fleet(tmp_path) -> None:
+    """
+    Test that comments, empty lines and duplicates of a fleet file are skipped.
+    """
+    (tmp_path / "repos.txt").write_text(f"# springfield\n{tmp_path}/moe\n\n{tmp_path}/moe\nbarney\n")
+    assert load_fleet(str(tmp_path / "repos.txt")) == [f"{tmp_path}/moe", os.path.abspath("barney")]
+
+
+def test_sync_fleet_project_reports_skipped_projects(tmp_path, monkeypatch) -> None:
+    """
+    Test that up to date projects and projects with disabled sync are reported without syncing them.
+    """
+    monkeypatch.setattr(cookietemple.custom_cli.questionary, "prompts_disabled", False)
+    template_version = TemplateSync.sync_load_template_version("cli-python")
+    up_to_date_dir = make_fleet_project(tmp_path, "moe", template_version)
+    disabled_dir = make_fleet_project(tmp_path, "barney", "0.0.1")
+
+    success, message, _ = sync_fleet_project(up_to_date_dir, "homer", "token", False, str(tmp_path))
+    assert success and message == "Up to date"
+    success, message, _ = sync_fleet_project(disabled_dir, "homer", "token", False, str(tmp_path))
+    assert success and message == "Sync disabled or below the sync level"
+    success, message, _ = sync_fleet_project(str(tmp_path / "lenny"), "homer", "token", False, str(tmp_path))
+    assert not success
+
+
+def test_template_project_is_rendered_once(tmp_path, mocker, monkeypatch) -> None:
+    """
+    Test that projects with the same .cookietemple.yml reuse the template project rendered for the first one
+    and that a project with other values renders its own.
+    """
+    monkeypatch.setattr(cookietemple.custom_cli.questionary, "prompts_disabled", False)
+    project = {
+        "domain": "cli",
+        "language": "python",
+        "project_name": "exploding-springfield",
+        "full_name": "Homer Simpson",
+        "email": "homer.simpson@springfield.com",
+        "github_username": "homer",
+        "creator_github_username": "homer",
+        "is_github_repo": False,
+        "is_repo_private": False,
+        "is_github_orga": False,
+        "github_orga": "",
+    }
+    created, error, _ = create_batch_project(project, str(tmp_path / "exploding-springfield"))
+    assert created, error
+    project_dir = tmp_path / "exploding_springfield"
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    render = mocker.spy(TemplateSync, "render_template_project")
+
+    rendered_dirs = []
+    for _ in range(2):
+        syncer = TemplateSync(project_dir, "2.0.1", gh_username="homer", token="token", render_cache_dir=str(cache_dir))
+        syncer.dot_cookietemple = load_yaml_file(str(project_dir / ".cookietemple.yml"))
+        rendered_dirs.append(syncer.load_cached_template_project())
+    assert render.call_count == 1
+    assert rendered_dirs[0] == rendered_dirs[1]
+    assert os.path.isfile(os.path.join(rendered_dirs[0], "pyproject.toml"))
+    assert len(os.listdir(cache_dir)) == 1
+
+    syncer = TemplateSync(project_dir, "2.0.1", gh_username="homer", token="token", render_cache_dir=str(cache_dir))
+    syncer.dot_cookietemple = {
+        **load_yaml_file(str(project_dir / ".cookietemple.yml")),
+        "project_short_description": "Flying Moe.",
+    }
+    assert syncer.load_cached_template_project() != rendered_dirs[0]
+    assert render.call_count == 2
+
+
+@pytest.mark.parametrize("worktree", [False, True])
+def test_failed_sync_restores_original_branch(tmp_path, mocker, monkeypatch, worktree) -> None:
+    """
+    Test that a project, whose sync fails after checking out the TEMPLATE branch, is back on its original branch without changes.
+    """
+    monkeypatch.setattr(cookietemple.custom_cli.questionary, "prompts_disabled", False)
+    project_dir = make_fleet_project(tmp_path, "moe", "0.0.1")
+    with open(os.path.join(project_dir, "cookietemple.cfg"), "w") as f:
+        f.write(COOKIETEMPLE_CFG.replace("False", "True") + "\n[sync_files_blacklisted]\n")
+    repo = git.Repo(project_dir)
+    repo.index.add(["cookietemple.cfg"])
+    author = git.Actor("Homer Simpson", "homer.simpson@springfield.com")
+    repo.index.commit("Enable sync", author=author, committer=author)
+    repo.git.branch("TEMPLATE")
+    mocker.patch.object(TemplateSync, "check_pull_request_exists", return_value=False)
+
+    def make_template_project(syncer) -> None:
+        # leave changes on the TEMPLATE branch before failing
+        with open(os.path.join(syncer.template_dir, "README.rst"), "w") as f:
+            f.write("Moe's Tavern\n")
+        raise ValueError("Springfield exploded")
+
+    mocker.patch.object(TemplateSync, "make_template_project", make_template_project)
+    success, message, _ = sync_fleet_project(project_dir, "homer", "token", worktree, str(tmp_path))
+
+    assert not success and message == "ValueError: Springfield exploded"
+    assert repo.active_branch.name == "master"
+    assert not repo.is_dirty(untracked_files=True)
+    assert [line.split()[0] for line in repo.git.worktree("list").splitlines()] == [project_dir]
@@ -0,0 +1,50 @@
+import git  # type: ignore
+
+from cookietemple.sync.git_operations import GitOperations
+from cookietemple.sync.sync import TemplateSync
+
+
+def test_batch_paths_splits_long_command_lines(tmp_path) -> None:
+    """
+    Test that paths are split into batches, which fit on a single command line, without losing any path.
+    """
+    git_ops = GitOperations(str(tmp_path))
+    git_ops.MAX_PATHS_LENGTH = 100
+    paths = [f"springfield/file_{idx:03}.txt" for idx in range(50)]
+    batches = list(git_ops.batch_paths(paths))
+    assert len(batches) > 1
+    assert all(sum(len(path) + 1 for path in batch) <= 100 for batch in batches)
+    assert [path for batch in batches for path in batch] == paths
+
+
+def test_commit_template_changes_discards_blacklisted_files(tmp_path) -> None:
+    """
+    Test that the changes of all non blacklisted files are committed and the changes of blacklisted files are discarded,
+    once committing returns.
+    """
+    (tmp_path / "README.rst").write_text("Exploding Springfield\n")
+    (tmp_path / "setup.cfg").write_text("[flake8]\n")
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Homer Simpson")
+        config.set_value("user", "email", "homer.simpson@springfield.com")
+    repo.index.add(["README.rst", "setup.cfg"])
+    repo.index.commit("Initial commit")
+    initial_commit = repo.head.commit
+    (tmp_path / "README.rst").write_text("Exploding Springfield\n\nNew template section\n")
+    (tmp_path / "setup.cfg").write_text("[flake8]\nmax-line-length = 120\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "usage.rst").write_text("Usage\n")
+    (tmp_path / "docs" / "new.cfg").write_text("[docs]\n")
+
+    syncer = TemplateSync(tmp_path, "1.0.0", gh_username="homer", token="token")
+    syncer.repo = syncer.template_repo = repo
+    syncer.blacklisted_globs = ["*.cfg"]
+    assert syncer.commit_template_changes()
+
+    assert syncer.made_changes
+    assert repo.head.commit.parents == (initial_commit,)
+    assert sorted(repo.head.commit.stats.files) == ["README.rst", "docs/usage.rst"]
+    assert (tmp_path / "setup.cfg").read_text() == "[flake8]\n"
+    assert not (tmp_path / "docs" / "new.cfg").exists()
+    assert not repo.is_dirty(untracked_files=True)
@@ -0,0 +1,62 @@
+import os
+
+import git  # type: ignore
+import pytest
+
+from cookietemple.sync.sync import TemplateSync
+
+
+def test_sync_in_worktree_leaves_checkout_untouched(tmp_path) -> None:
+    """
+    Test that the TEMPLATE branch is synced in a temporary worktree without touching the project's checkout.
+    """
+    project_dir, rendered_dir = tmp_path / "project", tmp_path / "rendered"
+    project_dir.mkdir()
+    rendered_dir.mkdir()
+    (project_dir / "README.rst").write_text("Exploding Springfield\n")
+    (rendered_dir / "README.rst").write_text("Exploding Springfield\n\nNew template section\n")
+    repo = git.Repo.init(project_dir)
+    repo.index.add(["README.rst"])
+    author = git.Actor("Homer Simpson", "homer.simpson@springfield.com")
+    repo.index.commit("Initial commit", author=author, committer=author)
+    repo.create_head("TEMPLATE")
+    os.utime(project_dir / "README.rst", ns=(0, 0))
+
+    syncer = TemplateSync(project_dir, "1.0.0", gh_username="homer", token="token", worktree=True)
+    syncer.repo = syncer.template_repo = repo
+    syncer.original_branch = repo.active_branch.name
+    syncer.add_template_worktree()
+    worktree_dir = syncer.template_dir
+    assert syncer.template_repo.active_branch.name == "TEMPLATE"
+    syncer.apply_template_delta(str(rendered_dir))
+    assert syncer.template_repo.is_dirty()
+    assert (project_dir / "README.rst").read_text() == "Exploding Springfield\n"
+
+    syncer.reset_target_dir()
+    assert not os.path.exists(worktree_dir)
+    assert repo.active_branch.name == syncer.original_branch
+    assert os.stat(project_dir / "README.rst").st_mtime_ns == 0
+    assert not repo.is_dirty(untracked_files=True)
+
+
+def test_failed_sync_removes_worktree(tmp_path, mocker) -> None:
+    """
+    Test that the TEMPLATE worktree is removed, if the sync exits after adding it, so the next sync can check out TEMPLATE again.
+    """
+    (tmp_path / ".cookietemple.yml").write_text("template_handle: cli-python\ntemplate_version: 0.0.1\n")
+    (tmp_path / "cookietemple.cfg").write_text("[sync_files_blacklisted]\n")
+    repo = git.Repo.init(tmp_path)
+    repo.index.add([".cookietemple.yml", "cookietemple.cfg"])
+    author = git.Actor("Homer Simpson", "homer.simpson@springfield.com")
+    repo.index.commit("Initial commit", author=author, committer=author)
+    repo.create_head("TEMPLATE")
+    mocker.patch.object(TemplateSync, "check_pull_request_exists", return_value=False)
+    mocker.patch.object(TemplateSync, "make_template_project", side_effect=SystemExit(1))
+
+    syncer = TemplateSync(tmp_path, "1.0.0", gh_username="homer", token="token", worktree=True)
+    with pytest.raises(SystemExit):
+        syncer.sync()
+
+    assert [line.split()[0] for line in repo.git.worktree("list").splitlines()] == [str(tmp_path)]
+    assert not os.path.exists(syncer.template_dir)
+    repo.git.worktree("add", str(tmp_path / "worktree"), "TEMPLATE")
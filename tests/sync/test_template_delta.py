@@ -0,0 +1,50 @@
+import os
+
+import git  # type: ignore
+
+from cookietemple.sync.template_delta import TemplateDelta
+
+
+def write(path, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def test_template_delta_only_writes_differences(tmp_path) -> None:
+    """
+    Test that only added, changed and removed files of a rendered template are written to the TEMPLATE branch.
+    """
+    project_dir, rendered_dir = tmp_path / "project", tmp_path / "rendered"
+    for directory in (project_dir, rendered_dir):
+        write(directory / "README.rst", "Exploding Springfield\n")
+        write(directory / "docs" / "index.rst", "Index\n")
+        write(directory / "run.sh", "#!/bin/sh\n")
+    write(project_dir / "old" / "removed.txt", "removed\n")
+    write(project_dir / "setup.py", "version = '0.1.0'\n")
+    write(rendered_dir / "setup.py", "version = '0.2.0'\n")
+    write(rendered_dir / ".github" / "workflows" / "added.yml", "added\n")
+    os.chmod(rendered_dir / "run.sh", 0o755)
+    repo = git.Repo.init(project_dir)
+    repo.index.add(["README.rst", "docs/index.rst", "run.sh", "old/removed.txt", "setup.py"])
+    author = git.Actor("Homer Simpson", "homer.simpson@springfield.com")
+    repo.index.commit("TEMPLATE", author=author, committer=author)
+    os.utime(project_dir / "README.rst", ns=(0, 0))
+
+    delta = TemplateDelta(str(rendered_dir), repo.head.commit.tree)
+    assert delta.added == [".github/workflows/added.yml"]
+    assert delta.changed == ["run.sh", "setup.py"]
+    assert delta.removed == ["old/removed.txt"]
+    delta.apply(str(project_dir))
+
+    assert os.stat(project_dir / "README.rst").st_mtime_ns == 0
+    assert not (project_dir / "old").exists()
+    assert (project_dir / "setup.py").read_text() == "version = '0.2.0'\n"
+    repo.git.add(A=True)
+    assert sorted(item.a_path for item in repo.index.diff("HEAD")) == [
+        ".github/workflows/added.yml",
+        "old/removed.txt",
+        "run.sh",
+        "setup.py",
+    ]
+    assert TemplateDelta(str(rendered_dir), repo.index.write_tree()).is_empty()
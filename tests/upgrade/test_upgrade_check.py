@@ -0,0 +1,44 @@
+import json
+import time
+
+from cookietemple.upgrade.upgrade import UpgradeCommand
+
+
+def test_startup_check_is_cached_and_can_be_disabled(tmp_path, mocker, monkeypatch) -> None:
+    """
+    Test that PyPI is asked once in the background, the result is reused until it expires and the check can be disabled.
+    """
+    cache_path = tmp_path / ".latest_version.json"
+    monkeypatch.setattr(UpgradeCommand, "LATEST_VERSION_CACHE_PATH", str(cache_path))
+    monkeypatch.delenv(UpgradeCommand.DISABLE_CHECK_ENV_VAR, raising=False)
+
+    cached_before_fetch = []
+
+    def fetch_latest_version():
+        cached_before_fetch.append(cache_path.read_text() if cache_path.exists() else None)
+        return "99.0.0"
+
+    fetch = mocker.patch.object(UpgradeCommand, "fetch_latest_version", side_effect=fetch_latest_version)
+
+    thread = UpgradeCommand.start_startup_check()
+    assert thread is not None
+    thread.join()
+    assert json.loads(cache_path.read_text())["latest_version"] == "99.0.0"
+    # nothing is cached before PyPI answered, so an interrupted check is repeated by the next invocation
+    assert cached_before_fetch == [None]
+
+    # a fresh result is reported without asking PyPI again
+    assert UpgradeCommand.start_startup_check() is None
+    assert fetch.call_count == 1
+
+    # an expired result is refreshed
+    cache_path.write_text(json.dumps({"checked_at": time.time() - UpgradeCommand.LATEST_VERSION_CACHE_TTL - 1}))
+    thread = UpgradeCommand.start_startup_check()
+    assert thread is not None
+    thread.join()
+    assert fetch.call_count == 2
+
+    cache_path.unlink()
+    monkeypatch.setenv(UpgradeCommand.DISABLE_CHECK_ENV_VAR, "1")
+    assert UpgradeCommand.start_startup_check() is None
+    assert fetch.call_count == 2